@@ -1,4 +1,4 @@
-import os, shutil
+import os, shutil, subprocess, sys
 
 version = '1.7'
 
@@ -63,7 +63,11 @@ copy2('test.py', moddir2)
 
 copy3('crcmod.py', moddir3)
 copy3('_crcfunpy.py', moddir3)
+copy3('_crcfunnp.py', moddir3)
 copy3('predefined.py', moddir3)
+copy3('aio.py', moddir3)
+copy3('_tuning.py', moddir3)
+copy3('bench.py', moddir3)
 copy3('test.py', moddir3)
 
 #-----------------------------------------------------------------------------
@@ -87,9 +91,17 @@ shutil.copyfile(init_file, os.path.join(moddir3,'__init__.py'))
 shutil.copyfile('python2/extmod/_crcfunext.c',
         os.path.join(srcdir2,'_crcfunext.c'))
 
+# The static tables of the predefined algorithms are regenerated so that they
+# match predefined.py.
+subprocess.check_call([sys.executable,
+        'python3/extmod/mkPredefinedTables.py'])
+
 shutil.copyfile('python3/extmod/_crcfunext.c',
         os.path.join(srcdir3,'_crcfunext.c'))
 
+shutil.copyfile('python3/extmod/_crcpredefined.h',
+        os.path.join(srcdir3,'_crcpredefined.h'))
+
 #-----------------------------------------------------------------------------
 shutil.copytree('test', os.path.join(crcdir, 'test'))
 
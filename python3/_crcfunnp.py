@@ -0,0 +1,195 @@
+#-----------------------------------------------------------------------------
+# Low level CRC functions for use by crcmod.  This version uses NumPy, and is
+# selected when the extension module is not available but NumPy is.  Large
+# buffers are split into many lanes whose CRCs are computed side by side, one
+# byte of each lane per NumPy operation, and then combined.  Small buffers are
+# handled by the Python implementation.
+#
+# Copyright (c) 2010  Raymond L. Buvel
+# Copyright (c) 2010  Craig McQueen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#-----------------------------------------------------------------------------
+
+import threading
+
+import numpy as np
+
+from crcmod._crcfunpy import _setGilThreshold, _get_buffer_view
+from crcmod._crcfunpy import _multiUpdate, _rollingScan
+import crcmod._crcfunpy as _crcfunpy
+
+# Buffers shorter than this are handled by the Python implementation, which
+# is faster for them than setting up the lanes.
+_numpyThreshold = 1 << 12
+
+# A buffer is processed in pieces whose sizes are powers of two, each split
+# into at most 2**_maxLanesLog lanes of at least 2**_minLaneLog bytes.
+_maxLanesLog = 14
+_minLaneLog = 4
+
+# Number of bytes of each lane transposed at a time, so that the bytes
+# processed by one NumPy operation are contiguous.
+_blockSize = 64
+
+# Held while the shift tables of a CrcFun are built, since a CrcFun may be
+# used by several threads at once.
+_shiftLock = threading.Lock()
+
+_byteMask = np.uint64(0xFF)
+_eight = np.uint64(8)
+
+#-----------------------------------------------------------------------------
+# The lanes after the first are started from a zero register, so each of them
+# contributes its CRC shifted over the bytes of the lanes after it.  Shifting
+# a register over zero bytes is linear, so it is a matrix over GF(2), and the
+# matrices for the shifts by 2**j bytes are found by repeated squaring of the
+# matrix for a single byte, which the CRC table provides.  Column i of a
+# matrix is the image of a register with only bit i set.  For applying a
+# shift to many registers, the matrix is converted to tables indexed by each
+# byte of the register, like the CRC table.
+
+def _toMatrix(images, n):
+    bits = np.arange(n, dtype=np.uint64)[:, None]
+    return ((images[None, :] >> bits) & np.uint64(1)).astype(np.int64)
+
+def _fromMatrix(matrix, n):
+    bits = np.arange(n, dtype=np.uint64)[:, None]
+    return np.bitwise_or.reduce(matrix.astype(np.uint64) << bits, axis=0)
+
+def _shiftTables(images, n):
+    tables = np.zeros((n//8, 256), dtype=np.uint64)
+    for k in range(n//8):
+        for b in range(8):
+            tables[k, 1<<b:2<<b] = tables[k, :1<<b] ^ images[8*k + b]
+    return tables
+
+
+class CrcFun(_crcfunpy.CrcFun):
+    '''Compute a CRC: crcfun(data, crc=initCrc)
+
+    This is the NumPy version of the CrcFun type of the extension module.
+    The parameters are the same as those of the Python version.
+    '''
+    engine = 'numpy'
+
+    def __init__(self, width, rev, table, initCrc, xorOut, consts=None, crc32c=False):
+        super().__init__(width, rev, table, initCrc, xorOut, consts, crc32c)
+        self._npTable = np.array(table, dtype=np.uint64)
+        self._mask = np.uint64((1 << width) - 1)
+        self._shift = np.uint64(width - 8)
+        # Matrices and tables shifting a register over 2**j zero bytes,
+        # built when first needed.
+        self._matrices = []
+        self._shiftTableCache = {}
+
+    def __call__(self, data, crc=None):
+        if crc is None:
+            crc = self.initCrc
+        xorOut = self.xorOut
+        mv = _get_buffer_view(data)
+        if mv.nbytes < _numpyThreshold:
+            return xorOut ^ self._crc(mv, xorOut ^ crc)
+        return xorOut ^ self._update(mv, xorOut ^ crc)
+
+    def many(self, buffers, crc=None):
+        return [self(data, crc) for data in buffers]
+
+    def _update(self, mv, reg):
+        if not mv.c_contiguous:
+            mv = memoryview(mv.tobytes())
+        data = np.frombuffer(mv.cast('B'), dtype=np.uint8)
+        reg = reg & ((1 << self.width) - 1)
+        pos = 0
+        size = len(data)
+        while size - pos >= _numpyThreshold:
+            sizeLog = (size - pos).bit_length() - 1
+            lanesLog = min(_maxLanesLog, sizeLog - _minLaneLog)
+            end = pos + (1 << sizeLog)
+            reg = self._lanes(data[pos:end], reg, lanesLog, sizeLog - lanesLog)
+            pos = end
+        if pos < size:
+            reg = self._crc(data[pos:], reg)
+        return reg
+
+    def _lanes(self, data, reg, lanesLog, laneLog):
+        lanes = data.reshape(1 << lanesLog, 1 << laneLog)
+        regs = np.zeros(1 << lanesLog, dtype=np.uint64)
+        regs[0] = reg
+        table = self._npTable
+        for j in range(0, 1 << laneLog, _blockSize):
+            block = np.ascontiguousarray(lanes[:, j:j+_blockSize].T)
+            if self.reverse:
+                for column in block:
+                    index = regs ^ column
+                    index &= _byteMask
+                    regs >>= _eight
+                    regs ^= table.take(index)
+            else:
+                mask = self._mask
+                shift = self._shift
+                for column in block:
+                    index = regs >> shift
+                    index ^= column
+                    index &= _byteMask
+                    regs <<= _eight
+                    regs &= mask
+                    regs ^= table.take(index)
+
+        # Combine neighbouring lanes until one is left.
+        level = laneLog
+        while len(regs) > 1:
+            regs = self._applyShift(regs[0::2], level) ^ regs[1::2]
+            level += 1
+        return int(regs[0])
+
+    def _applyShift(self, regs, level):
+        tables = self._shiftTablesFor(level)
+        result = tables[0].take(regs & _byteMask)
+        for k in range(1, len(tables)):
+            result ^= tables[k].take((regs >> np.uint64(8*k)) & _byteMask)
+        return result
+
+    # The tables are built under _shiftLock, and the dict holding them is
+    # replaced rather than changed, so that other threads only see complete
+    # tables.
+    def _shiftTablesFor(self, level):
+        tables = self._shiftTableCache.get(level)
+        if tables is None:
+            with _shiftLock:
+                tables = self._shiftTableCache.get(level)
+                if tables is None:
+                    tables = self._buildShiftTables(level)
+                    allTables = dict(self._shiftTableCache)
+                    allTables[level] = tables
+                    self._shiftTableCache = allTables
+        return tables
+
+    def _buildShiftTables(self, level):
+        n = self.width
+        matrices = self._matrices
+        if not matrices:
+            # One zero byte, applied to each single bit register.
+            images = [self._fun(b'\0', 1 << i, self._table)
+                      for i in range(n)]
+            matrices.append(_toMatrix(np.array(images, dtype=np.uint64), n))
+        while len(matrices) <= level:
+            m = matrices[-1]
+            matrices.append((m @ m) & 1)
+        return _shiftTables(_fromMatrix(matrices[level], n), n)
@@ -26,6 +26,30 @@
 # SOFTWARE.
 #-----------------------------------------------------------------------------
 
+import array
+import struct
+import sys
+
+# The consts parameter of these functions holds the constants for the
+# carry-less multiply folding engine of the extension module.  It is accepted
+# for compatibility and ignored.
+
+# The extension module releases the GIL for buffers of at least this many
+# bytes.  The Python implementation cannot release the GIL, but keeps track of
+# the setting so that both modules have the same interface.
+
+_gilThreshold = 2048
+
+def _setGilThreshold(threshold):
+    global _gilThreshold
+    threshold = int(threshold)
+    if threshold < 0:
+        raise ValueError('threshold must not be negative')
+    previous = _gilThreshold
+    _gilThreshold = threshold
+    return previous
+
+
 def _get_buffer_view(in_obj):
     if isinstance(in_obj, str):
         raise TypeError('Unicode-objects must be encoded before calculating a CRC')
@@ -34,74 +58,291 @@ def _get_buffer_view(in_obj):
         raise BufferError('Buffer must be single dimension')
     return mv
 
+# The bytes to iterate over.  Iterating over bytes or a bytearray is faster
+# than over a memoryview, so other objects are copied to bytes.
+def _bytesOf(data):
+    if type(data) is bytes or type(data) is bytearray:
+        return data
+    return _get_buffer_view(data).tobytes()
+
 
-def _crc8(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc8(data, crc, table, consts=None):
     crc = crc & 0xFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ crc]
     return crc
 
-def _crc8r(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc8r(data, crc, table, consts=None):
     crc = crc & 0xFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ crc]
     return crc
 
-def _crc16(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc16(data, crc, table, consts=None):
     crc = crc & 0xFFFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ ((crc>>8) & 0xFF)] ^ ((crc << 8) & 0xFF00)
     return crc
 
-def _crc16r(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc16r(data, crc, table, consts=None):
     crc = crc & 0xFFFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ (crc & 0xFF)] ^ (crc >> 8)
     return crc
 
-def _crc24(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc24(data, crc, table, consts=None):
     crc = crc & 0xFFFFFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ (crc>>16 & 0xFF)] ^ ((crc << 8) & 0xFFFF00)
     return crc
 
-def _crc24r(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc24r(data, crc, table, consts=None):
     crc = crc & 0xFFFFFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ (crc & 0xFF)] ^ (crc >> 8)
     return crc
 
-def _crc32(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc32(data, crc, table, consts=None):
     crc = crc & 0xFFFFFFFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ ((crc>>24) & 0xFF)] ^ ((crc << 8) & 0xFFFFFF00)
     return crc
 
-def _crc32r(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc32r(data, crc, table, consts=None):
     crc = crc & 0xFFFFFFFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ (crc & 0xFF)] ^ (crc >> 8)
     return crc
 
-def _crc64(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc64(data, crc, table, consts=None):
     crc = crc & 0xFFFFFFFFFFFFFFFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ ((crc>>56) & 0xFF)] ^ ((crc << 8) & 0xFFFFFFFFFFFFFF00)
     return crc
 
-def _crc64r(data, crc, table):
-    mv = _get_buffer_view(data)
+def _crc64r(data, crc, table, consts=None):
     crc = crc & 0xFFFFFFFFFFFFFFFF
-    for x in mv.tobytes():
+    for x in _bytesOf(data):
         crc = table[x ^ (crc & 0xFF)] ^ (crc >> 8)
     return crc
 
+#-----------------------------------------------------------------------------
+# Slicing-by-4 and slicing-by-8 kernels.  Each iteration reads a word with
+# struct.iter_unpack, which does not copy the bytes of each word, XORs the
+# shift register into it and looks up each of its bytes in the table for the
+# number of bytes that follow it in the word, so that tables[k] holds the CRC
+# of each byte value followed by k zero bytes.  The remaining bytes are
+# processed one at a time with tables[0].
+#
+# These need fewer operations per byte than the functions above, which
+# should pay off under a JIT compiler such as PyPy.  On CPython, which spends
+# most of its time dispatching the operations of the loop, they are faster
+# for some widths and slower for others (16-bit CRCs).  They are not used by
+# default until test/bench_python.py shows a gain on the interpreter; set
+# _wordSize to use them.
+#
+# Slicing-by-4 requires the register to fit in a word, so it is only used for
+# CRCs of up to 32 bits.
+
+def _words4r(data, crc, tables, width):
+    (t0, t1, t2, t3) = tables[:4]
+    end = len(data) & ~3
+    for (w,) in struct.iter_unpack('<I', memoryview(data)[:end]):
+        w ^= crc
+        crc = (t3[w & 0xFF] ^ t2[(w >> 8) & 0xFF] ^ t1[(w >> 16) & 0xFF] ^
+               t0[w >> 24])
+    for i in range(end, len(data)):
+        crc = t0[(crc ^ data[i]) & 0xFF] ^ (crc >> 8)
+    return crc
+
+def _words4(data, crc, tables, width):
+    (t0, t1, t2, t3) = tables[:4]
+    align = 32 - width
+    end = len(data) & ~3
+    for (w,) in struct.iter_unpack('>I', memoryview(data)[:end]):
+        w ^= crc << align
+        crc = (t3[w >> 24] ^ t2[(w >> 16) & 0xFF] ^ t1[(w >> 8) & 0xFF] ^
+               t0[w & 0xFF])
+    return _wordsTail(data, end, crc, t0, width)
+
+def _words8r(data, crc, tables, width):
+    (t0, t1, t2, t3, t4, t5, t6, t7) = tables
+    end = len(data) & ~7
+    for (w,) in struct.iter_unpack('<Q', memoryview(data)[:end]):
+        w ^= crc
+        crc = (t7[w & 0xFF] ^ t6[(w >> 8) & 0xFF] ^ t5[(w >> 16) & 0xFF] ^
+               t4[(w >> 24) & 0xFF] ^ t3[(w >> 32) & 0xFF] ^
+               t2[(w >> 40) & 0xFF] ^ t1[(w >> 48) & 0xFF] ^ t0[w >> 56])
+    for i in range(end, len(data)):
+        crc = t0[(crc ^ data[i]) & 0xFF] ^ (crc >> 8)
+    return crc
+
+def _words8(data, crc, tables, width):
+    (t0, t1, t2, t3, t4, t5, t6, t7) = tables
+    align = 64 - width
+    end = len(data) & ~7
+    for (w,) in struct.iter_unpack('>Q', memoryview(data)[:end]):
+        w ^= crc << align
+        crc = (t7[w >> 56] ^ t6[(w >> 48) & 0xFF] ^ t5[(w >> 40) & 0xFF] ^
+               t4[(w >> 32) & 0xFF] ^ t3[(w >> 24) & 0xFF] ^
+               t2[(w >> 16) & 0xFF] ^ t1[(w >> 8) & 0xFF] ^ t0[w & 0xFF])
+    return _wordsTail(data, end, crc, t0, width)
+
+def _wordsTail(data, start, crc, table, width):
+    mask = (1 << width) - 1
+    shift = width - 8
+    for i in range(start, len(data)):
+        crc = table[((crc >> shift) ^ data[i]) & 0xFF] ^ ((crc << 8) & mask)
+    return crc
+
+def _sliceTables(table, width, rev, slices):
+    mask = (1 << width) - 1
+    shift = width - 8
+    tables = [table]
+    for k in range(1, slices):
+        if rev:
+            tables.append([(x >> 8) ^ table[x & 0xFF] for x in tables[-1]])
+        else:
+            tables.append([((x << 8) & mask) ^ table[x >> shift]
+                           for x in tables[-1]])
+    return tables
+
+# Number of bytes read per iteration by CrcFun: 4 or 8 for the word kernels,
+# or 0 for the functions processing one byte at a time.
+_wordSize = 0
+
+# Buffers shorter than this are processed one byte at a time.
+_wordThreshold = 16
+
+# CRC-32C is computed by the extension module with the crc32 instruction when
+# the processor supports it.  Here it is the same as any other bit reversed
+# 32-bit CRC.
+_crc32c = _crc32r
+
+
+class CrcFun:
+    '''Compute a CRC: crcfun(data, crc=initCrc)
+
+    This is the Python version of the CrcFun type of the extension module.
+    The parameters are the same, except that the table is a list holding the
+    256 entry CRC table.  The consts and crc32c parameters are ignored.
+    '''
+    engine = 'python'
+    wordSize = 0
+
+    def __init__(self, width, rev, table, initCrc, xorOut, consts=None, crc32c=False):
+        if rev:
+            self._fun = globals()['_crc%dr' % width]
+        else:
+            self._fun = globals()['_crc%d' % width]
+        mask = (1 << width) - 1
+        self._table = table
+        self.width = width
+        self.reverse = bool(rev)
+        self.initCrc = initCrc & mask
+        self.xorOut = xorOut & mask
+
+        wordSize = _wordSize
+        if wordSize == 4 and width > 32:
+            wordSize = 8
+        if wordSize:
+            self.wordSize = wordSize
+            self._words = globals()['_words%d%s' % (wordSize, 'r'*bool(rev))]
+            self._tables = _sliceTables(table, width, rev, wordSize)
+
+    def _crc(self, data, crc):
+        if self.wordSize:
+            data = _bytesOf(data)
+            if len(data) >= _wordThreshold:
+                return self._words(data, crc & ((1 << self.width) - 1),
+                                   self._tables, self.width)
+        return self._fun(data, crc, self._table)
+
+    def __call__(self, data, crc=None):
+        if crc is None:
+            crc = self.initCrc
+        xorOut = self.xorOut
+        return xorOut ^ self._crc(data, xorOut ^ crc)
+
+    def many(self, buffers, crc=None):
+        if crc is None:
+            crc = self.initCrc
+        xorOut = self.xorOut
+        crc ^= xorOut
+        return [xorOut ^ self._crc(data, crc) for data in buffers]
+
+    def records(self, data, stride, length, offset=0, out=None, crc=None):
+        if stride <= 0 or length < 0 or offset < 0:
+            raise ValueError('stride must be positive, and length and offset '
+                             'non-negative')
+        data = memoryview(data).cast('B')
+        if len(data) >= offset + length:
+            n = (len(data) - offset - length)//stride + 1
+        else:
+            n = 0
+        typeCode = _recordTypeCode[self.width]
+        if out is None:
+            out = array.array(typeCode, bytes(n*struct.calcsize(typeCode)))
+        view = memoryview(out)
+        if view.readonly:
+            raise BufferError('out must be writable')
+        if not view.c_contiguous:
+            raise BufferError('out must be contiguous')
+        if (view.itemsize != struct.calcsize(typeCode) or
+                not _isUnsignedFormat(view.format)):
+            raise ValueError('out must hold unsigned integers of %d bytes' %
+                             struct.calcsize(typeCode))
+        view = view.cast('B').cast(typeCode)
+        if len(view) < n:
+            raise ValueError('out is too small for %d records' % n)
+        crcs = self.many([data[i:i+length] for i in
+                          range(offset, offset + n*stride, stride)], crc)
+        view[:n] = array.array(typeCode, crcs)
+        return out
+
+# Item type of the output buffer of CrcFun.records for each CRC width.
+_recordTypeCode = {8:'B', 16:'H', 24:'I', 32:'I', 64:'Q'}
+
+# The output buffer must hold native unsigned integers.
+def _isUnsignedFormat(format):
+    if format[:1] in ('@', '=', '<' if sys.byteorder == 'little' else '>'):
+        format = format[1:]
+    return len(format) == 1 and format in 'BHILQN'
+
+
+# Update several CRCs with the same data.  The extension module makes a single
+# pass over the data.
+def _multiUpdate(funs, data, crcs):
+    funs = list(funs)
+    crcs = list(crcs)
+    if len(funs) != len(crcs):
+        raise ValueError('funs and crcs must have the same length')
+    return [fun(data, crc) for (fun, crc) in zip(funs, crcs)]
+
+
+def _rollingScan(table, outTable, width, rev, reg, history, data, xorValue,
+                 mask, match):
+    table = struct.unpack('256Q', table)
+    outTable = struct.unpack('256Q', outTable)
+    data = _get_buffer_view(data).cast('B')
+    window = len(history)
+    regMask = (1<<width) - 1
+    shift = width - 8
+    if mask is not None:
+        check = (match ^ xorValue) & mask
+        offsets = []
+    else:
+        offsets = None
+    for i in range(len(data)):
+        if i < window:
+            out = history[i]
+        else:
+            out = data[i - window]
+        if rev:
+            reg = (reg >> 8) ^ table[(reg ^ data[i]) & 0xFF] ^ outTable[out]
+        else:
+            reg = (((reg << 8) & regMask) ^
+                   table[((reg >> shift) ^ data[i]) & 0xFF] ^ outTable[out])
+        if offsets is not None and reg & mask == check:
+            offsets.append(i + 1)
+    return reg, offsets
@@ -0,0 +1,274 @@
+#-----------------------------------------------------------------------------
+# Measure the CRC kernels on this machine, choose the buffer sizes at which
+# crcmod switches between them, and save the choice in a small JSON file that
+# is loaded along with the low level CRC functions.  This is the
+# implementation of crcmod.tune.
+#
+# The extension module switches from the byte-wise table to slicing-by-8, to
+# slicing-by-16 and to the carry-less multiply folding engine as buffers get
+# larger.  The NumPy implementation switches from the Python implementation
+# to its lanes.  The best sizes depend on the processor, so the file holds
+# one entry per kind of machine and can be shared by a fleet of them.
+#
+# Copyright (c) 2010  Raymond L. Buvel
+# Copyright (c) 2010  Craig McQueen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#-----------------------------------------------------------------------------
+
+import json
+import os
+import platform
+import sys
+import timeit
+
+_crcmodule = sys.modules['crcmod.crcmod']
+
+_fileVersion = 1
+
+# A polynomial of each width, used for the measurements.
+_polys = {
+    8: 0x107,
+    16: 0x18005,
+    24: 0x1864CFB,
+    32: 0x104C11DB7,
+    64: 0x1000000000000001B,
+}
+
+# Buffer sizes measured by default.
+_sizes = [8, 16, 24, 32, 48, 64, 96, 128, 192, 256, 384, 512, 768, 1024,
+          1536, 2048, 4096, 8192]
+
+_numpySizes = [256, 512, 1024, 2048, 4096, 8192, 16384, 32768]
+
+# Bytes processed per measurement, and the number of measurements of which
+# the fastest is kept.
+_sampleBytes = 1 << 18
+_repeat = 5
+
+# The folding engine is not used for fewer bytes than this, whatever its
+# threshold (FOLD_BLOCK_MIN in the extension module).
+_foldBlockMin = 64
+
+# Threshold of a kernel that is never used.
+_never = sys.maxsize
+
+#-----------------------------------------------------------------------------
+# The entry of the file for this machine.  Machines with the same architecture
+# and processor model share an entry.
+
+def _hostKey():
+    model = ''
+    try:
+        with open('/proc/cpuinfo') as f:
+            for line in f:
+                if line.startswith('model name'):
+                    model = line.partition(':')[2].strip()
+                    break
+    except OSError:
+        pass
+    if not model:
+        model = platform.processor()
+    return '%s %s' % (platform.machine(), model)
+
+def _readFile(path):
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {'version': _fileVersion, 'hosts': {}}
+    if (not isinstance(data, dict) or data.get('version') != _fileVersion or
+            not isinstance(data.get('hosts'), dict)):
+        return {'version': _fileVersion, 'hosts': {}}
+    return data
+
+def _writeFile(path, data):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp = '%s.%d.tmp' % (path, os.getpid())
+    with open(tmp, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp, path)
+
+#-----------------------------------------------------------------------------
+# Apply the thresholds of an entry to the module holding the low level CRC
+# functions.  Widths are stored as strings since they are JSON keys, and a
+# kernel that is never used has a threshold of None.  The file may be shared
+# by many machines, so thresholds that are not sizes the module can use are
+# skipped and the defaults are kept for them.
+
+def _isThreshold(value, minimum=0):
+    return (isinstance(value, int) and not isinstance(value, bool) and
+            minimum <= value <= _never)
+
+def _applyThresholds(module, entry):
+    if hasattr(module, '_setThresholds'):
+        extension = entry.get('extension', {})
+        if not isinstance(extension, dict):
+            extension = {}
+        names = ('slice8', 'slice16', 'fold')
+        for (width, thresholds) in extension.items():
+            if (not width.isdigit() or int(width) not in _polys or
+                    not isinstance(thresholds, dict) or
+                    not all(name in thresholds for name in names)):
+                continue
+            args = [_never if thresholds[name] is None else thresholds[name]
+                    for name in names]
+            if all(_isThreshold(value) for value in args):
+                module._setThresholds(int(width), *args)
+    if hasattr(module, '_numpyThreshold') and 'numpy' in entry:
+        # The lanes hold at least 2**_minLaneLog bytes.
+        if _isThreshold(entry['numpy'], 1 << module._minLaneLog):
+            module._numpyThreshold = entry['numpy']
+
+def loadThresholds(module, path):
+    '''Apply the thresholds saved for this machine in the file path, if any.
+    Errors are ignored since the defaults work everywhere.
+    '''
+    entry = _readFile(path)['hosts'].get(_hostKey())
+    if not isinstance(entry, dict):
+        return False
+    try:
+        _applyThresholds(module, entry)
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return False
+    return True
+
+#-----------------------------------------------------------------------------
+# Time a CRC function on buffers of a given size, in seconds per buffer.
+
+def _timeCall(crcfun, size):
+    data = bytes((i*151 + 17) & 0xFF for i in range(size))
+    count = max(1, _sampleBytes//size)
+    if hasattr(crcfun, 'many'):
+        buffers = [data]*count
+        timer = lambda: crcfun.many(buffers)
+    else:
+        timer = lambda: [crcfun(data) for i in range(count)]
+    return min(timeit.repeat(timer, number=1, repeat=_repeat))/count
+
+# The smallest size from which the fast kernel is at least as fast as the
+# slow one for every larger size measured, or None if there is none.  The
+# sizes are in ascending order.
+
+def _crossover(sizes, slow, fast):
+    threshold = None
+    for (size, a, b) in reversed(list(zip(sizes, slow, fast))):
+        if b > a:
+            break
+        threshold = size
+    return threshold
+
+def _tuneExtension(module, sizes):
+    results = {}
+    useClmul = bool(getattr(module, '_hasClmul', 0))
+    for (width, poly) in sorted(_polys.items()):
+        if useClmul:
+            crcfun = _crcmodule.mkCrcFun(poly, backend='clmul')
+        else:
+            crcfun = _crcmodule.mkCrcFun(poly, backend='slicing')
+        previous = module._setThresholds(width)
+        times = {'table': [], 'slice8': [], 'slice16': [], 'fold': []}
+        try:
+            for size in sizes:
+                module._setThresholds(width, _never, _never, _never)
+                times['table'].append(_timeCall(crcfun, size))
+                module._setThresholds(width, 0, _never, _never)
+                times['slice8'].append(_timeCall(crcfun, size))
+                module._setThresholds(width, 0, 0, _never)
+                times['slice16'].append(_timeCall(crcfun, size))
+                if useClmul and size >= _foldBlockMin:
+                    module._setThresholds(width, 0, 0, 0)
+                    times['fold'].append(_timeCall(crcfun, size))
+        finally:
+            module._setThresholds(width, *previous)
+
+        slicing = [min(a, b) for (a, b) in zip(times['slice8'],
+                                                times['slice16'])]
+        fold = None
+        if useClmul:
+            foldSizes = [size for size in sizes if size >= _foldBlockMin]
+            foldSlicing = [t for (size, t) in zip(sizes, slicing)
+                           if size >= _foldBlockMin]
+            fold = _crossover(foldSizes, foldSlicing, times['fold'])
+        results[str(width)] = {
+            'slice8': _crossover(sizes, times['table'], times['slice8']),
+            'slice16': _crossover(sizes, times['slice8'], times['slice16']),
+            'fold': fold,
+        }
+    return results
+
+def _tuneNumpy(module, sizes):
+    # The lanes hold at least 2**_minLaneLog bytes.
+    sizes = [size for size in sizes if size >= 1 << module._minLaneLog]
+    crcfun = _crcmodule.mkCrcFun(_polys[32], backend='numpy')
+    previous = module._numpyThreshold
+    python = []
+    lanes = []
+    try:
+        for size in sizes:
+            module._numpyThreshold = size + 1
+            python.append(_timeCall(crcfun, size))
+            module._numpyThreshold = size
+            lanes.append(_timeCall(crcfun, size))
+    finally:
+        module._numpyThreshold = previous
+    threshold = _crossover(sizes, python, lanes)
+    if threshold is None:
+        threshold = _never
+    return threshold
+
+#-----------------------------------------------------------------------------
+def tune(sizes=None, save=True, path=None):
+    '''Measure the kernels of the module computing CRCs on a sweep of buffer
+    sizes, apply the thresholds chosen, and save them in the file path unless
+    save is False.  Return the thresholds, as stored in the file.
+
+    sizes -- the buffer sizes measured, in any order, or None for the default
+    sweep of the module
+    path -- the file to save them in, or None for the default file
+    '''
+    if sizes is not None:
+        sizes = sorted(set(sizes))
+        if not sizes or sizes[0] <= 0:
+            raise ValueError('sizes must hold positive buffer sizes')
+    if not _crcmodule._backendLoaded:
+        _crcmodule._loadBackend()
+    module = _crcmodule._crcfun
+    if path is None:
+        path = _crcmodule._tuneFile()
+
+    entry = {}
+    if hasattr(module, '_setThresholds'):
+        entry['extension'] = _tuneExtension(module, sizes or _sizes)
+    if hasattr(module, '_numpyThreshold'):
+        entry['numpy'] = _tuneNumpy(module, sizes or _numpySizes)
+    _applyThresholds(module, entry)
+
+    if save:
+        # Keep the thresholds of the other modules, tuned by processes using
+        # them.
+        data = _readFile(path)
+        saved = data['hosts'].get(_hostKey())
+        if not isinstance(saved, dict):
+            saved = data['hosts'][_hostKey()] = {}
+        saved.update(entry)
+        _writeFile(path, data)
+    return entry
@@ -0,0 +1,190 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2010  Raymond L. Buvel
+# Copyright (c) 2010  Craig McQueen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#-----------------------------------------------------------------------------
+'''
+crcmod.aio computes CRCs of the data flowing through asyncio streams.
+
+It is a separate module so that importing crcmod does not import asyncio.
+
+To use it, e.g.:
+    import crcmod.aio
+    import crcmod.predefined
+
+    reader, writer = await asyncio.open_connection(host, port)
+    reader = crcmod.aio.CrcStreamReader(reader, crcmod.predefined.Crc('crc-32'))
+    payload = await reader.readexactly(size)
+    if reader.crcValue != expected: ...
+
+The following are the public components of this module.
+
+CrcStreamReader, CrcStreamWriter -- wrappers of asyncio.StreamReader and
+asyncio.StreamWriter that update a Crc instance with the data read or written.
+
+updateAsync -- update a Crc instance without blocking the event loop, by
+running the CRC of large buffers in an executor.
+'''
+
+import asyncio
+
+__all__ = [
+    'CrcStreamReader',
+    'CrcStreamWriter',
+    'updateAsync',
+]
+
+# Buffers of at least this many bytes are processed in an executor by
+# updateAsync.  The extension module releases the GIL while computing the CRC,
+# so the event loop keeps running in the meantime.
+_executorThreshold = 1 << 20
+
+
+async def updateAsync(crc, data, executor=None):
+    '''Update the Crc instance crc with data and return the new CRC value.
+
+    Buffers of at least 1 MiB are processed by executor (the default executor
+    of the event loop if None) so that the event loop is not blocked.  Smaller
+    buffers are processed immediately since handing them over would cost more
+    than the CRC itself.
+    '''
+    if memoryview(data).nbytes < _executorThreshold:
+        crc.update(data)
+    else:
+        loop = asyncio.get_running_loop()
+        crc.crcValue = await loop.run_in_executor(executor, crc._crc, data,
+                                                  crc.crcValue)
+    return crc.crcValue
+
+
+class _CrcStream:
+    # Common part of CrcStreamReader and CrcStreamWriter.
+
+    def __init__(self, stream, crc):
+        self.stream = stream
+        self.crc = crc
+
+    @property
+    def crcValue(self):
+        return self.crc.crcValue
+
+    def digest(self):
+        return self.crc.digest()
+
+    def hexdigest(self):
+        return self.crc.hexdigest()
+
+
+class CrcStreamReader(_CrcStream):
+    '''Wrap an asyncio.StreamReader, and compute the CRC of all the data read
+    through the wrapper.
+
+    stream -- the asyncio.StreamReader to read from
+    crc -- the Crc instance to update
+    executor -- executor used by updateAsync for large reads
+
+    The read methods are those of asyncio.StreamReader.  The current CRC is
+    available from the crcValue attribute and the digest and hexdigest
+    methods.
+    '''
+
+    def __init__(self, stream, crc, executor=None):
+        super().__init__(stream, crc)
+        self.executor = executor
+
+    async def _update(self, data):
+        if data:
+            await updateAsync(self.crc, data, self.executor)
+        return data
+
+    async def read(self, n=-1):
+        return await self._update(await self.stream.read(n))
+
+    async def readexactly(self, n):
+        return await self._update(await self.stream.readexactly(n))
+
+    async def readline(self):
+        return await self._update(await self.stream.readline())
+
+    async def readuntil(self, separator=b'\n'):
+        return await self._update(await self.stream.readuntil(separator))
+
+    def at_eof(self):
+        return self.stream.at_eof()
+
+    def exception(self):
+        return self.stream.exception()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        line = await self.readline()
+        if line == b'':
+            raise StopAsyncIteration
+        return line
+
+
+class CrcStreamWriter(_CrcStream):
+    '''Wrap an asyncio.StreamWriter, and compute the CRC of all the data
+    written through the wrapper.
+
+    stream -- the asyncio.StreamWriter to write to
+    crc -- the Crc instance to update
+
+    The methods are those of asyncio.StreamWriter.  The CRC is updated by
+    write, which cannot wait, so very large buffers should be checksummed with
+    updateAsync and written to the stream directly.  The current CRC is
+    available from the crcValue attribute and the digest and hexdigest
+    methods.
+    '''
+
+    def write(self, data):
+        self.stream.write(data)
+        self.crc.update(data)
+
+    def writelines(self, data):
+        for line in data:
+            self.write(line)
+
+    @property
+    def transport(self):
+        return self.stream.transport
+
+    def can_write_eof(self):
+        return self.stream.can_write_eof()
+
+    def write_eof(self):
+        return self.stream.write_eof()
+
+    def get_extra_info(self, name, default=None):
+        return self.stream.get_extra_info(name, default)
+
+    async def drain(self):
+        await self.stream.drain()
+
+    def close(self):
+        return self.stream.close()
+
+    def is_closing(self):
+        return self.stream.is_closing()
+
+    async def wait_closed(self):
+        await self.stream.wait_closed()
@@ -0,0 +1,334 @@
+#-----------------------------------------------------------------------------
+# Copyright (c) 2010  Raymond L. Buvel
+# Copyright (c) 2010  Craig McQueen
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#-----------------------------------------------------------------------------
+'''
+crcmod.bench measures the speed of crcmod, to catch performance regressions.
+
+It times the predefined algorithms on messages of several sizes, through
+Crc.update and through the functions returned by mkCrcFun, with each engine
+available (see crcmod.backends).  The per-call latency and the throughput of
+each combination are printed as a table or saved as JSON, and two JSON files
+can be compared.
+
+To use it, e.g.:
+    python -m crcmod.bench
+    python -m crcmod.bench --full -o after.json
+    python -m crcmod.bench --compare before.json after.json
+
+The following are the public components of this module.
+
+run -- measure a set of combinations, yielding a dict for each.
+
+compare -- compare the results of two runs.
+
+main -- the command line interface.
+'''
+
+import argparse
+import datetime
+import json
+import platform
+import sys
+import timeit
+
+import crcmod
+import crcmod.predefined
+from crcmod._tuning import _hostKey
+
+__all__ = [
+    'run',
+    'compare',
+    'main',
+]
+
+_fileVersion = 1
+
+# Message sizes measured by default, and by --full.
+_sizes = [1, 64, 4 << 10, 1 << 20]
+_fullSizes = [1, 16, 256, 4 << 10, 64 << 10, 1 << 20, 16 << 20, 256 << 20,
+              1 << 30]
+
+_apis = ['update', 'mkCrcFun']
+
+_suffixes = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+
+#-----------------------------------------------------------------------------
+# A message of the given size.  Smaller messages are prefixes of it, so the
+# message is only rebuilt when a larger size is measured.
+
+def _message(size):
+    block = bytes((i*151 + 17) & 0xFF for i in range(4096))
+    buf = bytearray(size)
+    buf[:len(block)] = block[:size]
+    n = len(block)
+    while n < size:
+        k = min(n, size - n)
+        buf[n:n+k] = buf[:k]
+        n += k
+    return memoryview(buf)
+
+# Return the function computing the CRC of data with the given API, and the
+# engine it uses.  The result is checked against the check value of the
+# algorithm, so that a broken engine is not timed.
+
+def _mkCall(definition, backend, api):
+    name = definition['name']
+    if api == 'update':
+        crc = crcmod.predefined.PredefinedCrc(name, backend)
+        call = crc.update
+        value = crc.new(b'123456789').crcValue
+        engine = crc.engine
+    else:
+        fun = crcmod.predefined.mkPredefinedCrcFun(name, backend)
+        call = fun
+        value = fun(b'123456789')
+        engine = getattr(fun, 'engine', backend)
+    if value != definition['check']:
+        raise RuntimeError('%s computes a wrong CRC with the %s engine' %
+                           (name, engine))
+    return call, engine
+
+# Return the best time of a call in seconds.  The number of calls per
+# measurement is chosen so that each takes at least minTime.
+
+def _timeCall(call, data, minTime, repeat):
+    timer = timeit.Timer(lambda: call(data))
+    number = 1
+    elapsed = timer.timeit(number)
+    while elapsed < minTime:
+        number = max(2*number, int(1.2*number*minTime/max(elapsed, 1e-9)))
+        elapsed = timer.timeit(number)
+    times = [elapsed] + timer.repeat(repeat - 1, number)
+    return min(times)/number, number
+
+#-----------------------------------------------------------------------------
+def run(algorithms=None, backends=None, sizes=None, apis=None, minTime=0.01,
+        repeat=3, maxCallTime=1.0):
+    '''Measure the CRC of messages, yielding a dict for each combination of
+    algorithm, backend, API and size.
+
+    algorithms -- names of predefined algorithms, or None for all of them
+    backends -- names of engines, or None for all the available ones
+    sizes -- message sizes in bytes, or None for the default sizes
+    apis -- 'update' (Crc.update) and/or 'mkCrcFun', or None for both
+    minTime -- the minimum time of a measurement in seconds
+    repeat -- the number of measurements, of which the fastest is kept
+    maxCallTime -- sizes whose CRC is expected to take longer than this many
+    seconds with an engine are skipped
+
+    Each dict has the keys algorithm, backend, engine (the engine reported by
+    the CRC function or object), api, size, calls (the number of calls per
+    measurement), latency (seconds per call) and throughput (MB/s).
+    Combinations that an engine does not support, such as the sse42 engine
+    with algorithms other than CRC-32C, are skipped.
+    '''
+    if algorithms is None:
+        definitions = crcmod.predefined._crc_definitions
+    else:
+        definitions = [crcmod.predefined._get_definition_by_name(name)
+                       for name in algorithms]
+    if backends is None:
+        backends = [engine['name'] for engine in crcmod.backends()]
+    sizes = sorted(sizes or _sizes)
+    apis = apis or _apis
+    message = _message(sizes[0])
+
+    for definition in definitions:
+        for backend in backends:
+            for api in apis:
+                try:
+                    (call, engine) = _mkCall(definition, backend, api)
+                except ValueError:
+                    continue
+                secondsPerByte = 0.0
+                for size in sizes:
+                    if size*secondsPerByte > maxCallTime:
+                        break
+                    if len(message) < size:
+                        message = _message(size)
+                    (latency, calls) = _timeCall(call, message[:size],
+                                                 minTime, repeat)
+                    secondsPerByte = latency/size
+                    yield {
+                        'algorithm': definition['name'],
+                        'backend': backend,
+                        'engine': engine,
+                        'api': api,
+                        'size': size,
+                        'calls': calls,
+                        'latency': latency,
+                        'throughput': size/latency/1e6,
+                    }
+
+#-----------------------------------------------------------------------------
+def compare(old, new, tolerance=0.1):
+    '''Compare the results of two runs, as saved by main.
+
+    old, new -- the lists of results
+    tolerance -- the relative change of throughput considered significant
+
+    Return a list of (result, ratio) for the combinations measured by both
+    runs whose throughput changed by more than the tolerance, where result is
+    the new result and ratio is its throughput divided by the old one.
+    '''
+    def key(result):
+        return (result['algorithm'], result['backend'], result['api'],
+                result['size'])
+    previous = dict((key(result), result) for result in old)
+    changes = []
+    for result in new:
+        base = previous.get(key(result))
+        if base is None:
+            continue
+        ratio = result['throughput']/base['throughput']
+        if ratio < 1/(1 + tolerance) or ratio > 1 + tolerance:
+            changes.append((result, ratio))
+    return changes
+
+#-----------------------------------------------------------------------------
+# Command line interface.
+
+def _parseSize(text):
+    text = text.strip().upper().rstrip('B')
+    scale = 1
+    if text[-1:] in _suffixes:
+        scale = _suffixes[text[-1]]
+        text = text[:-1]
+    size = int(text)*scale
+    if size < 1:
+        raise argparse.ArgumentTypeError('sizes must be at least 1 byte')
+    return size
+
+def _parseSizes(text):
+    try:
+        return [_parseSize(size) for size in text.split(',')]
+    except ValueError:
+        raise argparse.ArgumentTypeError('invalid size list %r' % text)
+
+def _formatSize(size):
+    for (suffix, scale) in sorted(_suffixes.items(), key=lambda x: -x[1]):
+        if size >= scale and size % scale == 0:
+            return '%d%s' % (size//scale, suffix)
+    return str(size)
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='python -m crcmod.bench',
+            description='Measure the speed of the CRC algorithms of crcmod.')
+    parser.add_argument('-a', '--algorithm', action='append',
+            dest='algorithms', metavar='NAME',
+            help='predefined algorithm to measure (default: all of them)')
+    parser.add_argument('-b', '--backend', action='append', dest='backends',
+            metavar='ENGINE',
+            help='engine to measure (default: all the available ones)')
+    parser.add_argument('--api', action='append', dest='apis', choices=_apis,
+            help='interface to measure (default: both)')
+    parser.add_argument('-s', '--sizes', type=_parseSizes,
+            help='comma separated message sizes, with an optional K, M or G '
+                 'suffix (default: %s)' %
+                 ','.join(_formatSize(size) for size in _sizes))
+    parser.add_argument('--full', action='store_true',
+            help='measure sizes from 1 byte to 1 GB (%s)' %
+                 ','.join(_formatSize(size) for size in _fullSizes))
+    parser.add_argument('--min-time', type=float, default=0.01,
+            help='minimum time of a measurement in seconds (default: 0.01)')
+    parser.add_argument('--repeat', type=int, default=3,
+            help='number of measurements of which the fastest is kept '
+                 '(default: 3)')
+    parser.add_argument('--max-call-time', type=float, default=1.0,
+            help='skip the sizes expected to take longer than this many '
+                 'seconds per call (default: 1)')
+    parser.add_argument('-o', '--output', metavar='FILE',
+            help='save the results as JSON in FILE (- for standard output)')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'),
+            help='compare two JSON files instead of measuring; the exit '
+                 'status is 1 if a throughput dropped')
+    parser.add_argument('--tolerance', type=float, default=0.1,
+            help='relative change of throughput reported by --compare '
+                 '(default: 0.1)')
+    return parser
+
+def _printResult(result, out):
+    print('%-20s %-8s %-8s %8s %12.3f us %12.2f MB/s' % (result['algorithm'],
+            result['engine'], result['api'], _formatSize(result['size']),
+            1e6*result['latency'], result['throughput']), file=out)
+
+def _load(path):
+    with open(path) as f:
+        return json.load(f)
+
+def _compareFiles(args):
+    old = _load(args.compare[0])
+    new = _load(args.compare[1])
+    changes = compare(old['results'], new['results'], args.tolerance)
+    slower = 0
+    for (result, ratio) in changes:
+        _printResult(result, sys.stdout)
+        print('    %.2fx the throughput of %s' % (ratio, args.compare[0]))
+        if ratio < 1:
+            slower += 1
+    print('%d of %d results changed by more than %d%%, %d slower' % (
+            len(changes), len(new['results']), 100*args.tolerance, slower))
+    return 1 if slower else 0
+
+def main(argv=None):
+    '''Run the command line interface with the arguments argv (sys.argv[1:]
+    if None), and return the exit status.
+    '''
+    args = _parser().parse_args(argv)
+    if args.compare:
+        return _compareFiles(args)
+
+    sizes = args.sizes
+    if args.full:
+        sizes = _fullSizes
+    # With the results written to standard output, the table goes to
+    # standard error.
+    out = sys.stderr if args.output == '-' else sys.stdout
+    print('%-20s %-8s %-8s %8s %15s %17s' % ('algorithm', 'engine', 'api',
+            'size', 'latency', 'throughput'), file=out)
+    results = []
+    for result in run(args.algorithms, args.backends, sizes, args.apis,
+                      args.min_time, args.repeat, args.max_call_time):
+        _printResult(result, out)
+        results.append(result)
+
+    if args.output:
+        data = {
+            'version': _fileVersion,
+            'date': datetime.datetime.now().isoformat(timespec='seconds'),
+            'host': _hostKey(),
+            'python': '%s %s' % (platform.python_implementation(),
+                                 platform.python_version()),
+            'backends': [engine['name'] for engine in crcmod.backends()],
+            'results': results,
+        }
+        if args.output == '-':
+            json.dump(data, sys.stdout, indent=1)
+            print()
+        else:
+            with open(args.output, 'w') as f:
+                json.dump(data, f, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -33,22 +33,169 @@ the CRC.
 mkCrcFun -- create a Python function to compute the CRC using the specified
 polynomial and initial value.  This provides a much simpler interface if
 all you need is a function for CRC calculation.
+
+setGilThreshold -- set the buffer size above which the extension module
+releases the GIL while computing a CRC.
+
+combineCrc -- combine the CRCs of two messages into the CRC of the
+concatenated message.
+
+shiftCrc -- extend the CRC of a message by a number of zero bytes.
+
+tableCacheInfo, clearTableCache -- inspect and clear the cache of CRC tables.
+
+backends -- list the engines available to compute CRCs.
+
+tune -- measure the engines on this machine and save the buffer sizes at which
+they are switched.
+
+crcFile -- compute the CRC of a file.
+
+CrcReader, CrcWriter -- file object wrappers that compute the CRC of the data
+read or written through them.
+
+MultiCrc -- a class that computes several CRCs in one pass over the data.
+
+RollingCrc -- a class that computes the CRC of a window sliding over the data.
 '''
 
-__all__ = '''mkCrcFun Crc
+__all__ = '''mkCrcFun Crc setGilThreshold combineCrc shiftCrc tableCacheInfo
+clearTableCache crcFile CrcReader CrcWriter MultiCrc RollingCrc backends
+tune
 '''.split()
 
+import io, os, sys
+
+# Importing crcmod does as little work as possible.  The low level CRC
+# functions, the table cache and the struct type codes are set up when they
+# are first needed.
+
+#-----------------------------------------------------------------------------
 # Select the appropriate set of low-level CRC functions for this installation.
-# If the extension module was not built, drop back to the Python implementation
-# even though it is significantly slower.
-try:
-    import crcmod._crcfunext as _crcfun
-    _usingExtension = True
-except ImportError:
-    import crcmod._crcfunpy as _crcfun
-    _usingExtension = False
+# If the extension module was not built, drop back to the NumPy implementation
+# if NumPy is installed, and otherwise to the Python implementation even though
+# it is significantly slower.
+#
+# The CRCMOD_BACKEND environment variable names an engine (see _engines) to
+# use instead.  The numpy and python engines select their module.  The
+# engines of the extension module are used for every CRC they can compute if
+# the processor supports them, and the default choice is made otherwise.
+#
+# The selection is made by _loadBackend when the first CRC function is
+# created.  Until then, __getattr__ provides the module attributes it sets.
+# The thresholds saved by tune for this machine are applied at the same time.
+
+_backendLoaded = False
+
+def _loadBackend():
+    global _crcfun, _usingExtension, _useClmul, _useSse42, _defaultEngine
+    global _backendLoaded
+    engine = os.environ.get('CRCMOD_BACKEND') or None
+    if engine is not None and _engineModuleName(engine) is None:
+        raise ValueError('unknown engine %r in CRCMOD_BACKEND' % engine)
+    _crcfun = None
+    if engine not in ('numpy', 'python'):
+        try:
+            import crcmod._crcfunext as _crcfun
+        except ImportError:
+            pass
+    if _crcfun is None and engine != 'python':
+        try:
+            import crcmod._crcfunnp as _crcfun
+        except ImportError:
+            pass
+    if _crcfun is None:
+        import crcmod._crcfunpy as _crcfun
+    _usingExtension = _crcfun.__name__ == 'crcmod._crcfunext'
+    _useClmul = _usingExtension and bool(getattr(_crcfun, '_hasClmul', 0))
+    _useSse42 = _usingExtension and bool(getattr(_crcfun, '_hasSse42', 0))
+    _defaultEngine = None
+    if engine in ('sse42', 'clmul', 'slicing', 'table') and _usingExtension:
+        if _engineSupported(_crcfun, engine):
+            _defaultEngine = engine
+    _backendLoaded = True
+    path = _tuneFile()
+    if os.path.exists(path):
+        from crcmod._tuning import loadThresholds
+        loadThresholds(_crcfun, path)
+
+# The file holding the thresholds saved by tune.
+
+def _tuneFile():
+    path = os.environ.get('CRCMOD_TUNE_FILE')
+    if path:
+        return path
+    cache = (os.environ.get('XDG_CACHE_HOME') or
+             os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache, 'crcmod', 'thresholds.json')
+
+def __getattr__(name):
+    if name in ('_crcfun', '_usingExtension', '_useClmul', '_useSse42',
+                '_defaultEngine'):
+        _loadBackend()
+        return globals()[name]
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
-import sys, struct
+#-----------------------------------------------------------------------------
+# The engines that compute CRCs, in order of preference, with the module
+# providing each of them.  The engine of a CRC function is chosen by its
+# backend parameter, or automatically if it is None.
+
+_engines = [
+    ('sse42', '_crcfunext', 'crc32 instruction of SSE4.2 (CRC-32C only)'),
+    ('clmul', '_crcfunext', 'carry-less multiply folding'),
+    ('slicing', '_crcfunext', 'slicing-by-8/16 tables'),
+    ('table', '_crcfunext', 'byte-wise table'),
+    ('numpy', '_crcfunnp', 'lanes computed with NumPy'),
+    ('python', '_crcfunpy', 'Python implementation'),
+]
+
+def _engineModuleName(name):
+    for (engine, moduleName, description) in _engines:
+        if engine == name:
+            return moduleName
+    return None
+
+def _engineSupported(module, name):
+    if name == 'sse42':
+        return bool(getattr(module, '_hasSse42', 0))
+    if name == 'clmul':
+        return bool(getattr(module, '_hasClmul', 0))
+    return True
+
+# Return the module providing an engine, raising ValueError if it is unknown
+# or not available.
+
+def _engineModule(name):
+    moduleName = _engineModuleName(name)
+    if moduleName is None:
+        raise ValueError('unknown engine %r' % (name,))
+    import importlib
+    try:
+        module = importlib.import_module('crcmod.' + moduleName)
+    except ImportError:
+        module = None
+    if module is None or not _engineSupported(module, name):
+        raise ValueError('engine %r is not available' % (name,))
+    return module
+
+# Return True if an engine is available.  When CRCMOD_BACKEND selects the
+# numpy or python engine, the extension module is not loaded just to check
+# its engines.  Whether the processor supports the sse42 and clmul engines
+# is then unknown, so they are not reported.
+
+def _engineAvailable(name):
+    fullName = 'crcmod.' + _engineModuleName(name)
+    if (fullName == 'crcmod._crcfunext' and fullName not in sys.modules and
+            os.environ.get('CRCMOD_BACKEND') in ('numpy', 'python')):
+        import importlib.util
+        return (name in ('slicing', 'table') and
+                importlib.util.find_spec(fullName) is not None)
+    try:
+        _engineModule(name)
+    except ValueError:
+        return False
+    return True
 
 #-----------------------------------------------------------------------------
 class Crc:
@@ -85,8 +232,20 @@ class Crc:
 
     xorOut -- Final value to XOR with the calculated CRC value.  Used by some
     CRC algorithms.  Defaults to zero.
+
+    backend -- The name of the engine computing the CRC, as listed by the
+    backends function, or None to choose the fastest one available (or the
+    one named by the CRCMOD_BACKEND environment variable).
+
+    The engine attribute names the implementation used for large buffers:
+    'sse42' (the crc32 instruction, only for CRC-32C), 'clmul' (carry-less
+    multiply folding), 'slicing' (slicing-by-8/16 tables), 'table' (the
+    byte-wise table of the extension module), 'numpy' (the extension module
+    is not available, and large buffers are processed in lanes with NumPy) or
+    'python' (neither is available).
     '''
-    def __init__(self, poly, initCrc=~0, rev=True, xorOut=0, initialize=True):
+    def __init__(self, poly, initCrc=~0, rev=True, xorOut=0, initialize=True,
+                 backend=None):
         if not initialize:
             # Don't want to perform the initialization when using new or copy
             # to create a new instance.
@@ -100,9 +259,11 @@ class Crc:
         self.poly = poly
         self.reverse = rev
 
-        (crcfun, table) = _mkCrcFun(poly, sizeBits, initCrc, rev, xorOut)
+        (crcfun, table) = _mkCrcFun(poly, sizeBits, initCrc, rev, xorOut,
+                                    backend)
         self._crc = crcfun
         self.table = table
+        self.engine = crcfun.engine
 
         self.crcValue = self.initCrc
 
@@ -128,6 +289,7 @@ class Crc:
         n.initCrc = self.initCrc
         n.xorOut = self.xorOut
         n.table = self.table
+        n.engine = self.engine
         n.crcValue = self.initCrc
         n.reverse = self.reverse
         n.poly = self.poly
@@ -151,6 +313,139 @@ class Crc:
         '''
         self.crcValue = self._crc(data, self.crcValue)
 
+    def updateFile(self, file, bufferSize=None):
+        '''Update the current CRC value with the contents of a file.
+
+        file -- path of the file, or a binary file object.  A file object is
+        read from its current position to the end.
+
+        bufferSize -- size of the reads in bytes.  Defaults to 1 MiB.
+
+        The file is read into a single reusable buffer.  Regular files of at
+        least 16 MiB, given by path or opened with open, are mapped into
+        memory instead.  The holes of such sparse files are found with
+        SEEK_HOLE and SEEK_DATA where available, and added with updateZeros
+        without being read.  Other file objects, such as gzip.GzipFile, are
+        only read with their read methods.  The extension module
+        releases the GIL while computing the CRC of each buffer.
+        '''
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with open(file, 'rb') as f:
+                _updateFile(self, f, bufferSize)
+        else:
+            _updateFile(self, file, bufferSize)
+
+    def updateZeros(self, n):
+        '''Update the current CRC value as if n zero bytes were passed to
+        update.  The time taken is proportional to the logarithm of n, and no
+        memory is used for the zeros.
+        '''
+        self.crcValue = _zeros(self.poly, self.digest_size*8, self.reverse,
+                               self.xorOut, self.crcValue, n)
+
+    def updateParallel(self, data, workers=None, chunkSize=None):
+        '''Update the current CRC value using the data parameter, splitting
+        it into chunks that are processed by a pool of worker threads.  The
+        data may be any object supporting the buffer API, such as a bytes
+        object or an mmap.  The CRCs of the chunks are merged with combine.
+
+        workers -- number of threads.  Defaults to the number of processors.
+
+        chunkSize -- size of the chunks in bytes.  Defaults to the data size
+        divided by the number of workers, but at least 1 MiB.
+
+        The extension module releases the GIL while computing the CRC of each
+        chunk, so the threads run in parallel.  Small buffers, or a single
+        worker, are handled by update.
+        '''
+        view = memoryview(data).cast('B')
+        size = len(view)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if chunkSize is None:
+            chunkSize = max(_parallelMinChunk, -(-size//workers))
+        if chunkSize <= 0:
+            raise ValueError('chunkSize must be positive')
+        if workers <= 1 or size <= chunkSize:
+            self.update(view)
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+        chunks = [view[i:i+chunkSize] for i in range(0, size, chunkSize)]
+        with ThreadPoolExecutor(workers) as executor:
+            crcs = list(executor.map(self._crc, chunks))
+
+        # All chunks except the last have the same length, so the shift
+        # operator is computed at most twice.
+        n = self.digest_size*8
+        shifts = {}
+        crc = self.crcValue
+        for (chunk, chunkCrc) in zip(chunks, crcs):
+            lenB = len(chunk)
+            if lenB not in shifts:
+                shifts[lenB] = _xpow8nmod(lenB, self.poly, n)
+            crc = _applyShift(crc ^ self.initCrc, shifts[lenB], self.poly, n,
+                              self.reverse) ^ chunkCrc
+        self.crcValue = crc
+
+    def many(self, buffers):
+        '''Return a list with the CRC of each buffer in the iterable buffers.
+        Each CRC continues from the current CRC value, which is not modified.
+        The loop over the buffers runs in the extension module when it is
+        available, avoiding the overhead of a Python level call per buffer.
+        '''
+        return self._crc.many(buffers, self.crcValue)
+
+    def records(self, data, stride, length, offset=0, out=None):
+        '''Calculate the CRC of fixed size records stored back to back in
+        data.  The records are length bytes long, start stride bytes apart
+        and the first one starts at offset.  Each CRC continues from the
+        current CRC value, which is not modified.
+
+        The results are stored in out, a writable contiguous buffer of
+        unsigned integers of 1, 2, 4 or 8 bytes for 8, 16, 24/32 and 64-bit
+        CRCs (an array.array or a NumPy array, for example).  If out is not specified, a new
+        array.array is created.  Returns out.
+        '''
+        return self._crc.records(data, stride, length, offset, out,
+                                 self.crcValue)
+
+    def combine(self, crcA, crcB, lenB):
+        '''Return the CRC of the concatenation of two messages A and B, given
+        the CRC of A (crcA), the CRC of B (crcB) and the length of B in bytes.
+        Both CRCs must have been calculated from the initial value of this
+        instance.  The current CRC value is not modified.
+        '''
+        return _combine(self.poly, self.digest_size*8, self.reverse,
+                        self.initCrc, crcA, crcB, lenB)
+
+    def patch(self, crc, offset, oldData, newData, totalLen):
+        '''Return the CRC of a message after the bytes oldData at offset are
+        replaced by newData of the same length.
+
+        crc -- the CRC of the message before the change
+        totalLen -- the length of the message in bytes
+
+        The CRC is affine in the message, so the change in the CRC is the CRC
+        (from a zero register) of oldData XOR newData followed by the bytes
+        after the patch as zeros.  The time taken is proportional to the
+        length of the patch plus the logarithm of totalLen.  The current CRC
+        value is not modified.
+        '''
+        oldData = memoryview(oldData).cast('B')
+        newData = memoryview(newData).cast('B')
+        size = len(oldData)
+        if len(newData) != size:
+            raise ValueError('oldData and newData must have the same length')
+        if offset < 0 or offset + size > totalLen:
+            raise ValueError('the patch must be inside the message')
+        diff = (int.from_bytes(oldData, 'big') ^
+                int.from_bytes(newData, 'big')).to_bytes(size, 'big')
+        # Starting from the final XOR value gives a zero register.
+        delta = self._crc(diff, self.xorOut) ^ self.xorOut
+        return crc ^ _crcShift(delta, totalLen - offset - size, self.poly,
+                               self.digest_size*8, self.reverse)
+
     def digest(self):
         '''Return the current CRC value as a string of bytes.  The length of
         this string is specified in the digest_size attribute.
@@ -266,13 +561,200 @@ class Crc:
         out.write(_codeTemplate % parms) 
 
 #-----------------------------------------------------------------------------
-def mkCrcFun(poly, initCrc=~0, rev=True, xorOut=0):
+class MultiCrc:
+    '''Compute several CRCs of the same data in one pass.
+
+    algorithms -- a sequence of Crc instances or names of predefined
+    algorithms.  The Crc instances are copied, so their CRC values are the
+    starting values.
+
+    The update method computes all the CRCs, working through the data in
+    blocks that stay in the processor cache while each CRC is applied.  The
+    individual Crc instances are available by index, or by name for the
+    predefined algorithms, and the digests and hexdigests methods return the
+    results of all of them.
+    '''
+    def __init__(self, algorithms):
+        self.crcs = []
+        self.names = []
+        for algorithm in algorithms:
+            if isinstance(algorithm, Crc):
+                self.crcs.append(algorithm.copy())
+                self.names.append(None)
+            else:
+                from crcmod.predefined import PredefinedCrc
+                self.crcs.append(PredefinedCrc(algorithm))
+                self.names.append(algorithm)
+        self._funs = [crc._crc for crc in self.crcs]
+
+    def __len__(self):
+        return len(self.crcs)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.crcs[self.names.index(key)]
+        return self.crcs[key]
+
+    def new(self, arg=None):
+        '''Create a new instance computing the same CRCs, set to their
+        initial values.  If arg is provided, it is passed to update.
+        '''
+        n = MultiCrc([])
+        n.crcs = [crc.new() for crc in self.crcs]
+        n.names = list(self.names)
+        n._funs = self._funs
+        if arg is not None:
+            n.update(arg)
+        return n
+
+    def copy(self):
+        '''Create a new instance with the same current CRC values.
+        '''
+        c = self.new()
+        for (crc, value) in zip(c.crcs, self.crcValues):
+            crc.crcValue = value
+        return c
+
+    def update(self, data):
+        '''Update all the CRC values using the data parameter.
+        '''
+        if not _backendLoaded:
+            _loadBackend()
+        funType = _crcfun.CrcFun
+        if all(type(fun) is funType for fun in self._funs):
+            values = _crcfun._multiUpdate(self._funs, data, self.crcValues)
+        else:
+            # Some of the CRCs use a different backend.
+            values = [fun(data, crc) for (fun, crc) in
+                      zip(self._funs, self.crcValues)]
+        for (crc, value) in zip(self.crcs, values):
+            crc.crcValue = value
+
+    @property
+    def crcValues(self):
+        '''List of the current CRC values.'''
+        return [crc.crcValue for crc in self.crcs]
+
+    def digests(self):
+        '''Return a list with the digest of each CRC.'''
+        return [crc.digest() for crc in self.crcs]
+
+    def hexdigests(self):
+        '''Return a list with the hexdigest of each CRC.'''
+        return [crc.hexdigest() for crc in self.crcs]
+
+#-----------------------------------------------------------------------------
+class RollingCrc:
+    '''Compute the CRC of a window of fixed size that slides over the data,
+    one byte at a time.
+
+    algorithm -- a Crc instance or the name of a predefined algorithm
+    window -- the number of bytes in the window
+
+    The window starts out filled with zero bytes.  After each byte passed to
+    update, the crcValue attribute is the CRC of the last window bytes, as
+    computed by the algorithm.  The byte leaving the window is removed with a
+    table computed for the window size, so each step costs the same as a
+    byte of an ordinary CRC.
+
+    The scan method finds the positions in the data where the CRC of the
+    window matches a pattern, which is the usual way of choosing the chunk
+    boundaries in content defined chunking.
+    '''
+    def __init__(self, algorithm, window):
+        if not isinstance(algorithm, Crc):
+            from crcmod.predefined import PredefinedCrc
+            algorithm = PredefinedCrc(algorithm)
+        window = int(window)
+        if window < 1:
+            raise ValueError('window must be at least one byte')
+        if not _backendLoaded:
+            _loadBackend()
+        import struct
+
+        self.crc = algorithm.new()
+        self.window = window
+        n = algorithm.digest_size*8
+        poly = algorithm.poly
+        rev = algorithm.reverse
+        self._width = n
+        self._rev = bool(rev)
+        table = algorithm.table
+        # The CRC, from a zero register, of each byte value followed by window
+        # zero bytes.  It is linear in the byte value like the CRC table.
+        outTable = _expandTable([_crcShift(table[1<<k], window, poly, n, rev)
+                                 for k in range(8)])
+        self._table = struct.pack('256Q', *table)
+        self._outTable = struct.pack('256Q', *outTable)
+        # The register holds the CRC of the window from a zero register, so
+        # the effect of the initial and final XOR values is added separately.
+        initCrc = algorithm.initCrc
+        xorOut = algorithm.xorOut
+        self._xorValue = xorOut ^ _crcShift(initCrc ^ xorOut, window, poly, n,
+                                            rev)
+        self.reset()
+
+    def reset(self):
+        '''Fill the window with zero bytes again.'''
+        self._reg = 0
+        self._history = bytes(self.window)
+
+    def copy(self):
+        '''Create a new instance with the same window contents.'''
+        c = RollingCrc.__new__(RollingCrc)
+        c.__dict__.update(self.__dict__)
+        return c
+
+    @property
+    def crcValue(self):
+        '''The CRC of the bytes in the window.'''
+        return self._xorValue ^ self._reg
+
+    def digest(self):
+        '''Return the CRC of the window as a string of bytes.'''
+        c = self.crc.new()
+        c.crcValue = self.crcValue
+        return c.digest()
+
+    def hexdigest(self):
+        '''Return the CRC of the window as a string of hex digits.'''
+        c = self.crc.new()
+        c.crcValue = self.crcValue
+        return c.hexdigest()
+
+    def _roll(self, data, mask, match):
+        (self._reg, offsets) = _crcfun._rollingScan(self._table,
+                self._outTable, self._width, self._rev, self._reg,
+                self._history, data, self._xorValue, mask, match)
+        data = memoryview(data).cast('B')
+        if len(data) >= self.window:
+            self._history = bytes(data[len(data)-self.window:])
+        else:
+            self._history = self._history[len(data):] + bytes(data)
+        return offsets
+
+    def update(self, data):
+        '''Slide the window over the bytes in data.'''
+        self._roll(data, None, 0)
+
+    def scan(self, data, mask, match=0):
+        '''Slide the window over the bytes in data, and return the list of
+        the offsets in data where crcValue & mask == match.  An offset is the
+        number of bytes of data consumed, so the window then ends just before
+        data[offset].
+        '''
+        return self._roll(data, mask, match & mask)
+
+#-----------------------------------------------------------------------------
+def mkCrcFun(poly, initCrc=~0, rev=True, xorOut=0, backend=None):
     '''Return a function that computes the CRC using the specified polynomial.
 
     poly -- integer representation of the generator polynomial
     initCrc -- default initial CRC value
     rev -- when true, indicates that the data is processed bit reversed.
     xorOut -- the final XOR value
+    backend -- the name of the engine to use (see backends), or None to
+    choose automatically
 
     The returned function has the following user interface
     def crcfun(data, crc=initCrc):
@@ -281,7 +763,253 @@ def mkCrcFun(poly, initCrc=~0, rev=True, xorOut=0):
     # First we must verify the params
     (sizeBits, initCrc, xorOut) = _verifyParams(poly, initCrc, xorOut)
     # Make the function (and table), return the function
-    return _mkCrcFun(poly, sizeBits, initCrc, rev, xorOut)[0]
+    return _mkCrcFun(poly, sizeBits, initCrc, rev, xorOut, backend)[0]
+
+#-----------------------------------------------------------------------------
+def setGilThreshold(nbytes):
+    '''Set the minimum buffer size for which the GIL is released.
+
+    nbytes -- buffer size in bytes.  The extension module releases the GIL
+    while computing the CRC of buffers of at least this size, which allows
+    other threads to compute CRCs (or do other work) at the same time.
+    Defaults to 2048.
+
+    Returns the previous setting.  The setting has no effect when the
+    extension module is not available.
+    '''
+    if not _backendLoaded:
+        _loadBackend()
+    return _crcfun._setGilThreshold(nbytes)
+
+#-----------------------------------------------------------------------------
+def crcFile(file, algorithm, bufferSize=None):
+    '''Return a Crc instance holding the CRC of a file.
+
+    file -- path of the file, or a binary file object (see Crc.updateFile)
+    algorithm -- a Crc instance, whose new method is used, or the name of a
+    predefined algorithm such as 'crc-32'
+    bufferSize -- size of the reads in bytes
+    '''
+    if isinstance(algorithm, Crc):
+        crc = algorithm.new()
+    else:
+        from crcmod.predefined import PredefinedCrc
+        crc = PredefinedCrc(algorithm)
+    crc.updateFile(file, bufferSize)
+    return crc
+
+#-----------------------------------------------------------------------------
+class _CrcIOBase(io.BufferedIOBase):
+    # Common part of CrcReader and CrcWriter.
+
+    def __init__(self, file, crc):
+        self.file = file
+        self.crc = crc
+
+    @property
+    def crcValue(self):
+        return self.crc.crcValue
+
+    def digest(self):
+        return self.crc.digest()
+
+    def hexdigest(self):
+        return self.crc.hexdigest()
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def isatty(self):
+        return self.file.isatty()
+
+    def close(self):
+        if not self.closed:
+            try:
+                super().close()
+            finally:
+                self.file.close()
+
+    def detach(self):
+        file = self.file
+        self.flush()
+        super().close()
+        return file
+
+    def _update(self, b, n):
+        # Update the CRC with the first n bytes of b without copying them.
+        with memoryview(b) as view:
+            with view.cast('B') as data:
+                if n == len(data):
+                    self.crc.update(data)
+                else:
+                    with data[:n] as head:
+                        self.crc.update(head)
+
+
+class CrcReader(_CrcIOBase):
+    '''Wrap a binary file object opened for reading, and compute the CRC of
+    all the data read through the wrapper.
+
+    file -- the file object to read from
+    crc -- the Crc instance to update
+
+    The current CRC is available from the crcValue attribute and the digest
+    and hexdigest methods.  Closing the wrapper closes the file.  The data
+    passed to readinto is given to the CRC function without a copy.
+    '''
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self.file.read(size)
+        if data:
+            self.crc.update(data)
+        return data
+
+    def read1(self, size=-1):
+        read1 = getattr(self.file, 'read1', self.file.read)
+        data = read1(size)
+        if data:
+            self.crc.update(data)
+        return data
+
+    def readinto(self, b):
+        n = self.file.readinto(b)
+        if n:
+            self._update(b, n)
+        return n
+
+    def readinto1(self, b):
+        readinto1 = getattr(self.file, 'readinto1', self.file.readinto)
+        n = readinto1(b)
+        if n:
+            self._update(b, n)
+        return n
+
+
+class CrcWriter(_CrcIOBase):
+    '''Wrap a binary file object opened for writing, and compute the CRC of
+    all the data written through the wrapper.
+
+    file -- the file object to write to
+    crc -- the Crc instance to update
+
+    The current CRC is available from the crcValue attribute and the digest
+    and hexdigest methods.  Only the bytes accepted by the file are included
+    in the CRC.  Closing the wrapper closes the file.
+    '''
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        n = self.file.write(b)
+        if n:
+            self._update(b, n)
+        return n
+
+    def flush(self):
+        if not self.closed:
+            self.file.flush()
+
+#-----------------------------------------------------------------------------
+def combineCrc(poly, crcA, crcB, lenB, initCrc=~0, rev=True, xorOut=0):
+    '''Return the CRC of the concatenation of two messages A and B.
+
+    poly, initCrc, rev, xorOut -- the CRC algorithm, as for mkCrcFun
+    crcA -- the CRC of message A
+    crcB -- the CRC of message B
+    lenB -- the length of message B in bytes
+
+    Both CRCs must have been calculated from initCrc.  The time taken is
+    proportional to the logarithm of lenB, so the CRC of a large message can
+    be computed from the CRCs of its pieces.
+    '''
+    (sizeBits, initCrc, xorOut) = _verifyParams(poly, initCrc, xorOut)
+    return _combine(poly, sizeBits, rev, initCrc, crcA, crcB, lenB)
+
+#-----------------------------------------------------------------------------
+def shiftCrc(poly, crc, nBytes, rev=True, xorOut=0):
+    '''Return the CRC of a message extended by nBytes zero bytes.
+
+    poly, rev, xorOut -- the CRC algorithm, as for mkCrcFun
+    crc -- the CRC of the message
+    nBytes -- the number of zero bytes appended
+
+    The result is computed from x**(8*nBytes) modulo the polynomial, so the
+    time taken is proportional to the logarithm of nBytes.
+    '''
+    (sizeBits, initCrc, xorOut) = _verifyParams(poly, 0, xorOut)
+    return _zeros(poly, sizeBits, rev, xorOut, crc, nBytes)
+
+#-----------------------------------------------------------------------------
+def backends():
+    '''Return a list describing the engines available to compute CRCs, in
+    order of preference.
+
+    Each engine is described by a dict with the following keys.
+    name -- the name to pass as the backend parameter of Crc and mkCrcFun,
+    or to set in the CRCMOD_BACKEND environment variable
+    module -- the name of the module implementing it
+    description -- a short description of the method
+    crc32cOnly -- True if it only computes CRC-32C
+    releasesGil -- True if it releases the GIL for large buffers
+
+    When CRCMOD_BACKEND is numpy or python and the extension module has not
+    been loaded, only its slicing and table engines are listed, since the
+    sse42 and clmul engines depend on the processor.
+    '''
+    result = []
+    for (name, moduleName, description) in _engines:
+        if not _engineAvailable(name):
+            continue
+        result.append({
+            'name': name,
+            'module': 'crcmod.' + moduleName,
+            'description': description,
+            'crc32cOnly': name == 'sse42',
+            'releasesGil': moduleName == '_crcfunext',
+        })
+    return result
+
+#-----------------------------------------------------------------------------
+def tune(sizes=None, save=True, path=None):
+    '''Measure the engines on this machine, set the buffer sizes at which they
+    are switched, and save them for later imports of crcmod.  Return the
+    thresholds chosen.
+
+    sizes -- the buffer sizes measured, or None for a default sweep
+    save -- False to only apply the thresholds to this process
+    path -- the file to save them in, or None for the file named by the
+    CRCMOD_TUNE_FILE environment variable, or crcmod/thresholds.json in the
+    user's cache directory
+
+    The extension module computes small buffers with the byte-wise table, and
+    switches to slicing-by-8, slicing-by-16 and the carry-less multiply
+    folding engine as buffers get larger.  tune finds the size from which each
+    of them is faster for each CRC width.  The NumPy implementation is tuned
+    for the size from which its lanes are faster than the Python
+    implementation.  The file holds an entry for each processor model, so it
+    can be shared by different machines.  Tuning takes a few seconds.
+    '''
+    from crcmod._tuning import tune
+    return tune(sizes, save, path)
+
+#-----------------------------------------------------------------------------
+def tableCacheInfo():
+    '''Return the statistics of the cache of CRC tables.
+
+    The tables built for a polynomial are cached and reused by Crc and
+    mkCrcFun.  The result is a named tuple with the fields hits, misses,
+    maxsize and currsize, as returned by functools.lru_cache.
+    '''
+    return _tableCache().cache_info()
+
+def clearTableCache():
+    '''Remove all the tables from the cache and reset its statistics.
+    '''
+    _tableCache().cache_clear()
 
 #-----------------------------------------------------------------------------
 # Naming convention:
@@ -342,48 +1070,314 @@ def _bytecrc_r(crc, poly, n):
 # table is returned as a list.  Note that the array module does not support
 # 64-bit integers on a 32-bit architecture as of Python 2.3.
 #
+# The CRC of a byte is linear in the byte value, so the table entry for i^j is
+# the XOR of the entries for i and j.  Only the entries for the powers of two
+# are computed bit by bit; the table is then doubled in size eight times by
+# XORing each of them into the entries already built.
+#
 # These routines assume that the polynomial and the number of bits in the CRC
 # have been checked for validity by the caller.
 
+def _expandTable(basis):
+    table = [0]
+    for t in basis:
+        table += [t ^ x for x in table]
+    return table
+
 def _mkTable(poly, n):
     mask = (1<<n) - 1
     poly = poly & mask
-    table = [_bytecrc(i<<(n-8),poly,n) for i in range(256)]
-    return table
+    return _expandTable([_bytecrc(1<<(k+n-8),poly,n) for k in range(8)])
 
 def _mkTable_r(poly, n):
     mask = (1<<n) - 1
     poly = _bitrev(poly & mask, n)
-    table = [_bytecrc_r(i,poly,n) for i in range(256)]
-    return table
+    return _expandTable([_bytecrc_r(1<<k,poly,n) for k in range(8)])
 
 #-----------------------------------------------------------------------------
-# Map the CRC size onto the functions that handle these sizes.
-
-_sizeMap = {
-     8 : [_crcfun._crc8, _crcfun._crc8r],
-    16 : [_crcfun._crc16, _crcfun._crc16r],
-    24 : [_crcfun._crc24, _crcfun._crc24r],
-    32 : [_crcfun._crc32, _crcfun._crc32r],
-    64 : [_crcfun._crc64, _crcfun._crc64r],
-}
+# The extension module can process several bytes per iteration using the
+# "slicing-by-N" algorithm.  It needs N tables where table k holds the CRC of
+# each byte value followed by k zero bytes.  The first table is the one built
+# by _mkTable or _mkTable_r.  The result is returned as a single list holding
+# the N tables one after the other.
+#
+# Appending a zero byte is linear as well, so only the entries for the powers
+# of two are carried from one table to the next and each table is expanded
+# with _expandTable.  If the application has already imported NumPy, the
+# expansion and packing of all the tables are done with it (NumPy is not
+# imported here since that costs more than building the tables).
+
+_sliceCount = 16
+
+def _sliceBases(table, n, rev, slices):
+    mask = (1<<n) - 1
+    shift = n - 8
+    basis = [table[1<<k] for k in range(8)]
+    bases = [basis]
+    for k in range(1, slices):
+        if rev:
+            basis = [(x >> 8) ^ table[x & 0xFF] for x in basis]
+        else:
+            basis = [((x << 8) & mask) ^ table[x >> shift] for x in basis]
+        bases.append(basis)
+    return bases
+
+def _mkSliceTable(table, n, rev, slices):
+    result = []
+    for basis in _sliceBases(table, n, rev, slices):
+        result.extend(_expandTable(basis))
+    return result
+
+def _packSliceTable(table, n, rev, slices):
+    typeCode = _typeCode(n)
+    np = sys.modules.get('numpy')
+    if np is None:
+        import struct
+        sliceList = _mkSliceTable(table, n, rev, slices)
+        return struct.pack('%d%s' % (len(sliceList), typeCode), *sliceList)
+
+    bases = np.array(_sliceBases(table, n, rev, slices), dtype=np.uint64)
+    result = np.zeros((slices, 256), dtype=np.uint64)
+    for k in range(8):
+        result[:, 1<<k:2<<k] = result[:, :1<<k] ^ bases[:, k:k+1]
+    return result.astype(typeCode).tobytes()
+
+#-----------------------------------------------------------------------------
+# On processors with a carry-less multiply instruction, the extension module
+# folds large buffers down to 16 bytes before using the tables.  Any
+# polynomial can be used since the folding only needs a few powers of x
+# modulo the polynomial.  See _crcfunext.c for a description of the method.
+#
+# The constants are returned packed as four 64-bit values.  For the bit
+# reversed algorithms, the constants are bit reversed and the exponents are
+# reduced by one to compensate for the shift that is introduced when
+# multiplying bit reversed values.
+
+def _xpowmod(e, poly, n):
+    r = 1
+    for i in range(e):
+        r = r << 1
+        if r >> n:
+            r = r ^ poly
+    return r
+
+def _mkFoldConsts(poly, n, rev):
+    import struct
+    if rev:
+        consts = [_bitrev(_xpowmod(e, poly, n), 64) for e in (191, 127, 575, 511)]
+    else:
+        consts = [_xpowmod(e, poly, n) for e in (192, 128, 576, 512)]
+    return struct.pack('4Q', *consts)
+
+#-----------------------------------------------------------------------------
+# CRC combination.  Running the CRC over n zero bytes multiplies the shift
+# register by x^(8n) modulo the polynomial, and the CRC of a concatenation is
+# found by appending zeros to the first message:
+#
+#   crc(A+B) = shift(crc(A) ^ initCrc, len(B)) ^ crc(B)
+#
+# The final XOR values cancel, and the initial value is removed from crc(A)
+# because crc(B) already accounts for it.  The power of x is computed by
+# repeated squaring so the combination takes O(log n) time.  The registers of
+# the bit reversed algorithms are reversed before the multiplication.
+
+def _mulmod(a, b, poly, n):
+    r = 0
+    while b:
+        if b & 1:
+            r = r ^ a
+        b = b >> 1
+        a = a << 1
+        if a >> n:
+            a = a ^ poly
+    return r
+
+def _xpow8nmod(nBytes, poly, n):
+    r = 1
+    sq = _xpowmod(8, poly, n)
+    while nBytes:
+        if nBytes & 1:
+            r = _mulmod(r, sq, poly, n)
+        sq = _mulmod(sq, sq, poly, n)
+        nBytes = nBytes >> 1
+    return r
+
+def _applyShift(crc, shift, poly, n, rev):
+    if rev:
+        crc = _bitrev(crc, n)
+    crc = _mulmod(crc, shift, poly, n)
+    if rev:
+        crc = _bitrev(crc, n)
+    return crc
+
+def _crcShift(crc, nBytes, poly, n, rev):
+    return _applyShift(crc, _xpow8nmod(nBytes, poly, n), poly, n, rev)
+
+# Crc.updateParallel does not split buffers into chunks smaller than this.
+_parallelMinChunk = 1 << 20
+
+def _combine(poly, n, rev, initCrc, crcA, crcB, lenB):
+    if lenB < 0:
+        raise ValueError('lenB must not be negative')
+    return _crcShift(crcA ^ initCrc, lenB, poly, n, rev) ^ crcB
+
+# Appending zero bytes shifts the register, which is the CRC without the
+# final XOR value.
+def _zeros(poly, n, rev, xorOut, crc, nBytes):
+    if nBytes < 0:
+        raise ValueError('the number of zero bytes must not be negative')
+    return _crcShift(crc ^ xorOut, nBytes, poly, n, rev) ^ xorOut
+
+#-----------------------------------------------------------------------------
+# Read a file object from its current position to the end and update the Crc
+# instance crc.  Regular files large enough to make it worthwhile are mapped
+# into memory and processed in one call.  This only applies to the file
+# objects returned by open in binary mode, whose data is the contents of the
+# file descriptor.  Other objects with a fileno method, such as
+# gzip.GzipFile, are only read through their read methods.  Other files are read into a single
+# buffer with readinto, after advising the kernel that the access is
+# sequential.
+#
+# Sparse files, those with fewer blocks allocated than their size, are walked
+# with SEEK_DATA and SEEK_HOLE where the system supports them.  The holes are
+# added with Crc.updateZeros without reading them, and the data extents are
+# read with pread or mapped, so the file offset moved by lseek does not
+# matter until the end, where it is set with the file object.
+
+_fileBufferSize = 1 << 20
+
+_mmapThreshold = 1 << 24
+
+def _updateFile(crc, f, bufferSize):
+    fd = _rawFileno(f)
+
+    if fd is not None:
+        import stat
+        st = os.fstat(fd)
+        if stat.S_ISREG(st.st_mode):
+            pos = f.tell()
+            if (hasattr(os, 'SEEK_HOLE') and hasattr(os, 'preadv') and
+                    hasattr(st, 'st_blocks') and
+                    st.st_blocks*512 < st.st_size - pos):
+                _updateSparse(crc, fd, pos, st.st_size, bufferSize)
+                os.lseek(fd, st.st_size, os.SEEK_SET)
+                f.seek(st.st_size)
+                return
+            if st.st_size - pos >= _mmapThreshold:
+                _updateMmap(crc, fd, pos, st.st_size)
+                f.seek(st.st_size)
+                return
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(fd, pos, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    if bufferSize is None:
+        bufferSize = _fileBufferSize
+    if bufferSize <= 0:
+        raise ValueError('bufferSize must be positive')
+
+    readinto = getattr(f, 'readinto', None)
+    if readinto is None:
+        while True:
+            data = f.read(bufferSize)
+            if not data:
+                break
+            crc.update(data)
+        return
+
+    buf = bytearray(bufferSize)
+    with memoryview(buf) as view:
+        while True:
+            n = readinto(buf)
+            if not n:
+                break
+            crc.update(view[:n])
+
+# Return the file descriptor holding the data of the file object f, or None
+# if its data may differ from that of its file descriptor.
+
+def _rawFileno(f):
+    raw = f
+    if isinstance(f, (io.BufferedReader, io.BufferedRandom)):
+        raw = f.raw
+    if not isinstance(raw, io.FileIO):
+        return None
+    try:
+        return f.fileno()
+    except (OSError, ValueError):
+        return None
+
+def _updateMmap(crc, fd, pos, end):
+    import mmap
+    # The mapping must start on a multiple of the allocation granularity.
+    offset = pos - pos % mmap.ALLOCATIONGRANULARITY
+    with mmap.mmap(fd, end - offset, access=mmap.ACCESS_READ,
+                   offset=offset) as m:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            m.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(m) as view:
+            with view[pos - offset:] as data:
+                crc.update(data)
+
+def _updateSparse(crc, fd, pos, size, bufferSize):
+    import errno
+    if bufferSize is None:
+        bufferSize = _fileBufferSize
+    if bufferSize <= 0:
+        raise ValueError('bufferSize must be positive')
+    buf = None
+    while pos < size:
+        try:
+            start = os.lseek(fd, pos, os.SEEK_DATA)
+        except OSError as e:
+            # ENXIO means there is no data after pos.
+            if e.errno != errno.ENXIO:
+                raise
+            start = size
+        start = min(start, size)
+        crc.updateZeros(start - pos)
+        if start >= size:
+            break
+        end = min(os.lseek(fd, start, os.SEEK_HOLE), size)
+        if end - start >= _mmapThreshold:
+            _updateMmap(crc, fd, start, end)
+        else:
+            if buf is None:
+                buf = bytearray(bufferSize)
+            with memoryview(buf) as view:
+                pos = start
+                while pos < end:
+                    n = os.preadv(fd, [view[:min(bufferSize, end - pos)]], pos)
+                    if not n:
+                        # The file was truncated while it was being read.
+                        return
+                    crc.update(view[:n])
+                    pos += n
+        pos = end
+
+#-----------------------------------------------------------------------------
+# CRC-32C has its own kernel since it is computed with the crc32 instruction
+# on processors that support SSE4.2.  Any CRC using this polynomial with the
+# bit reversed algorithm is routed to it.
+
+_crc32cPoly = 0x11EDC6F41
 
 #-----------------------------------------------------------------------------
 # Build a mapping of size to struct module type code.  This table is
 # constructed dynamically so that it has the best chance of picking the best
 # code to use for the platform we are running on.  This should properly adapt
-# to 32 and 64 bit machines.
+# to 32 and 64 bit machines.  It is filled in by the first call of _typeCode.
 
 _sizeToTypeCode = {}
 
-for typeCode in 'B H I L Q'.split():
-    size = {1:8, 2:16, 4:32, 8:64}.get(struct.calcsize(typeCode),None)
-    if size is not None and size not in _sizeToTypeCode:
-        _sizeToTypeCode[size] = '256%s' % typeCode
-
-_sizeToTypeCode[24] = _sizeToTypeCode[32]
-
-del typeCode, size
+def _typeCode(sizeBits):
+    if not _sizeToTypeCode:
+        import struct
+        for typeCode in 'B H I L Q'.split():
+            size = {1:8, 2:16, 4:32, 8:64}.get(struct.calcsize(typeCode),None)
+            if size is not None and size not in _sizeToTypeCode:
+                _sizeToTypeCode[size] = typeCode
+        _sizeToTypeCode[24] = _sizeToTypeCode[32]
+    return _sizeToTypeCode[sizeBits]
 
 #-----------------------------------------------------------------------------
 # The following function validates the parameters of the CRC, namely,
@@ -404,36 +1398,111 @@ def _verifyParams(poly, initCrc, xorOut):
     return (sizeBits, initCrc, xorOut)
 
 #-----------------------------------------------------------------------------
-# The following function returns a Python function to compute the CRC.
+# The following function returns a Python callable to compute the CRC.
 #
 # It must be passed parameters that are already verified & sanitized by
 # _verifyParams().
 #
-# The returned function calls a low level function that is written in C if the
-# extension module could be loaded.  Otherwise, a Python implementation is
+# The returned callable is a CrcFun object from the extension module if it
+# could be loaded.  It holds the tables and parameters in native form so that
+# each call has little overhead.  Otherwise, the Python implementation is
 # used.
 #
-# In addition to this function, a list containing the CRC table is returned.
+# When the extension module is used, the slicing tables are packed along with
+# the CRC table so that large buffers can be processed several bytes at a time.
+#
+# In addition to the callable, a list containing the CRC table is returned.
+# The engine attribute of the callable names the implementation used for
+# large buffers:
+#   'python'  -- the Python implementation (extension module not available)
+#   'numpy'   -- the NumPy implementation (extension module not available)
+#   'table'   -- the extension module using the byte-wise table
+#   'slicing' -- the extension module using slicing-by-8/16 tables
+#   'clmul'   -- the extension module using the carry-less multiply folding
+#   'sse42'   -- the extension module using the crc32 instruction (CRC-32C)
+
+# The tables only depend on the polynomial and the bit order, so they are
+# kept in a process-wide LRU cache shared by Crc, mkCrcFun and the predefined
+# module.  The cached values must not be modified.  The cache wraps _mkTables
+# and is created on first use.
+
+_tableCacheSize = 64
+
+_cachedTables = None
+
+def _tableCache():
+    global _cachedTables
+    if _cachedTables is None:
+        import functools
+        _cachedTables = functools.lru_cache(maxsize=_tableCacheSize)(_mkTables)
+    return _cachedTables
+
+def _mkTables(poly, sizeBits, rev):
+    if _usingExtension:
+        # The extension module has static tables for the polynomials used by
+        # the predefined algorithms.  See mkPredefinedTables.py.
+        mask = (1<<sizeBits) - 1
+        static = _crcfun._predefinedTable(sizeBits, poly & mask, rev,
+                                          _sliceCount)
+        if static is not None:
+            import struct
+            (table, consts) = static
+            typeCode = _typeCode(sizeBits)
+            size = struct.calcsize(typeCode)
+            tableList = list(struct.unpack('256' + typeCode, table[:256*size]))
+            if not _useClmul:
+                consts = None
+            return tableList, table, consts
 
-def _mkCrcFun(poly, sizeBits, initCrc, rev, xorOut):
     if rev:
         tableList = _mkTable_r(poly, sizeBits)
-        _fun = _sizeMap[sizeBits][1]
     else:
         tableList = _mkTable(poly, sizeBits)
-        _fun = _sizeMap[sizeBits][0]
 
-    _table = tableList
+    table = tableList
+    consts = None
     if _usingExtension:
-        _table = struct.pack(_sizeToTypeCode[sizeBits], *tableList)
-
-    if xorOut == 0:
-        def crcfun(data, crc=initCrc, table=_table, fun=_fun):
-            return fun(data, crc, table)
+        table = _packSliceTable(tableList, sizeBits, rev, _sliceCount)
+        if _useClmul:
+            consts = _mkFoldConsts(poly, sizeBits, rev)
+    return tableList, table, consts
+
+def _mkCrcFun(poly, sizeBits, initCrc, rev, xorOut, backend=None):
+    if not _backendLoaded:
+        _loadBackend()
+    (tableList, table, consts) = _tableCache()(poly, sizeBits, bool(rev))
+    crc32c = bool(rev) and poly == _crc32cPoly
+    if backend is None:
+        backend = _defaultEngine
+        if backend == 'sse42' and not crc32c:
+            backend = None
+    if backend is None:
+        crcfun = _crcfun.CrcFun(sizeBits, rev, table, initCrc, xorOut, consts,
+                                crc32c)
+        return crcfun, tableList
+
+    module = _engineModule(backend)
+    if module.__name__ != 'crcmod._crcfunext':
+        crcfun = module.CrcFun(sizeBits, rev, tableList, initCrc, xorOut)
+        return crcfun, tableList
+
+    # Select the engine of the extension module through the tables and
+    # constants it is given.
+    if backend == 'sse42' and not crc32c:
+        raise ValueError('the sse42 engine only computes CRC-32C')
+    if not _usingExtension:
+        table = _packSliceTable(tableList, sizeBits, rev, _sliceCount)
+        consts = None
+    if backend == 'table':
+        import struct
+        table = table[:256*struct.calcsize(_typeCode(sizeBits))]
+    if backend in ('sse42', 'clmul'):
+        if consts is None:
+            consts = _mkFoldConsts(poly, sizeBits, rev)
     else:
-        def crcfun(data, crc=initCrc, table=_table, fun=_fun):
-            return xorOut ^ fun(data, xorOut ^ crc, table)
-
+        consts = None
+    crcfun = module.CrcFun(sizeBits, rev, table, initCrc, xorOut, consts,
+                           backend == 'sse42')
     return crcfun, tableList
 
 #-----------------------------------------------------------------------------
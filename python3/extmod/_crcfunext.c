@@ -28,6 +28,7 @@
 
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#include <structmember.h>
 
 // Note: the type declarations are set up to work on 32-bit and 64-bit
 // platforms using the GNU C compiler.  They may need to be adjusted for other
@@ -40,37 +41,89 @@ typedef unsigned int UINT32;
 typedef unsigned long long UINT64;
 
 // Define some macros for the data format strings.  The INPUT strings are for
-// decoding the input parameters to the function which are (data, crc, table).
-
-#define INPUT8 "OBs#"
-#define INPUT16 "OHs#"
-#define INPUT32 "OIs#"
-#define INPUT64 "OKs#"
+// decoding the input parameters to the function which are
+// (data, crc, table[, consts]).
+
+#define INPUT8 "OBs#|z#"
+#define INPUT16 "OHs#|z#"
+#define INPUT32 "OIs#|z#"
+#define INPUT64 "OKs#|z#"
+
+// The carry-less multiply instructions are only available on x86 processors.
+// The compiler must be able to generate them for individual functions since
+// the extension module is not built for a specific processor.
+
+#if defined(__GNUC__) && (defined(__x86_64__) || defined(__i386__))
+#include <cpuid.h>
+#include <immintrin.h>
+#define HAVE_X86_INTRINSICS
+#define TARGET(features) __attribute__((target(features)))
+#elif defined(_MSC_VER) && (defined(_M_X64) || defined(_M_IX86))
+#include <intrin.h>
+#define HAVE_X86_INTRINSICS
+#define TARGET(features)
+#endif
+
+// Processor features detected when the module is initialized.
+static int hasClmul = 0;
+static int hasSse42 = 0;
+
+// The GIL is released while computing the CRC of buffers of at least this
+// many bytes so that other threads can run.  For smaller buffers the cost of
+// releasing and reacquiring the GIL outweighs the benefit.  The default is
+// the same as the one used by the hashlib module.
+static Py_ssize_t gilThreshold = 2048;
+
+// Run a kernel, releasing the GIL if the buffer is large enough.  The buffer
+// stays locked by its Py_buffer and the tables are owned by the argument
+// tuple, so neither can go away while the GIL is released.
+#define RUN_KERNEL(result, call) do { \
+        if (dataLen >= gilThreshold) { \
+            Py_BEGIN_ALLOW_THREADS \
+            result = call; \
+            Py_END_ALLOW_THREADS \
+        } else { \
+            result = call; \
+        } \
+    } while(0)
 
-// The following macro is taken from hashlib.h in the Python 3.1 code,
-// providing "Common code for use by all hashlib related modules".
+// The following is adapted from the macro in hashlib.h in the Python 3.1
+// code, providing "Common code for use by all hashlib related modules".
 
 // Given a PyObject* obj, fill in the Py_buffer* viewp with the result
-// of PyObject_GetBuffer.  Sets an exception and issues a return NULL
-// on any errors.
+// of PyObject_GetBuffer.  Sets an exception and returns -1 on any errors.
+static int
+getBufferView(PyObject* obj, Py_buffer* viewp)
+{
+    if (PyUnicode_Check(obj))
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "Unicode-objects must be encoded before calculating a CRC");
+        return -1;
+    }
+    if (!PyObject_CheckBuffer(obj))
+    {
+        PyErr_SetString(PyExc_TypeError,
+                        "object supporting the buffer API required");
+        return -1;
+    }
+    if (PyObject_GetBuffer(obj, viewp, PyBUF_SIMPLE) == -1)
+    {
+        return -1;
+    }
+    if (viewp->ndim > 1)
+    {
+        PyErr_SetString(PyExc_BufferError,
+                        "Buffer must be single dimension");
+        PyBuffer_Release(viewp);
+        return -1;
+    }
+    return 0;
+}
+
+// Same as above, but issues a return NULL on any errors.
 #define GET_BUFFER_VIEW_OR_ERROUT(obj, viewp) do { \
-        if (PyUnicode_Check((obj))) { \
-            PyErr_SetString(PyExc_TypeError, \
-                            "Unicode-objects must be encoded before calculating a CRC");\
-            return NULL; \
-        } \
-        if (!PyObject_CheckBuffer((obj))) { \
-            PyErr_SetString(PyExc_TypeError, \
-                            "object supporting the buffer API required"); \
-            return NULL; \
-        } \
-        if (PyObject_GetBuffer((obj), (viewp), PyBUF_SIMPLE) == -1) { \
-            return NULL; \
-        } \
-        if ((viewp)->ndim > 1) { \
-            PyErr_SetString(PyExc_BufferError, \
-                            "Buffer must be single dimension"); \
-            PyBuffer_Release((viewp)); \
+        if (getBufferView((obj), (viewp)) < 0) { \
             return NULL; \
         } \
     } while(0);
@@ -83,13 +136,511 @@ typedef unsigned long long UINT64;
 #define BYTE3(x) ((UINT8)((x) >> 24))
 #define BYTE7(x) ((UINT8)((x) >> 56))
 
+//-----------------------------------------------------------------------------
+// CRC kernels shared by the Python callable functions below.
+//
+// The table argument holds nTables tables of 256 entries each, stored back to
+// back.  Table k contains the CRC of every byte value followed by k zero
+// bytes, so table 0 is the usual byte-wise table.  When 8 or 16 tables are
+// supplied, the kernels use the "slicing-by-N" algorithm for large buffers:
+// the CRC register is folded into the next N data bytes and each of those
+// bytes is looked up in its own table.  The N lookups are independent of each
+// other, which removes the serial dependency of the byte-wise loop.  The
+// result is bit-identical to the byte-wise algorithm.
+//
+// Buffers shorter than slice8Min bytes are processed byte-wise, since the
+// slicing tables are unlikely to be in the cache for such small inputs.
+//
+// The thresholds at which the kernels switch algorithms are kept for each CRC
+// width, indexed by the width in bytes, so that crcmod.tune can set them for
+// the processor.  See _setThresholds.
+
+static Py_ssize_t slice8Min[9] = {0, 16, 16, 16, 16, 0, 0, 0, 16};
+static Py_ssize_t slice16Min[9] = {0, 512, 512, 512, 512, 0, 0, 0, 512};
+static Py_ssize_t foldMin[9] = {0, 256, 256, 256, 256, 0, 0, 0, 256};
+
+// Return the number of 256 entry tables held in a table string of the given
+// length, or 0 if the length does not describe 1, 8 or 16 tables.
+
+static int
+tableCount(Py_ssize_t tableLen, size_t entrySize)
+{
+    Py_ssize_t size = 256*(Py_ssize_t)entrySize;
+
+    if (tableLen == size) return 1;
+    if (tableLen == 8*size) return 8;
+    if (tableLen == 16*size) return 16;
+    return 0;
+}
+
+// Process SLICES bytes per iteration.  Byte i of the data is combined with
+// byte i of the CRC register in the order the register is shifted out (low
+// byte first for the bit reversed algorithms, high byte first otherwise).
+
+#define SLICE_LOOP(TYPE, WIDTH, REV, SLICES) \
+    while (dataLen >= (SLICES)) \
+    { \
+        TYPE c = 0; \
+        int i; \
+        for (i = 0; i < (SLICES); i++) \
+        { \
+            UINT8 b = data[i]; \
+            if (i < (WIDTH)/8) \
+            { \
+                b ^= (REV) ? (UINT8)(crc >> (8*i)) \
+                           : (UINT8)(crc >> ((WIDTH) - 8 - 8*i)); \
+            } \
+            c ^= table[((SLICES) - 1 - i)*256 + b]; \
+        } \
+        crc = c; \
+        data += (SLICES); \
+        dataLen -= (SLICES); \
+    }
+
+//-----------------------------------------------------------------------------
+// Folding engine using the carry-less multiply (PCLMULQDQ) instruction.
+//
+// The buffer is viewed as a polynomial M over GF(2) made of 128-bit blocks.
+// Multiplying a 128-bit value by x^T modulo the generator polynomial P only
+// requires the two constants x^(T+64) mod P and x^T mod P, one for each
+// 64-bit half.  Since P has degree at most 64, each product fits in 128 bits
+// so the folded value can be XORed into the block that is T bits further on.
+// Four accumulators are folded across 512 bits in the main loop and are then
+// folded into each other across 128 bits.  The final 128-bit value has the
+// same remainder modulo P as the whole buffer, so its CRC (starting from
+// zero) is the CRC of the buffer.  That last step is done with the tables.
+//
+// The constants are computed by crcmod for each polynomial and passed in as
+// four 64-bit values: the pair for a 128-bit fold followed by the pair for a
+// 512-bit fold.  The first value of each pair multiplies the half of the
+// block holding the higher powers of x.
+//
+// For the bit reversed algorithms the blocks are used as loaded, and the
+// constants are bit reversed.  The product of two bit reversed 64-bit values
+// is the bit reversed product shifted by one bit, which crcmod accounts for
+// by computing x^(T-1) mod P instead of x^T mod P.  For the forward
+// algorithms the bytes of each block are reversed so that the first byte
+// holds the highest powers of x.
+
+// foldBlocks needs at least this many bytes.
+#define FOLD_BLOCK_MIN 64
+
+#if defined(HAVE_X86_INTRINSICS)
+
+#define FOLD_LOAD(p) (rev ? _mm_loadu_si128((const __m128i*)(p)) : \
+        _mm_shuffle_epi8(_mm_loadu_si128((const __m128i*)(p)), swap))
+
+#define FOLD(x, k) (rev ? \
+        _mm_xor_si128(_mm_clmulepi64_si128((x), (k), 0x00), \
+                      _mm_clmulepi64_si128((x), (k), 0x11)) : \
+        _mm_xor_si128(_mm_clmulepi64_si128((x), (k), 0x01), \
+                      _mm_clmulepi64_si128((x), (k), 0x10)))
+
+// Fold the data down to 16 bytes stored in rem.  The initial crc is combined
+// with the first block.  Returns the number of bytes consumed, which is a
+// multiple of 16.  The caller must supply at least 64 bytes.
+
+TARGET("pclmul,ssse3")
+static Py_ssize_t
+foldBlocks(const UINT64* consts, int width, int rev, UINT64 crc,
+        const UINT8* data, Py_ssize_t dataLen, UINT8* rem)
+{
+    const __m128i swap = _mm_set_epi8(0, 1, 2, 3, 4, 5, 6, 7,
+                                      8, 9, 10, 11, 12, 13, 14, 15);
+    const __m128i k128 = _mm_set_epi64x((long long)consts[1],
+                                        (long long)consts[0]);
+    const __m128i k512 = _mm_set_epi64x((long long)consts[3],
+                                        (long long)consts[2]);
+    const UINT8* p = data;
+    __m128i x0, x1, x2, x3;
+
+    if (rev)
+    {
+        x0 = _mm_set_epi64x(0, (long long)crc);
+    }
+    else
+    {
+        x0 = _mm_set_epi64x((long long)(crc << (64 - width)), 0);
+    }
+
+    x0 = _mm_xor_si128(x0, FOLD_LOAD(p));
+    x1 = FOLD_LOAD(p + 16);
+    x2 = FOLD_LOAD(p + 32);
+    x3 = FOLD_LOAD(p + 48);
+    p += 64;
+    dataLen -= 64;
+
+    while (dataLen >= 64)
+    {
+        x0 = _mm_xor_si128(FOLD(x0, k512), FOLD_LOAD(p));
+        x1 = _mm_xor_si128(FOLD(x1, k512), FOLD_LOAD(p + 16));
+        x2 = _mm_xor_si128(FOLD(x2, k512), FOLD_LOAD(p + 32));
+        x3 = _mm_xor_si128(FOLD(x3, k512), FOLD_LOAD(p + 48));
+        p += 64;
+        dataLen -= 64;
+    }
+
+    x1 = _mm_xor_si128(FOLD(x0, k128), x1);
+    x2 = _mm_xor_si128(FOLD(x1, k128), x2);
+    x3 = _mm_xor_si128(FOLD(x2, k128), x3);
+
+    while (dataLen >= 16)
+    {
+        x3 = _mm_xor_si128(FOLD(x3, k128), FOLD_LOAD(p));
+        p += 16;
+        dataLen -= 16;
+    }
+
+    if (!rev)
+    {
+        x3 = _mm_shuffle_epi8(x3, swap);
+    }
+    _mm_storeu_si128((__m128i*)rem, x3);
+
+    return p - data;
+}
+
+#else
+
+static Py_ssize_t
+foldBlocks(const UINT64* consts, int width, int rev, UINT64 crc,
+        const UINT8* data, Py_ssize_t dataLen, UINT8* rem)
+{
+    return 0;
+}
+
+#endif
+
+// Set the processor feature flags.
+
+static void
+detectCpuFeatures(void)
+{
+#if defined(HAVE_X86_INTRINSICS)
+    unsigned int regs[4] = {0, 0, 0, 0};
+
+#if defined(_MSC_VER)
+    __cpuid((int*)regs, 1);
+#else
+    if (!__get_cpuid(1, &regs[0], &regs[1], &regs[2], &regs[3]))
+    {
+        return;
+    }
+#endif
+
+    // ECX bit 1 is PCLMULQDQ and bit 9 is SSSE3 (used for byte swapping).
+    hasClmul = ((regs[2] >> 1) & 1) && ((regs[2] >> 9) & 1);
+
+    // ECX bit 20 is SSE4.2, which includes the CRC-32C instruction.
+    hasSse42 = (regs[2] >> 20) & 1;
+#endif
+}
+
+//-----------------------------------------------------------------------------
+// Define the kernel for each CRC size.  NAME##Table uses only the tables.
+// NAME uses the folding engine first when fold constants are supplied.
+// NAME##Any has the same signature for every size so that it can be called
+// through a KernelFunc pointer.
+
+typedef UINT64 (*KernelFunc)(const void* table, int nTables,
+        const UINT64* consts, const UINT8* data, Py_ssize_t dataLen,
+        UINT64 crc);
+
+#define DEFINE_KERNEL(NAME, TYPE, WIDTH, REV, MASK) \
+static TYPE \
+NAME##Table(const TYPE* table, int nTables, const UINT8* data, \
+        Py_ssize_t dataLen, TYPE crc) \
+{ \
+    crc = crc & (MASK); \
+    if (nTables >= 16 && dataLen >= slice16Min[(WIDTH)/8]) \
+    { \
+        SLICE_LOOP(TYPE, WIDTH, REV, 16) \
+    } \
+    if (nTables >= 8 && dataLen >= slice8Min[(WIDTH)/8]) \
+    { \
+        SLICE_LOOP(TYPE, WIDTH, REV, 8) \
+    } \
+    while (dataLen--) \
+    { \
+        if (REV) \
+            crc = table[*data ^ (UINT8)crc] ^ (TYPE)(crc >> 8); \
+        else \
+            crc = table[*data ^ (UINT8)(crc >> ((WIDTH) - 8))] ^ \
+                    (TYPE)(crc << 8); \
+        data++; \
+    } \
+    return crc & (MASK); \
+} \
+\
+static TYPE \
+NAME(const TYPE* table, int nTables, const UINT64* consts, \
+        const UINT8* data, Py_ssize_t dataLen, TYPE crc) \
+{ \
+    UINT8 rem[16]; \
+    Py_ssize_t n; \
+    if (consts != NULL && hasClmul && dataLen >= foldMin[(WIDTH)/8]) \
+    { \
+        n = foldBlocks(consts, (WIDTH), (REV), crc & (MASK), data, dataLen, \
+                rem); \
+        crc = NAME##Table(table, nTables, rem, 16, 0); \
+        data += n; \
+        dataLen -= n; \
+    } \
+    return NAME##Table(table, nTables, data, dataLen, crc); \
+} \
+\
+static UINT64 \
+NAME##Any(const void* table, int nTables, const UINT64* consts, \
+        const UINT8* data, Py_ssize_t dataLen, UINT64 crc) \
+{ \
+    return NAME((const TYPE*)table, nTables, consts, data, dataLen, \
+            (TYPE)crc); \
+}
+
+DEFINE_KERNEL(crc8Kernel,   UINT8,   8, 0, 0xFFU)
+DEFINE_KERNEL(crc8rKernel,  UINT8,   8, 1, 0xFFU)
+DEFINE_KERNEL(crc16Kernel,  UINT16, 16, 0, 0xFFFFU)
+DEFINE_KERNEL(crc16rKernel, UINT16, 16, 1, 0xFFFFU)
+DEFINE_KERNEL(crc24Kernel,  UINT32, 24, 0, 0xFFFFFFU)
+DEFINE_KERNEL(crc24rKernel, UINT32, 24, 1, 0xFFFFFFU)
+DEFINE_KERNEL(crc32Kernel,  UINT32, 32, 0, 0xFFFFFFFFU)
+DEFINE_KERNEL(crc32rKernel, UINT32, 32, 1, 0xFFFFFFFFU)
+DEFINE_KERNEL(crc64Kernel,  UINT64, 64, 0, 0xFFFFFFFFFFFFFFFFULL)
+DEFINE_KERNEL(crc64rKernel, UINT64, 64, 1, 0xFFFFFFFFFFFFFFFFULL)
+
+//-----------------------------------------------------------------------------
+// CRC-32C (polynomial 0x11EDC6F41, bit reversed) is built into processors
+// that support SSE4.2 as the crc32 instruction.  The instruction has a
+// throughput of one per cycle but a latency of three cycles, so large buffers
+// are split into three streams that are computed at the same time.  The CRCs
+// of the streams are then combined by shifting the CRC of a stream over the
+// length of the following stream, which is done with tables of the operator
+// for that many zero bytes.  This is the method used by Mark Adler in his
+// crc32c.c.
+//
+// Like the other kernels, this works on the CRC register directly.  The
+// initial and final XOR are applied by crcmod.
+
+#define CRC32C_POLY   0x82F63B78U
+#define CRC32C_LONG   8192
+#define CRC32C_SHORT  256
+
+static UINT32 crc32cLong[4][256];
+static UINT32 crc32cShort[4][256];
+
+// Multiply a vector by a 32x32 matrix over GF(2).
+
+static UINT32
+gf2MatrixTimes(const UINT32* mat, UINT32 vec)
+{
+    UINT32 sum = 0;
+
+    while (vec)
+    {
+        if (vec & 1)
+        {
+            sum ^= *mat;
+        }
+        vec >>= 1;
+        mat++;
+    }
+    return sum;
+}
+
+static void
+gf2MatrixSquare(UINT32* square, const UINT32* mat)
+{
+    int n;
+
+    for (n = 0; n < 32; n++)
+    {
+        square[n] = gf2MatrixTimes(mat, mat[n]);
+    }
+}
+
+// Build the tables that shift a CRC over len zero bytes, where len is a power
+// of two.  The operator is built by repeated squaring, starting from the
+// operator for one zero bit.
+
+static void
+crc32cZeros(UINT32 zeros[4][256], size_t len)
+{
+    UINT32 even[32];
+    UINT32 odd[32];
+    UINT32 row = 1;
+    int n;
+
+    odd[0] = CRC32C_POLY;
+    for (n = 1; n < 32; n++)
+    {
+        odd[n] = row;
+        row <<= 1;
+    }
+
+    // Operators for two, then four zero bits.
+    gf2MatrixSquare(even, odd);
+    gf2MatrixSquare(odd, even);
+
+    // Each square doubles the number of zero bytes, starting from one, until
+    // len (a power of two) has been shifted down to zero.
+    do
+    {
+        gf2MatrixSquare(even, odd);
+        len >>= 1;
+        if (len == 0)
+        {
+            break;
+        }
+        gf2MatrixSquare(odd, even);
+        len >>= 1;
+        if (len == 0)
+        {
+            memcpy(even, odd, sizeof(even));
+        }
+    } while (len);
+
+    for (n = 0; n < 256; n++)
+    {
+        zeros[0][n] = gf2MatrixTimes(even, n);
+        zeros[1][n] = gf2MatrixTimes(even, n << 8);
+        zeros[2][n] = gf2MatrixTimes(even, n << 16);
+        zeros[3][n] = gf2MatrixTimes(even, (UINT32)n << 24);
+    }
+}
+
+static UINT32
+crc32cShift(UINT32 zeros[4][256], UINT32 crc)
+{
+    return zeros[0][BYTE0(crc)] ^ zeros[1][BYTE1(crc)] ^
+           zeros[2][BYTE2(crc)] ^ zeros[3][BYTE3(crc)];
+}
+
+#if defined(HAVE_X86_INTRINSICS)
+
+// Use 8 bytes per instruction on 64-bit processors and 4 bytes otherwise.
+#if defined(__x86_64__) || defined(_M_X64)
+typedef UINT64 CRC32C_WORD;
+#define CRC32C_STEP(crc, p) _mm_crc32_u64((crc), loadWord(p))
+#else
+typedef UINT32 CRC32C_WORD;
+#define CRC32C_STEP(crc, p) _mm_crc32_u32((crc), loadWord(p))
+#endif
+
+static CRC32C_WORD
+loadWord(const UINT8* p)
+{
+    CRC32C_WORD w;
+    memcpy(&w, p, sizeof(w));
+    return w;
+}
+
+TARGET("sse4.2")
+static UINT32
+crc32cHardware(const UINT8* data, Py_ssize_t dataLen, UINT32 crc)
+{
+    CRC32C_WORD crc0 = crc;
+    CRC32C_WORD crc1;
+    CRC32C_WORD crc2;
+    const UINT8* end;
+
+    // Bring the data pointer to a word boundary.
+    while (dataLen > 0 && ((size_t)data & (sizeof(CRC32C_WORD) - 1)) != 0)
+    {
+        crc0 = _mm_crc32_u8((UINT32)crc0, *data);
+        data++;
+        dataLen--;
+    }
+
+    while (dataLen >= 3*CRC32C_LONG)
+    {
+        crc1 = 0;
+        crc2 = 0;
+        end = data + CRC32C_LONG;
+        do
+        {
+            crc0 = CRC32C_STEP(crc0, data);
+            crc1 = CRC32C_STEP(crc1, data + CRC32C_LONG);
+            crc2 = CRC32C_STEP(crc2, data + 2*CRC32C_LONG);
+            data += sizeof(CRC32C_WORD);
+        } while (data < end);
+        crc0 = crc32cShift(crc32cLong, (UINT32)crc0) ^ (UINT32)crc1;
+        crc0 = crc32cShift(crc32cLong, (UINT32)crc0) ^ (UINT32)crc2;
+        data += 2*CRC32C_LONG;
+        dataLen -= 3*CRC32C_LONG;
+    }
+
+    while (dataLen >= 3*CRC32C_SHORT)
+    {
+        crc1 = 0;
+        crc2 = 0;
+        end = data + CRC32C_SHORT;
+        do
+        {
+            crc0 = CRC32C_STEP(crc0, data);
+            crc1 = CRC32C_STEP(crc1, data + CRC32C_SHORT);
+            crc2 = CRC32C_STEP(crc2, data + 2*CRC32C_SHORT);
+            data += sizeof(CRC32C_WORD);
+        } while (data < end);
+        crc0 = crc32cShift(crc32cShort, (UINT32)crc0) ^ (UINT32)crc1;
+        crc0 = crc32cShift(crc32cShort, (UINT32)crc0) ^ (UINT32)crc2;
+        data += 2*CRC32C_SHORT;
+        dataLen -= 3*CRC32C_SHORT;
+    }
+
+    while (dataLen >= (Py_ssize_t)sizeof(CRC32C_WORD))
+    {
+        crc0 = CRC32C_STEP(crc0, data);
+        data += sizeof(CRC32C_WORD);
+        dataLen -= sizeof(CRC32C_WORD);
+    }
+
+    while (dataLen > 0)
+    {
+        crc0 = _mm_crc32_u8((UINT32)crc0, *data);
+        data++;
+        dataLen--;
+    }
+
+    return (UINT32)crc0;
+}
+
+#else
+
+static UINT32
+crc32cHardware(const UINT8* data, Py_ssize_t dataLen, UINT32 crc)
+{
+    return crc;
+}
+
+#endif
+
+static UINT32
+crc32cKernel(const UINT32* table, int nTables, const UINT64* consts,
+        const UINT8* data, Py_ssize_t dataLen, UINT32 crc)
+{
+    if (hasSse42)
+    {
+        return crc32cHardware(data, dataLen, crc);
+    }
+    return crc32rKernel(table, nTables, consts, data, dataLen, crc);
+}
+
+static UINT64
+crc32cKernelAny(const void* table, int nTables, const UINT64* consts,
+        const UINT8* data, Py_ssize_t dataLen, UINT64 crc)
+{
+    return crc32cKernel((const UINT32*)table, nTables, consts, data, dataLen,
+            (UINT32)crc);
+}
+
 //-----------------------------------------------------------------------------
 // Compute a 8-bit crc over the input data.
 // Inputs:
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 8-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -103,28 +654,34 @@ _crc8(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT8* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT8, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
-    {
-        crc = table[*data ^ crc];
-        data++;
-    }
+    RUN_KERNEL(crc, crc8Kernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -138,7 +695,8 @@ _crc8(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 8-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -152,28 +710,34 @@ _crc8r(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT8* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT8, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
-    {
-        crc = table[*data ^ crc];
-        data++;
-    }
+    RUN_KERNEL(crc, crc8rKernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -186,7 +750,8 @@ _crc8r(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 16-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -200,28 +765,34 @@ _crc16(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT16* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT16, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256*2)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
-    {
-        crc = table[*data ^ BYTE1(crc)] ^ (crc << 8);
-        data++;
-    }
+    RUN_KERNEL(crc, crc16Kernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -235,7 +806,8 @@ _crc16(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 16-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -249,28 +821,34 @@ _crc16r(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT16* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT16, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256*2)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
-    {
-        crc = table[*data ^ BYTE0(crc)] ^ (crc >> 8);
-        data++;
-    }
+    RUN_KERNEL(crc, crc16rKernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -283,7 +861,8 @@ _crc16r(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 24-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -297,28 +876,34 @@ _crc24(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT32* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT32, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256*4)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
-    {
-        crc = table[*data ^ BYTE2(crc)] ^ (crc << 8);
-        data++;
-    }
+    RUN_KERNEL(crc, crc24Kernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -332,7 +917,8 @@ _crc24(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 24-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -346,29 +932,34 @@ _crc24r(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT32* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT32, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256*4)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    crc = crc & 0xFFFFFFU;
-    while (dataLen--)
-    {
-        crc = table[*data ^ BYTE0(crc)] ^ (crc >> 8);
-        data++;
-    }
+    RUN_KERNEL(crc, crc24rKernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -381,7 +972,8 @@ _crc24r(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 32-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -395,28 +987,34 @@ _crc32(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT32* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT32, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256*4)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
-    {
-        crc = table[*data ^ BYTE3(crc)] ^ (crc << 8);
-        data++;
-    }
+    RUN_KERNEL(crc, crc32Kernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -430,7 +1028,8 @@ _crc32(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 32-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -444,29 +1043,92 @@ _crc32r(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT32* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT32, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256*4)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
+    RUN_KERNEL(crc, crc32rKernel(table, nTables, consts, data, dataLen, crc));
+
+    PyBuffer_Release(&buf);
+
+    return PyLong_FromUnsignedLong(crc);
+}
+
+//-----------------------------------------------------------------------------
+// Compute a CRC-32C over the input data.  This is the same as _crc32r, but
+// uses the crc32 instruction when the processor supports it.  The table must
+// correspond to the CRC-32C polynomial.
+// Inputs:
+//   data - string containing the data
+//   crc - unsigned integer containing the initial crc
+//   table - string containing the 32-bit table corresponding to the generator
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
+// Returns:
+//   crc - unsigned integer containing the resulting crc
+
+static PyObject*
+_crc32c(PyObject* self, PyObject* args)
+{
+    PyObject *obj;
+    Py_buffer buf;
+    UINT32 crc;
+    UINT8* data;
+    Py_ssize_t dataLen;
+    UINT32* table;
+    Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
+
+    if (!PyArg_ParseTuple(args, INPUT32, &obj, &crc,
+                            &table, &tableLen, &consts, &constsLen))
+    {
+        return NULL;
+    }
+
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
-        crc = table[*data ^ BYTE0(crc)] ^ (crc >> 8);
-        data++;
+        PyErr_SetString(PyExc_ValueError, "invalid CRC table");
+        return NULL;
+    }
+
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
     }
 
+    GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
+    data = buf.buf;
+    dataLen = buf.len;
+
+    RUN_KERNEL(crc, crc32cKernel(table, nTables, consts, data, dataLen, crc));
+
     PyBuffer_Release(&buf);
 
     return PyLong_FromUnsignedLong(crc);
@@ -478,7 +1140,8 @@ _crc32r(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 64-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -492,28 +1155,34 @@ _crc64(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT64* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT64, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256*8)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
-    {
-        crc = table[*data ^ BYTE7(crc)] ^ (crc << 8);
-        data++;
-    }
+    RUN_KERNEL(crc, crc64Kernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -527,7 +1196,8 @@ _crc64(PyObject* self, PyObject* args)
 //   data - string containing the data
 //   crc - unsigned integer containing the initial crc
 //   table - string containing the 64-bit table corresponding to the generator
-//           polynomial.
+//           polynomial, optionally followed by the slicing tables.
+//   consts - optional string containing the constants for the folding engine
 // Returns:
 //   crc - unsigned integer containing the resulting crc
 
@@ -541,28 +1211,34 @@ _crc64r(PyObject* self, PyObject* args)
     Py_ssize_t dataLen;
     UINT64* table;
     Py_ssize_t tableLen;
+    int nTables;
+    UINT64* consts = NULL;
+    Py_ssize_t constsLen = 0;
 
     if (!PyArg_ParseTuple(args, INPUT64, &obj, &crc,
-                            &table, &tableLen))
+                            &table, &tableLen, &consts, &constsLen))
     {
         return NULL;
     }
 
-    if (tableLen != 256*8)
+    nTables = tableCount(tableLen, sizeof(*table));
+    if (nTables == 0)
     {
         PyErr_SetString(PyExc_ValueError, "invalid CRC table");
         return NULL;
     }
 
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
     GET_BUFFER_VIEW_OR_ERROUT(obj, &buf);
     data = buf.buf;
     dataLen = buf.len;
 
-    while (dataLen--)
-    {
-        crc = table[*data ^ BYTE0(crc)] ^ (crc >> 8);
-        data++;
-    }
+    RUN_KERNEL(crc, crc64rKernel(table, nTables, consts, data, dataLen, crc));
 
     PyBuffer_Release(&buf);
 
@@ -570,8 +1246,1298 @@ _crc64r(PyObject* self, PyObject* args)
 }
 
 //-----------------------------------------------------------------------------
-static PyMethodDef methodTable[] = {
-{"_crc8", _crc8, METH_VARARGS},
+// CrcFun objects hold everything needed to compute a particular CRC: the
+// tables, the fold constants, the size and direction of the CRC, and the
+// initial and final XOR values.  They are the functions returned by
+// crcmod.mkCrcFun and are called as
+//
+//   crcfun(data, crc=initCrc)
+//
+// Since the tables are stored natively when the object is created, a call
+// only needs to get at the data, which makes calls for small buffers much
+// cheaper than going through the functions above.  On Python 3.9 and later,
+// the objects are called through the vectorcall protocol, which avoids
+// building an argument tuple.
+
+typedef struct {
+    PyObject_HEAD
+#if PY_VERSION_HEX >= 0x03090000
+    vectorcallfunc vectorcall;
+#endif
+    KernelFunc kernel;
+    void* table;
+    Py_ssize_t tableLen;
+    int nTables;
+    int width;
+    char reverse;
+    char crc32c;
+    UINT64 initCrc;
+    UINT64 xorOut;
+    UINT64 consts[4];
+    int haveConsts;
+} CrcFunObject;
+
+// Convert crcObj to the initial value of the CRC register, applying the
+// final XOR value.  crcObj may be NULL or None to use the initial value of
+// the CrcFun object.  Returns -1 with an exception set on error.
+
+static int
+crcFunStart(CrcFunObject* self, PyObject* crcObj, UINT64* crc)
+{
+    *crc = self->initCrc;
+    if (crcObj != NULL && crcObj != Py_None)
+    {
+        *crc = PyLong_AsUnsignedLongLongMask(crcObj);
+        if (*crc == (UINT64)-1 && PyErr_Occurred())
+        {
+            return -1;
+        }
+    }
+    *crc ^= self->xorOut;
+    return 0;
+}
+
+// Update the CRC register with the data in obj.  Returns -1 with an
+// exception set on error.  The caller must hold a reference to obj, since
+// the GIL may be released while the data is read.
+
+static int
+crcFunUpdate(CrcFunObject* self, PyObject* obj, UINT64* crc)
+{
+    Py_buffer buf;
+    const UINT8* data;
+    Py_ssize_t dataLen;
+    const UINT64* consts = self->haveConsts ? self->consts : NULL;
+
+    // Bytes objects are immutable, so there is no need to lock the buffer.
+    if (PyBytes_CheckExact(obj))
+    {
+        data = (const UINT8*)PyBytes_AS_STRING(obj);
+        dataLen = PyBytes_GET_SIZE(obj);
+        RUN_KERNEL(*crc, self->kernel(self->table, self->nTables, consts,
+                data, dataLen, *crc));
+    }
+    else
+    {
+        if (getBufferView(obj, &buf) < 0)
+        {
+            return -1;
+        }
+        data = buf.buf;
+        dataLen = buf.len;
+        RUN_KERNEL(*crc, self->kernel(self->table, self->nTables, consts,
+                data, dataLen, *crc));
+        PyBuffer_Release(&buf);
+    }
+    return 0;
+}
+
+// Compute the CRC of the object obj.  crcObj is the initial CRC, or NULL to
+// use the initial value of the CrcFun object.
+
+static PyObject*
+crcFunCompute(CrcFunObject* self, PyObject* obj, PyObject* crcObj)
+{
+    UINT64 crc;
+
+    if (crcFunStart(self, crcObj, &crc) < 0 ||
+        crcFunUpdate(self, obj, &crc) < 0)
+    {
+        return NULL;
+    }
+    return PyLong_FromUnsignedLongLong(crc ^ self->xorOut);
+}
+
+#if PY_VERSION_HEX >= 0x03090000
+
+// Call a function taking an argument tuple and keyword dictionary with the
+// arguments of a vectorcall.  Used for the less common forms of calls.
+
+static PyObject*
+callWithTuple(PyCFunctionWithKeywords func, PyObject* self,
+        PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+{
+    PyObject* argTuple;
+    PyObject* kwds = NULL;
+    PyObject* result = NULL;
+    Py_ssize_t i;
+
+    argTuple = PyTuple_New(nargs);
+    if (argTuple == NULL)
+    {
+        return NULL;
+    }
+    for (i = 0; i < nargs; i++)
+    {
+        Py_INCREF(args[i]);
+        PyTuple_SET_ITEM(argTuple, i, args[i]);
+    }
+
+    if (kwnames != NULL && PyTuple_GET_SIZE(kwnames) > 0)
+    {
+        kwds = PyDict_New();
+        if (kwds == NULL)
+        {
+            goto done;
+        }
+        for (i = 0; i < PyTuple_GET_SIZE(kwnames); i++)
+        {
+            if (PyDict_SetItem(kwds, PyTuple_GET_ITEM(kwnames, i),
+                               args[nargs + i]) < 0)
+            {
+                goto done;
+            }
+        }
+    }
+
+    result = func(self, argTuple, kwds);
+
+done:
+    Py_DECREF(argTuple);
+    Py_XDECREF(kwds);
+    return result;
+}
+
+#endif
+
+static PyObject*
+crcFunCall(PyObject* self, PyObject* args, PyObject* kwds)
+{
+    static char* kwlist[] = {"data", "crc", NULL};
+    PyObject* obj;
+    PyObject* crcObj = NULL;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|O:crcfun", kwlist,
+                                     &obj, &crcObj))
+    {
+        return NULL;
+    }
+    return crcFunCompute((CrcFunObject*)self, obj, crcObj);
+}
+
+#if PY_VERSION_HEX >= 0x03090000
+
+static PyObject*
+crcFunVectorcall(PyObject* self, PyObject* const* args, size_t nargsf,
+        PyObject* kwnames)
+{
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+
+    if (kwnames == NULL || PyTuple_GET_SIZE(kwnames) == 0)
+    {
+        if (nargs == 1)
+        {
+            return crcFunCompute((CrcFunObject*)self, args[0], NULL);
+        }
+        if (nargs == 2)
+        {
+            return crcFunCompute((CrcFunObject*)self, args[0], args[1]);
+        }
+    }
+
+    // Let the general version sort out keywords and report errors.
+    return callWithTuple(crcFunCall, self, args, nargs, kwnames);
+}
+
+#endif
+
+// Compute the CRC of each buffer in a sequence.
+// Inputs:
+//   buffers - iterable of objects supporting the buffer API
+//   crc - initial CRC used for every buffer (defaults to initCrc)
+// Returns:
+//   list containing the CRC of each buffer
+
+static PyObject*
+crcFunMany(CrcFunObject* self, PyObject* args, PyObject* kwds)
+{
+    static char* kwlist[] = {"buffers", "crc", NULL};
+    PyObject* buffers;
+    PyObject* crcObj = NULL;
+    PyObject* seq;
+    PyObject* result;
+    PyObject* value;
+    Py_ssize_t i;
+    Py_ssize_t n;
+    UINT64 start;
+    UINT64 crc;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|O:many", kwlist,
+                                     &buffers, &crcObj))
+    {
+        return NULL;
+    }
+
+    if (crcFunStart(self, crcObj, &start) < 0)
+    {
+        return NULL;
+    }
+
+    // A tuple holds references to the buffers, which must stay alive while
+    // the GIL is released even if another thread changes a list passed in.
+    seq = PySequence_Tuple(buffers);
+    if (seq == NULL)
+    {
+        return NULL;
+    }
+
+    n = PyTuple_GET_SIZE(seq);
+    result = PyList_New(n);
+    if (result == NULL)
+    {
+        Py_DECREF(seq);
+        return NULL;
+    }
+
+    for (i = 0; i < n; i++)
+    {
+        crc = start;
+        if (crcFunUpdate(self, PyTuple_GET_ITEM(seq, i), &crc) < 0)
+        {
+            goto error;
+        }
+        value = PyLong_FromUnsignedLongLong(crc ^ self->xorOut);
+        if (value == NULL)
+        {
+            goto error;
+        }
+        PyList_SET_ITEM(result, i, value);
+    }
+
+    Py_DECREF(seq);
+    return result;
+
+error:
+    Py_DECREF(seq);
+    Py_DECREF(result);
+    return NULL;
+}
+
+// Store the CRC of each record in an output buffer.  The output items have
+// the natural size for the width of the CRC.
+
+static void
+crcFunRecordsLoop(CrcFunObject* self, const UINT8* data, Py_ssize_t nRecords,
+                  Py_ssize_t stride, Py_ssize_t length, UINT64 start, void* out)
+{
+    const UINT64* consts = self->haveConsts ? self->consts : NULL;
+    Py_ssize_t i;
+    UINT64 crc;
+
+    for (i = 0; i < nRecords; i++)
+    {
+        crc = self->kernel(self->table, self->nTables, consts,
+                           data + i*stride, length, start) ^ self->xorOut;
+        switch (self->width)
+        {
+        case 8:
+            ((UINT8*)out)[i] = (UINT8)crc;
+            break;
+        case 16:
+            ((UINT16*)out)[i] = (UINT16)crc;
+            break;
+        case 24:
+        case 32:
+            ((UINT32*)out)[i] = (UINT32)crc;
+            break;
+        default:
+            ((UINT64*)out)[i] = crc;
+            break;
+        }
+    }
+}
+
+// Return true if a buffer format describes native unsigned integers, the
+// only items records can store.
+
+static int
+isUnsignedFormat(const char* format)
+{
+    if (format == NULL)
+    {
+        return 1;
+    }
+#if PY_LITTLE_ENDIAN
+    if (*format == '@' || *format == '=' || *format == '<')
+#else
+    if (*format == '@' || *format == '=' || *format == '>' || *format == '!')
+#endif
+    {
+        format++;
+    }
+    return format[0] != '\0' && format[1] == '\0' &&
+           strchr("BHILQN", format[0]) != NULL;
+}
+
+// Compute the CRC of fixed size records stored back to back in one buffer.
+// Inputs:
+//   data - object supporting the buffer API holding the records
+//   stride - distance in bytes between the start of consecutive records
+//   length - length in bytes of each record
+//   offset - position of the first record in data
+//   out - optional writable contiguous buffer receiving one item per record.
+//         The items must be unsigned integers of 1, 2, 4 or 8 bytes for 8,
+//         16, 24/32 and 64-bit CRCs.
+//         Defaults to a new array.array of the appropriate type.
+//   crc - initial CRC used for every record (defaults to initCrc)
+// Returns:
+//   out
+
+static PyObject*
+crcFunRecords(CrcFunObject* self, PyObject* args, PyObject* kwds)
+{
+    static char* kwlist[] = {"data", "stride", "length", "offset", "out",
+                             "crc", NULL};
+    PyObject* dataObj;
+    PyObject* outObj = Py_None;
+    PyObject* crcObj = NULL;
+    Py_ssize_t stride;
+    Py_ssize_t length;
+    Py_ssize_t offset = 0;
+    Py_ssize_t nRecords = 0;
+    Py_ssize_t itemSize;
+    Py_buffer buf;
+    Py_buffer outBuf;
+    const char* typeCode;
+    UINT64 start;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "Onn|nOO:records", kwlist,
+                                     &dataObj, &stride, &length, &offset,
+                                     &outObj, &crcObj))
+    {
+        return NULL;
+    }
+
+    if (stride <= 0 || length < 0 || offset < 0)
+    {
+        PyErr_SetString(PyExc_ValueError,
+            "stride must be positive, and length and offset non-negative");
+        return NULL;
+    }
+
+    if (crcFunStart(self, crcObj, &start) < 0)
+    {
+        return NULL;
+    }
+
+    switch (self->width)
+    {
+    case 8:
+        itemSize = 1;
+        typeCode = "B";
+        break;
+    case 16:
+        itemSize = 2;
+        typeCode = "H";
+        break;
+    case 24:
+    case 32:
+        itemSize = 4;
+        typeCode = "I";
+        break;
+    default:
+        itemSize = 8;
+        typeCode = "Q";
+        break;
+    }
+
+    GET_BUFFER_VIEW_OR_ERROUT(dataObj, &buf);
+
+    if (buf.len >= offset && buf.len - offset >= length)
+    {
+        nRecords = (buf.len - offset - length)/stride + 1;
+    }
+
+    if (outObj == Py_None)
+    {
+        PyObject* arrayModule = PyImport_ImportModule("array");
+        if (arrayModule == NULL)
+        {
+            goto error;
+        }
+        outObj = PyObject_CallMethod(arrayModule, "array", "s", typeCode);
+        Py_DECREF(arrayModule);
+        if (outObj == NULL)
+        {
+            goto error;
+        }
+        // Grow the new array to the number of records.
+        if (nRecords > 0)
+        {
+            PyObject* zeros = PyBytes_FromStringAndSize(NULL, nRecords*itemSize);
+            PyObject* res;
+            if (zeros == NULL)
+            {
+                Py_DECREF(outObj);
+                goto error;
+            }
+            memset(PyBytes_AS_STRING(zeros), 0, nRecords*itemSize);
+            res = PyObject_CallMethod(outObj, "frombytes", "O", zeros);
+            Py_DECREF(zeros);
+            if (res == NULL)
+            {
+                Py_DECREF(outObj);
+                goto error;
+            }
+            Py_DECREF(res);
+        }
+    }
+    else
+    {
+        Py_INCREF(outObj);
+    }
+
+    if (PyObject_GetBuffer(outObj, &outBuf,
+                           PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS |
+                           PyBUF_FORMAT) == -1)
+    {
+        Py_DECREF(outObj);
+        goto error;
+    }
+
+    if (outBuf.itemsize != itemSize || !isUnsignedFormat(outBuf.format))
+    {
+        PyErr_Format(PyExc_ValueError,
+                     "out must hold unsigned integers of %zd bytes", itemSize);
+        goto outError;
+    }
+    if (outBuf.len/itemSize < nRecords)
+    {
+        PyErr_Format(PyExc_ValueError,
+                     "out is too small for %zd records", nRecords);
+        goto outError;
+    }
+
+    // The same test as nRecords*length >= gilThreshold, which may overflow.
+    if (nRecords > 0 && length >= gilThreshold/nRecords)
+    {
+        Py_BEGIN_ALLOW_THREADS
+        crcFunRecordsLoop(self, (const UINT8*)buf.buf + offset, nRecords,
+                          stride, length, start, outBuf.buf);
+        Py_END_ALLOW_THREADS
+    }
+    else
+    {
+        crcFunRecordsLoop(self, (const UINT8*)buf.buf + offset, nRecords,
+                          stride, length, start, outBuf.buf);
+    }
+
+    PyBuffer_Release(&outBuf);
+    PyBuffer_Release(&buf);
+    return outObj;
+
+outError:
+    PyBuffer_Release(&outBuf);
+    Py_DECREF(outObj);
+error:
+    PyBuffer_Release(&buf);
+    return NULL;
+}
+
+// Support pickle and the copy module by returning the arguments that create
+// an identical object.
+
+static PyObject*
+crcFunReduce(CrcFunObject* self, PyObject* ignored)
+{
+    if (self->haveConsts)
+    {
+        return Py_BuildValue("O(iNy#KKy#N)", (PyObject*)Py_TYPE(self),
+                             self->width, PyBool_FromLong(self->reverse),
+                             (const char*)self->table, self->tableLen,
+                             (unsigned long long)self->initCrc,
+                             (unsigned long long)self->xorOut,
+                             (const char*)self->consts,
+                             (Py_ssize_t)sizeof(self->consts),
+                             PyBool_FromLong(self->crc32c));
+    }
+    return Py_BuildValue("O(iNy#KKON)", (PyObject*)Py_TYPE(self),
+                         self->width, PyBool_FromLong(self->reverse),
+                         (const char*)self->table, self->tableLen,
+                         (unsigned long long)self->initCrc,
+                         (unsigned long long)self->xorOut, Py_None,
+                         PyBool_FromLong(self->crc32c));
+}
+
+static PyMethodDef crcFunMethods[] = {
+{"many", (PyCFunction)(void(*)(void))crcFunMany, METH_VARARGS | METH_KEYWORDS,
+ "many(buffers, crc=initCrc) -> list of the CRC of each buffer"},
+{"records", (PyCFunction)(void(*)(void))crcFunRecords,
+ METH_VARARGS | METH_KEYWORDS,
+ "records(data, stride, length, offset=0, out=None, crc=initCrc) -> out\n"
+ "Store the CRC of each fixed size record of data in out."},
+{"__reduce__", (PyCFunction)crcFunReduce, METH_NOARGS, NULL},
+{NULL, NULL}
+};
+
+// Create a CrcFun object.
+// Inputs:
+//   width - number of bits in the CRC (8, 16, 24, 32 or 64)
+//   rev - true for the bit reversed algorithm
+//   table - string containing the table corresponding to the generator
+//           polynomial, optionally followed by the slicing tables.
+//   initCrc - default initial CRC value
+//   xorOut - final XOR value
+//   consts - optional string containing the constants for the folding engine
+//   crc32c - true if the polynomial is CRC-32C (requires rev)
+
+static PyObject*
+crcFunNew(PyTypeObject* type, PyObject* args, PyObject* kwds)
+{
+    static char* kwlist[] = {"width", "rev", "table", "initCrc", "xorOut",
+                             "consts", "crc32c", NULL};
+    CrcFunObject* self;
+    int width;
+    int rev;
+    const char* table;
+    Py_ssize_t tableLen;
+    UINT64 initCrc;
+    UINT64 xorOut;
+    const char* consts = NULL;
+    Py_ssize_t constsLen = 0;
+    int crc32c = 0;
+    size_t entrySize;
+    KernelFunc kernel;
+    UINT64 mask;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "ipy#KK|z#p:CrcFun", kwlist,
+                                     &width, &rev, &table, &tableLen,
+                                     &initCrc, &xorOut, &consts, &constsLen,
+                                     &crc32c))
+    {
+        return NULL;
+    }
+
+    switch (width)
+    {
+    case 8:
+        entrySize = 1;
+        kernel = rev ? crc8rKernelAny : crc8KernelAny;
+        break;
+    case 16:
+        entrySize = 2;
+        kernel = rev ? crc16rKernelAny : crc16KernelAny;
+        break;
+    case 24:
+        entrySize = 4;
+        kernel = rev ? crc24rKernelAny : crc24KernelAny;
+        break;
+    case 32:
+        entrySize = 4;
+        kernel = rev ? crc32rKernelAny : crc32KernelAny;
+        break;
+    case 64:
+        entrySize = 8;
+        kernel = rev ? crc64rKernelAny : crc64KernelAny;
+        break;
+    default:
+        PyErr_SetString(PyExc_ValueError, "invalid CRC width");
+        return NULL;
+    }
+
+    if (crc32c)
+    {
+        if (width != 32 || !rev)
+        {
+            PyErr_SetString(PyExc_ValueError,
+                            "CRC-32C must be a bit reversed 32-bit CRC");
+            return NULL;
+        }
+        kernel = crc32cKernelAny;
+    }
+
+    if (tableCount(tableLen, entrySize) == 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid CRC table");
+        return NULL;
+    }
+
+    if (consts != NULL && constsLen != 4*8)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid fold constants");
+        return NULL;
+    }
+
+    self = (CrcFunObject*)type->tp_alloc(type, 0);
+    if (self == NULL)
+    {
+        return NULL;
+    }
+
+    self->table = PyMem_Malloc(tableLen);
+    if (self->table == NULL)
+    {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+    memcpy(self->table, table, tableLen);
+    self->tableLen = tableLen;
+
+#if PY_VERSION_HEX >= 0x03090000
+    self->vectorcall = crcFunVectorcall;
+#endif
+    mask = (width == 64) ? ~(UINT64)0 : (((UINT64)1 << width) - 1);
+    self->kernel = kernel;
+    self->nTables = tableCount(tableLen, entrySize);
+    self->width = width;
+    self->reverse = (char)rev;
+    self->crc32c = (char)crc32c;
+    self->initCrc = initCrc & mask;
+    self->xorOut = xorOut & mask;
+    self->haveConsts = (consts != NULL);
+    if (consts != NULL)
+    {
+        memcpy(self->consts, consts, sizeof(self->consts));
+    }
+
+    return (PyObject*)self;
+}
+
+static void
+crcFunDealloc(CrcFunObject* self)
+{
+    PyMem_Free(self->table);
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+// The name of the implementation used for large buffers.
+
+static PyObject*
+crcFunGetEngine(CrcFunObject* self, void* closure)
+{
+    const char* engine = "table";
+
+    if (self->crc32c && hasSse42)
+    {
+        engine = "sse42";
+    }
+    else if (self->haveConsts && hasClmul)
+    {
+        engine = "clmul";
+    }
+    else if (self->nTables > 1)
+    {
+        engine = "slicing";
+    }
+    return PyUnicode_FromString(engine);
+}
+
+static PyObject*
+crcFunGetReverse(CrcFunObject* self, void* closure)
+{
+    return PyBool_FromLong(self->reverse);
+}
+
+static PyMemberDef crcFunMembers[] = {
+{"width", T_INT, offsetof(CrcFunObject, width), READONLY},
+{"initCrc", T_ULONGLONG, offsetof(CrcFunObject, initCrc), READONLY},
+{"xorOut", T_ULONGLONG, offsetof(CrcFunObject, xorOut), READONLY},
+{NULL}
+};
+
+static PyGetSetDef crcFunGetSet[] = {
+{"engine", (getter)crcFunGetEngine, NULL, NULL, NULL},
+{"reverse", (getter)crcFunGetReverse, NULL, NULL, NULL},
+{NULL}
+};
+
+static PyTypeObject CrcFunType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "crcmod._crcfunext.CrcFun",
+    .tp_basicsize = sizeof(CrcFunObject),
+    .tp_dealloc = (destructor)crcFunDealloc,
+    .tp_call = crcFunCall,
+#if PY_VERSION_HEX >= 0x03090000
+    .tp_vectorcall_offset = offsetof(CrcFunObject, vectorcall),
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_VECTORCALL,
+#else
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+#endif
+    .tp_doc = "Compute a CRC: crcfun(data, crc=initCrc)",
+    .tp_methods = crcFunMethods,
+    .tp_members = crcFunMembers,
+    .tp_getset = crcFunGetSet,
+    .tp_new = crcFunNew,
+};
+
+//-----------------------------------------------------------------------------
+// Set the minimum buffer size for which the GIL is released.
+// Inputs:
+//   threshold - buffer size in bytes
+// Returns:
+//   the previous threshold
+
+static PyObject*
+_setGilThreshold(PyObject* self, PyObject* args)
+{
+    Py_ssize_t threshold;
+    Py_ssize_t previous = gilThreshold;
+
+    if (!PyArg_ParseTuple(args, "n", &threshold))
+    {
+        return NULL;
+    }
+
+    if (threshold < 0)
+    {
+        PyErr_SetString(PyExc_ValueError, "threshold must not be negative");
+        return NULL;
+    }
+
+    gilThreshold = threshold;
+
+    return PyLong_FromSsize_t(previous);
+}
+
+//-----------------------------------------------------------------------------
+// Set the buffer sizes at which the kernels for a CRC width switch from the
+// byte-wise table to slicing-by-8, from slicing-by-8 to slicing-by-16, and to
+// the folding engine.  A negative value leaves the threshold unchanged.
+// Inputs:
+//   width - number of bits in the CRC
+//   slice8, slice16, fold - optional thresholds in bytes
+// Returns:
+//   tuple holding the previous thresholds
+
+static PyObject*
+_setThresholds(PyObject* self, PyObject* args)
+{
+    int width;
+    Py_ssize_t slice8 = -1;
+    Py_ssize_t slice16 = -1;
+    Py_ssize_t fold = -1;
+    PyObject* previous;
+    int i;
+
+    if (!PyArg_ParseTuple(args, "i|nnn", &width, &slice8, &slice16, &fold))
+    {
+        return NULL;
+    }
+
+    if (width != 8 && width != 16 && width != 24 && width != 32 &&
+        width != 64)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid CRC width");
+        return NULL;
+    }
+    i = width/8;
+
+    previous = Py_BuildValue("(nnn)", slice8Min[i], slice16Min[i],
+                             foldMin[i]);
+    if (previous == NULL)
+    {
+        return NULL;
+    }
+
+    if (slice8 >= 0)
+    {
+        slice8Min[i] = slice8;
+    }
+    if (slice16 >= 0)
+    {
+        slice16Min[i] = slice16;
+    }
+    if (fold >= 0)
+    {
+        foldMin[i] = (fold < FOLD_BLOCK_MIN) ? FOLD_BLOCK_MIN : fold;
+    }
+
+    return previous;
+}
+
+//-----------------------------------------------------------------------------
+// Update several CRCs in one pass over the data.  The data is processed in
+// blocks small enough to stay in the cache while each CRC function is applied
+// to the block in turn.
+// Inputs:
+//   funs - sequence of CrcFun objects
+//   data - object supporting the buffer API
+//   crcs - sequence with the current CRC for each function
+// Returns:
+//   list of the updated CRCs
+
+#define MULTI_BLOCK 16384
+
+static void
+multiUpdateLoop(CrcFunObject** funs, Py_ssize_t n, const UINT8* data,
+                Py_ssize_t dataLen, UINT64* regs)
+{
+    Py_ssize_t offset;
+    Py_ssize_t blockLen;
+    Py_ssize_t i;
+    CrcFunObject* f;
+
+    for (offset = 0; offset < dataLen; offset += blockLen)
+    {
+        blockLen = dataLen - offset;
+        if (blockLen > MULTI_BLOCK)
+        {
+            blockLen = MULTI_BLOCK;
+        }
+        for (i = 0; i < n; i++)
+        {
+            f = funs[i];
+            regs[i] = f->kernel(f->table, f->nTables,
+                                f->haveConsts ? f->consts : NULL,
+                                data + offset, blockLen, regs[i]);
+        }
+    }
+}
+
+static PyObject*
+_multiUpdate(PyObject* self, PyObject* args)
+{
+    PyObject* funsObj;
+    PyObject* dataObj;
+    PyObject* crcsObj;
+    PyObject* funs = NULL;
+    PyObject* crcs = NULL;
+    PyObject* result = NULL;
+    PyObject* value;
+    CrcFunObject** objs = NULL;
+    UINT64* regs = NULL;
+    Py_ssize_t n;
+    Py_ssize_t i;
+    Py_buffer buf;
+    int haveBuf = 0;
+
+    if (!PyArg_ParseTuple(args, "OOO", &funsObj, &dataObj, &crcsObj))
+    {
+        return NULL;
+    }
+
+    // The CrcFun objects are used while the GIL is released, so a tuple
+    // holds references to them in case another thread changes a list
+    // passed in.
+    funs = PySequence_Tuple(funsObj);
+    if (funs == NULL)
+    {
+        goto done;
+    }
+    crcs = PySequence_Fast(crcsObj, "crcs must be a sequence");
+    if (crcs == NULL)
+    {
+        goto done;
+    }
+    n = PyTuple_GET_SIZE(funs);
+    if (PySequence_Fast_GET_SIZE(crcs) != n)
+    {
+        PyErr_SetString(PyExc_ValueError,
+                        "funs and crcs must have the same length");
+        goto done;
+    }
+
+    objs = PyMem_New(CrcFunObject*, n > 0 ? n : 1);
+    regs = PyMem_New(UINT64, n > 0 ? n : 1);
+    if (objs == NULL || regs == NULL)
+    {
+        PyErr_NoMemory();
+        goto done;
+    }
+
+    for (i = 0; i < n; i++)
+    {
+        PyObject* fun = PyTuple_GET_ITEM(funs, i);
+        if (!PyObject_TypeCheck(fun, &CrcFunType))
+        {
+            PyErr_SetString(PyExc_TypeError, "funs must hold CrcFun objects");
+            goto done;
+        }
+        objs[i] = (CrcFunObject*)fun;
+        if (crcFunStart(objs[i], PySequence_Fast_GET_ITEM(crcs, i),
+                        &regs[i]) < 0)
+        {
+            goto done;
+        }
+    }
+
+    if (getBufferView(dataObj, &buf) < 0)
+    {
+        goto done;
+    }
+    haveBuf = 1;
+
+    if (buf.len*n >= gilThreshold)
+    {
+        Py_BEGIN_ALLOW_THREADS
+        multiUpdateLoop(objs, n, buf.buf, buf.len, regs);
+        Py_END_ALLOW_THREADS
+    }
+    else
+    {
+        multiUpdateLoop(objs, n, buf.buf, buf.len, regs);
+    }
+
+    result = PyList_New(n);
+    if (result == NULL)
+    {
+        goto done;
+    }
+    for (i = 0; i < n; i++)
+    {
+        value = PyLong_FromUnsignedLongLong(regs[i] ^ objs[i]->xorOut);
+        if (value == NULL)
+        {
+            Py_CLEAR(result);
+            goto done;
+        }
+        PyList_SET_ITEM(result, i, value);
+    }
+
+done:
+    if (haveBuf)
+    {
+        PyBuffer_Release(&buf);
+    }
+    PyMem_Free(objs);
+    PyMem_Free(regs);
+    Py_XDECREF(funs);
+    Py_XDECREF(crcs);
+    return result;
+}
+
+//-----------------------------------------------------------------------------
+// Roll a CRC over a window of fixed size through the data.  The shift
+// register holds the CRC of the window computed from a zero register, so the
+// byte leaving the window is removed by XORing its entry in outTable, which
+// holds the CRC of each byte value followed by window zero bytes.
+// Inputs:
+//   table - 256 entry CRC table packed as 64-bit values
+//   outTable - 256 entry table for the departing byte packed as 64-bit values
+//   width - number of bits in the CRC
+//   rev - true for the bit reversed algorithm
+//   reg - current shift register
+//   history - the bytes in the window, oldest first
+//   data - object supporting the buffer API
+//   xorValue - value XORed with the register to give the CRC of the window
+//   mask, match - the offsets where (crc & mask) == match are returned.  If
+//                 mask is None, no offsets are returned.
+// Returns:
+//   tuple holding the new shift register and a list of the offsets (the
+//   number of bytes of data processed when the CRC matched) or None
+
+typedef struct {
+    const UINT64* table;
+    const UINT64* outTable;
+    int width;
+    int rev;
+    const UINT8* history;
+    Py_ssize_t window;
+    UINT64 check;
+    UINT64 mask;
+    int collect;
+    Py_ssize_t* offsets;
+    Py_ssize_t nOffsets;
+    Py_ssize_t maxOffsets;
+} RollingScan;
+
+// Returns -1 if there is no memory for the offsets.  Called with the GIL
+// released, so the offsets use the raw allocator.
+static int
+rollingScanLoop(RollingScan* scan, const UINT8* data, Py_ssize_t dataLen,
+                UINT64* regPtr)
+{
+    const UINT64* table = scan->table;
+    const UINT64* outTable = scan->outTable;
+    UINT64 reg = *regPtr;
+    UINT64 regMask = (scan->width == 64) ? ~(UINT64)0
+                                         : (((UINT64)1 << scan->width) - 1);
+    int shift = scan->width - 8;
+    Py_ssize_t window = scan->window;
+    Py_ssize_t i;
+    UINT8 out;
+
+    for (i = 0; i < dataLen; i++)
+    {
+        out = (i < window) ? scan->history[i] : data[i - window];
+        if (scan->rev)
+        {
+            reg = (reg >> 8) ^ table[(reg ^ data[i]) & 0xFF] ^ outTable[out];
+        }
+        else
+        {
+            reg = ((reg << 8) & regMask) ^
+                  table[((reg >> shift) ^ data[i]) & 0xFF] ^ outTable[out];
+        }
+        if (scan->collect && (reg & scan->mask) == scan->check)
+        {
+            if (scan->nOffsets == scan->maxOffsets)
+            {
+                Py_ssize_t newMax = scan->maxOffsets ? 2*scan->maxOffsets : 64;
+                Py_ssize_t* p = PyMem_RawRealloc(scan->offsets,
+                                                 newMax*sizeof(Py_ssize_t));
+                if (p == NULL)
+                {
+                    *regPtr = reg;
+                    return -1;
+                }
+                scan->offsets = p;
+                scan->maxOffsets = newMax;
+            }
+            scan->offsets[scan->nOffsets++] = i + 1;
+        }
+    }
+    *regPtr = reg;
+    return 0;
+}
+
+static PyObject*
+_rollingScan(PyObject* self, PyObject* args)
+{
+    Py_buffer tableBuf;
+    Py_buffer outBuf;
+    Py_buffer historyBuf;
+    Py_buffer buf;
+    PyObject* dataObj;
+    PyObject* maskObj;
+    PyObject* offsets = NULL;
+    PyObject* value;
+    unsigned long long reg;
+    unsigned long long xorValue;
+    unsigned long long match;
+    UINT64 r;
+    RollingScan scan;
+    Py_ssize_t i;
+    int status;
+
+    if (!PyArg_ParseTuple(args, "y*y*ipKy*OKOK", &tableBuf, &outBuf,
+                          &scan.width, &scan.rev, &reg, &historyBuf,
+                          &dataObj, &xorValue, &maskObj, &match))
+    {
+        return NULL;
+    }
+
+    scan.table = tableBuf.buf;
+    scan.outTable = outBuf.buf;
+    scan.history = historyBuf.buf;
+    scan.window = historyBuf.len;
+    scan.collect = (maskObj != Py_None);
+    scan.mask = 0;
+    scan.offsets = NULL;
+    scan.nOffsets = 0;
+    scan.maxOffsets = 0;
+    r = reg;
+
+    if (tableBuf.len != 256*8 || outBuf.len != 256*8 ||
+        scan.width < 8 || scan.width > 64)
+    {
+        PyErr_SetString(PyExc_ValueError, "invalid rolling CRC tables");
+        goto error;
+    }
+    if (scan.collect)
+    {
+        scan.mask = PyLong_AsUnsignedLongLongMask(maskObj);
+        if (scan.mask == (UINT64)-1 && PyErr_Occurred())
+        {
+            goto error;
+        }
+    }
+    scan.check = (match ^ xorValue) & scan.mask;
+
+    if (getBufferView(dataObj, &buf) < 0)
+    {
+        goto error;
+    }
+
+    if (buf.len >= gilThreshold)
+    {
+        Py_BEGIN_ALLOW_THREADS
+        status = rollingScanLoop(&scan, buf.buf, buf.len, &r);
+        Py_END_ALLOW_THREADS
+    }
+    else
+    {
+        status = rollingScanLoop(&scan, buf.buf, buf.len, &r);
+    }
+    PyBuffer_Release(&buf);
+
+    if (status < 0)
+    {
+        PyErr_NoMemory();
+        goto error;
+    }
+
+    if (scan.collect)
+    {
+        offsets = PyList_New(scan.nOffsets);
+        if (offsets == NULL)
+        {
+            goto error;
+        }
+        for (i = 0; i < scan.nOffsets; i++)
+        {
+            value = PyLong_FromSsize_t(scan.offsets[i]);
+            if (value == NULL)
+            {
+                Py_DECREF(offsets);
+                goto error;
+            }
+            PyList_SET_ITEM(offsets, i, value);
+        }
+    }
+    else
+    {
+        offsets = Py_None;
+        Py_INCREF(offsets);
+    }
+
+    PyMem_RawFree(scan.offsets);
+    PyBuffer_Release(&tableBuf);
+    PyBuffer_Release(&outBuf);
+    PyBuffer_Release(&historyBuf);
+    return Py_BuildValue("(KN)", (unsigned long long)r, offsets);
+
+error:
+    PyMem_RawFree(scan.offsets);
+    PyBuffer_Release(&tableBuf);
+    PyBuffer_Release(&outBuf);
+    PyBuffer_Release(&historyBuf);
+    return NULL;
+}
+
+//-----------------------------------------------------------------------------
+// Static tables for the algorithms defined in predefined.py.  Each entry holds
+// the 256 entry table and the folding constants for one polynomial and bit
+// order.  The polynomial does not include the x^width term.
+
+typedef struct {
+    int width;
+    int reverse;
+    UINT64 poly;
+    const void* table;
+    UINT64 consts[4];
+} PredefinedTable;
+
+#include "_crcpredefined.h"
+
+static UINT64
+getTableEntry(const void* table, int entrySize, Py_ssize_t i)
+{
+    switch (entrySize)
+    {
+    case 1:
+        return ((const UINT8*)table)[i];
+    case 2:
+        return ((const UINT16*)table)[i];
+    case 4:
+        return ((const UINT32*)table)[i];
+    default:
+        return ((const UINT64*)table)[i];
+    }
+}
+
+static void
+setTableEntry(void* table, int entrySize, Py_ssize_t i, UINT64 value)
+{
+    switch (entrySize)
+    {
+    case 1:
+        ((UINT8*)table)[i] = (UINT8)value;
+        break;
+    case 2:
+        ((UINT16*)table)[i] = (UINT16)value;
+        break;
+    case 4:
+        ((UINT32*)table)[i] = (UINT32)value;
+        break;
+    default:
+        ((UINT64*)table)[i] = value;
+        break;
+    }
+}
+
+//-----------------------------------------------------------------------------
+// Look up the static table of a polynomial.
+// Inputs:
+//   width - number of bits in the CRC
+//   poly - polynomial without the x^width term
+//   rev - true for the bit reversed algorithm
+//   slices - number of slicing tables to return
+// Returns:
+//   None if the polynomial has no static table, otherwise a tuple holding
+//   the slicing tables packed in a string (as built by crcmod) and the
+//   folding constants packed in a string.
+
+static PyObject*
+_predefinedTable(PyObject* self, PyObject* args)
+{
+    int width;
+    unsigned long long poly;
+    int rev;
+    int slices;
+    int entrySize;
+    int i;
+    int k;
+    const PredefinedTable* entry = NULL;
+    PyObject* tableObj;
+    void* table;
+    UINT64 mask;
+    UINT64 x;
+
+    if (!PyArg_ParseTuple(args, "iKpi", &width, &poly, &rev, &slices))
+    {
+        return NULL;
+    }
+
+    if (slices < 1)
+    {
+        PyErr_SetString(PyExc_ValueError, "slices must be positive");
+        return NULL;
+    }
+
+    for (i = 0; i < PREDEFINED_TABLE_COUNT; i++)
+    {
+        if (predefinedTables[i].width == width &&
+            predefinedTables[i].reverse == rev &&
+            predefinedTables[i].poly == poly)
+        {
+            entry = &predefinedTables[i];
+            break;
+        }
+    }
+    if (entry == NULL)
+    {
+        Py_RETURN_NONE;
+    }
+
+    entrySize = (width == 24) ? 4 : width/8;
+    mask = (width == 64) ? ~(UINT64)0 : (((UINT64)1 << width) - 1);
+
+    tableObj = PyBytes_FromStringAndSize(NULL, (Py_ssize_t)slices*256*entrySize);
+    if (tableObj == NULL)
+    {
+        return NULL;
+    }
+    table = PyBytes_AS_STRING(tableObj);
+
+    // Table k holds the CRC of each byte value followed by k zero bytes, so it
+    // is derived from table k-1 by processing one more zero byte.
+    memcpy(table, entry->table, 256*entrySize);
+    for (k = 1; k < slices; k++)
+    {
+        for (i = 0; i < 256; i++)
+        {
+            x = getTableEntry(table, entrySize, (k-1)*256 + i);
+            if (rev)
+            {
+                x = (x >> 8) ^ getTableEntry(entry->table, entrySize, x & 0xFF);
+            }
+            else
+            {
+                x = ((x << 8) & mask) ^
+                    getTableEntry(entry->table, entrySize, x >> (width - 8));
+            }
+            setTableEntry(table, entrySize, k*256 + i, x);
+        }
+    }
+
+    return Py_BuildValue("(Ny#)", tableObj, (const char*)entry->consts,
+                         (Py_ssize_t)sizeof(entry->consts));
+}
+
+//-----------------------------------------------------------------------------
+static PyMethodDef methodTable[] = {
+{"_crc8", _crc8, METH_VARARGS},
 {"_crc8r", _crc8r, METH_VARARGS},
 {"_crc16", _crc16, METH_VARARGS},
 {"_crc16r", _crc16r, METH_VARARGS},
@@ -579,8 +2545,14 @@ static PyMethodDef methodTable[] = {
 {"_crc24r", _crc24r, METH_VARARGS},
 {"_crc32", _crc32, METH_VARARGS},
 {"_crc32r", _crc32r, METH_VARARGS},
+{"_crc32c", _crc32c, METH_VARARGS},
 {"_crc64", _crc64, METH_VARARGS},
 {"_crc64r", _crc64r, METH_VARARGS},
+{"_setGilThreshold", _setGilThreshold, METH_VARARGS},
+{"_setThresholds", _setThresholds, METH_VARARGS},
+{"_predefinedTable", _predefinedTable, METH_VARARGS},
+{"_multiUpdate", _multiUpdate, METH_VARARGS},
+{"_rollingScan", _rollingScan, METH_VARARGS},
 {NULL, NULL}
 };
 
@@ -598,12 +2570,46 @@ static struct PyModuleDef moduleDef = {
 PyMODINIT_FUNC
 PyInit__crcfunext(void)
 {
+    PyObject* module;
+
     if ((sizeof(UINT8) != 1) || (sizeof(UINT16) != 2) || 
         (sizeof(UINT32) != 4) || (sizeof(UINT64) != 8))
     {
         Py_FatalError("crcfunext: One of the data types is invalid");
     }
 
-    return PyModule_Create(&moduleDef);
+    detectCpuFeatures();
+    if (PyType_Ready(&CrcFunType) < 0)
+    {
+        return NULL;
+    }
+    if (hasSse42)
+    {
+        crc32cZeros(crc32cLong, CRC32C_LONG);
+        crc32cZeros(crc32cShort, CRC32C_SHORT);
+    }
+
+    module = PyModule_Create(&moduleDef);
+    if (module == NULL)
+    {
+        return NULL;
+    }
+
+    if (PyModule_AddIntConstant(module, "_hasClmul", hasClmul) < 0 ||
+        PyModule_AddIntConstant(module, "_hasSse42", hasSse42) < 0)
+    {
+        Py_DECREF(module);
+        return NULL;
+    }
+
+    Py_INCREF(&CrcFunType);
+    if (PyModule_AddObject(module, "CrcFun", (PyObject*)&CrcFunType) < 0)
+    {
+        Py_DECREF(&CrcFunType);
+        Py_DECREF(module);
+        return NULL;
+    }
+
+    return module;
 }
 
@@ -0,0 +1,1439 @@
+// Automatically generated by mkPredefinedTables.py from the definitions in
+// predefined.py.  Do not edit.
+
+// poly = 0x107, reverse = False
+static const UINT8 predefinedTable0[256] = {
+    0x00U, 0x07U, 0x0EU, 0x09U, 0x1CU, 0x1BU, 0x12U, 0x15U,
+    0x38U, 0x3FU, 0x36U, 0x31U, 0x24U, 0x23U, 0x2AU, 0x2DU,
+    0x70U, 0x77U, 0x7EU, 0x79U, 0x6CU, 0x6BU, 0x62U, 0x65U,
+    0x48U, 0x4FU, 0x46U, 0x41U, 0x54U, 0x53U, 0x5AU, 0x5DU,
+    0xE0U, 0xE7U, 0xEEU, 0xE9U, 0xFCU, 0xFBU, 0xF2U, 0xF5U,
+    0xD8U, 0xDFU, 0xD6U, 0xD1U, 0xC4U, 0xC3U, 0xCAU, 0xCDU,
+    0x90U, 0x97U, 0x9EU, 0x99U, 0x8CU, 0x8BU, 0x82U, 0x85U,
+    0xA8U, 0xAFU, 0xA6U, 0xA1U, 0xB4U, 0xB3U, 0xBAU, 0xBDU,
+    0xC7U, 0xC0U, 0xC9U, 0xCEU, 0xDBU, 0xDCU, 0xD5U, 0xD2U,
+    0xFFU, 0xF8U, 0xF1U, 0xF6U, 0xE3U, 0xE4U, 0xEDU, 0xEAU,
+    0xB7U, 0xB0U, 0xB9U, 0xBEU, 0xABU, 0xACU, 0xA5U, 0xA2U,
+    0x8FU, 0x88U, 0x81U, 0x86U, 0x93U, 0x94U, 0x9DU, 0x9AU,
+    0x27U, 0x20U, 0x29U, 0x2EU, 0x3BU, 0x3CU, 0x35U, 0x32U,
+    0x1FU, 0x18U, 0x11U, 0x16U, 0x03U, 0x04U, 0x0DU, 0x0AU,
+    0x57U, 0x50U, 0x59U, 0x5EU, 0x4BU, 0x4CU, 0x45U, 0x42U,
+    0x6FU, 0x68U, 0x61U, 0x66U, 0x73U, 0x74U, 0x7DU, 0x7AU,
+    0x89U, 0x8EU, 0x87U, 0x80U, 0x95U, 0x92U, 0x9BU, 0x9CU,
+    0xB1U, 0xB6U, 0xBFU, 0xB8U, 0xADU, 0xAAU, 0xA3U, 0xA4U,
+    0xF9U, 0xFEU, 0xF7U, 0xF0U, 0xE5U, 0xE2U, 0xEBU, 0xECU,
+    0xC1U, 0xC6U, 0xCFU, 0xC8U, 0xDDU, 0xDAU, 0xD3U, 0xD4U,
+    0x69U, 0x6EU, 0x67U, 0x60U, 0x75U, 0x72U, 0x7BU, 0x7CU,
+    0x51U, 0x56U, 0x5FU, 0x58U, 0x4DU, 0x4AU, 0x43U, 0x44U,
+    0x19U, 0x1EU, 0x17U, 0x10U, 0x05U, 0x02U, 0x0BU, 0x0CU,
+    0x21U, 0x26U, 0x2FU, 0x28U, 0x3DU, 0x3AU, 0x33U, 0x34U,
+    0x4EU, 0x49U, 0x40U, 0x47U, 0x52U, 0x55U, 0x5CU, 0x5BU,
+    0x76U, 0x71U, 0x78U, 0x7FU, 0x6AU, 0x6DU, 0x64U, 0x63U,
+    0x3EU, 0x39U, 0x30U, 0x37U, 0x22U, 0x25U, 0x2CU, 0x2BU,
+    0x06U, 0x01U, 0x08U, 0x0FU, 0x1AU, 0x1DU, 0x14U, 0x13U,
+    0xAEU, 0xA9U, 0xA0U, 0xA7U, 0xB2U, 0xB5U, 0xBCU, 0xBBU,
+    0x96U, 0x91U, 0x98U, 0x9FU, 0x8AU, 0x8DU, 0x84U, 0x83U,
+    0xDEU, 0xD9U, 0xD0U, 0xD7U, 0xC2U, 0xC5U, 0xCCU, 0xCBU,
+    0xE6U, 0xE1U, 0xE8U, 0xEFU, 0xFAU, 0xFDU, 0xF4U, 0xF3U,
+};
+
+// poly = 0x139, reverse = True
+static const UINT8 predefinedTable1[256] = {
+    0x00U, 0x72U, 0xE4U, 0x96U, 0xF1U, 0x83U, 0x15U, 0x67U,
+    0xDBU, 0xA9U, 0x3FU, 0x4DU, 0x2AU, 0x58U, 0xCEU, 0xBCU,
+    0x8FU, 0xFDU, 0x6BU, 0x19U, 0x7EU, 0x0CU, 0x9AU, 0xE8U,
+    0x54U, 0x26U, 0xB0U, 0xC2U, 0xA5U, 0xD7U, 0x41U, 0x33U,
+    0x27U, 0x55U, 0xC3U, 0xB1U, 0xD6U, 0xA4U, 0x32U, 0x40U,
+    0xFCU, 0x8EU, 0x18U, 0x6AU, 0x0DU, 0x7FU, 0xE9U, 0x9BU,
+    0xA8U, 0xDAU, 0x4CU, 0x3EU, 0x59U, 0x2BU, 0xBDU, 0xCFU,
+    0x73U, 0x01U, 0x97U, 0xE5U, 0x82U, 0xF0U, 0x66U, 0x14U,
+    0x4EU, 0x3CU, 0xAAU, 0xD8U, 0xBFU, 0xCDU, 0x5BU, 0x29U,
+    0x95U, 0xE7U, 0x71U, 0x03U, 0x64U, 0x16U, 0x80U, 0xF2U,
+    0xC1U, 0xB3U, 0x25U, 0x57U, 0x30U, 0x42U, 0xD4U, 0xA6U,
+    0x1AU, 0x68U, 0xFEU, 0x8CU, 0xEBU, 0x99U, 0x0FU, 0x7DU,
+    0x69U, 0x1BU, 0x8DU, 0xFFU, 0x98U, 0xEAU, 0x7CU, 0x0EU,
+    0xB2U, 0xC0U, 0x56U, 0x24U, 0x43U, 0x31U, 0xA7U, 0xD5U,
+    0xE6U, 0x94U, 0x02U, 0x70U, 0x17U, 0x65U, 0xF3U, 0x81U,
+    0x3DU, 0x4FU, 0xD9U, 0xABU, 0xCCU, 0xBEU, 0x28U, 0x5AU,
+    0x9CU, 0xEEU, 0x78U, 0x0AU, 0x6DU, 0x1FU, 0x89U, 0xFBU,
+    0x47U, 0x35U, 0xA3U, 0xD1U, 0xB6U, 0xC4U, 0x52U, 0x20U,
+    0x13U, 0x61U, 0xF7U, 0x85U, 0xE2U, 0x90U, 0x06U, 0x74U,
+    0xC8U, 0xBAU, 0x2CU, 0x5EU, 0x39U, 0x4BU, 0xDDU, 0xAFU,
+    0xBBU, 0xC9U, 0x5FU, 0x2DU, 0x4AU, 0x38U, 0xAEU, 0xDCU,
+    0x60U, 0x12U, 0x84U, 0xF6U, 0x91U, 0xE3U, 0x75U, 0x07U,
+    0x34U, 0x46U, 0xD0U, 0xA2U, 0xC5U, 0xB7U, 0x21U, 0x53U,
+    0xEFU, 0x9DU, 0x0BU, 0x79U, 0x1EU, 0x6CU, 0xFAU, 0x88U,
+    0xD2U, 0xA0U, 0x36U, 0x44U, 0x23U, 0x51U, 0xC7U, 0xB5U,
+    0x09U, 0x7BU, 0xEDU, 0x9FU, 0xF8U, 0x8AU, 0x1CU, 0x6EU,
+    0x5DU, 0x2FU, 0xB9U, 0xCBU, 0xACU, 0xDEU, 0x48U, 0x3AU,
+    0x86U, 0xF4U, 0x62U, 0x10U, 0x77U, 0x05U, 0x93U, 0xE1U,
+    0xF5U, 0x87U, 0x11U, 0x63U, 0x04U, 0x76U, 0xE0U, 0x92U,
+    0x2EU, 0x5CU, 0xCAU, 0xB8U, 0xDFU, 0xADU, 0x3BU, 0x49U,
+    0x7AU, 0x08U, 0x9EU, 0xECU, 0x8BU, 0xF9U, 0x6FU, 0x1DU,
+    0xA1U, 0xD3U, 0x45U, 0x37U, 0x50U, 0x22U, 0xB4U, 0xC6U,
+};
+
+// poly = 0x11D, reverse = False
+static const UINT8 predefinedTable2[256] = {
+    0x00U, 0x1DU, 0x3AU, 0x27U, 0x74U, 0x69U, 0x4EU, 0x53U,
+    0xE8U, 0xF5U, 0xD2U, 0xCFU, 0x9CU, 0x81U, 0xA6U, 0xBBU,
+    0xCDU, 0xD0U, 0xF7U, 0xEAU, 0xB9U, 0xA4U, 0x83U, 0x9EU,
+    0x25U, 0x38U, 0x1FU, 0x02U, 0x51U, 0x4CU, 0x6BU, 0x76U,
+    0x87U, 0x9AU, 0xBDU, 0xA0U, 0xF3U, 0xEEU, 0xC9U, 0xD4U,
+    0x6FU, 0x72U, 0x55U, 0x48U, 0x1BU, 0x06U, 0x21U, 0x3CU,
+    0x4AU, 0x57U, 0x70U, 0x6DU, 0x3EU, 0x23U, 0x04U, 0x19U,
+    0xA2U, 0xBFU, 0x98U, 0x85U, 0xD6U, 0xCBU, 0xECU, 0xF1U,
+    0x13U, 0x0EU, 0x29U, 0x34U, 0x67U, 0x7AU, 0x5DU, 0x40U,
+    0xFBU, 0xE6U, 0xC1U, 0xDCU, 0x8FU, 0x92U, 0xB5U, 0xA8U,
+    0xDEU, 0xC3U, 0xE4U, 0xF9U, 0xAAU, 0xB7U, 0x90U, 0x8DU,
+    0x36U, 0x2BU, 0x0CU, 0x11U, 0x42U, 0x5FU, 0x78U, 0x65U,
+    0x94U, 0x89U, 0xAEU, 0xB3U, 0xE0U, 0xFDU, 0xDAU, 0xC7U,
+    0x7CU, 0x61U, 0x46U, 0x5BU, 0x08U, 0x15U, 0x32U, 0x2FU,
+    0x59U, 0x44U, 0x63U, 0x7EU, 0x2DU, 0x30U, 0x17U, 0x0AU,
+    0xB1U, 0xACU, 0x8BU, 0x96U, 0xC5U, 0xD8U, 0xFFU, 0xE2U,
+    0x26U, 0x3BU, 0x1CU, 0x01U, 0x52U, 0x4FU, 0x68U, 0x75U,
+    0xCEU, 0xD3U, 0xF4U, 0xE9U, 0xBAU, 0xA7U, 0x80U, 0x9DU,
+    0xEBU, 0xF6U, 0xD1U, 0xCCU, 0x9FU, 0x82U, 0xA5U, 0xB8U,
+    0x03U, 0x1EU, 0x39U, 0x24U, 0x77U, 0x6AU, 0x4DU, 0x50U,
+    0xA1U, 0xBCU, 0x9BU, 0x86U, 0xD5U, 0xC8U, 0xEFU, 0xF2U,
+    0x49U, 0x54U, 0x73U, 0x6EU, 0x3DU, 0x20U, 0x07U, 0x1AU,
+    0x6CU, 0x71U, 0x56U, 0x4BU, 0x18U, 0x05U, 0x22U, 0x3FU,
+    0x84U, 0x99U, 0xBEU, 0xA3U, 0xF0U, 0xEDU, 0xCAU, 0xD7U,
+    0x35U, 0x28U, 0x0FU, 0x12U, 0x41U, 0x5CU, 0x7BU, 0x66U,
+    0xDDU, 0xC0U, 0xE7U, 0xFAU, 0xA9U, 0xB4U, 0x93U, 0x8EU,
+    0xF8U, 0xE5U, 0xC2U, 0xDFU, 0x8CU, 0x91U, 0xB6U, 0xABU,
+    0x10U, 0x0DU, 0x2AU, 0x37U, 0x64U, 0x79U, 0x5EU, 0x43U,
+    0xB2U, 0xAFU, 0x88U, 0x95U, 0xC6U, 0xDBU, 0xFCU, 0xE1U,
+    0x5AU, 0x47U, 0x60U, 0x7DU, 0x2EU, 0x33U, 0x14U, 0x09U,
+    0x7FU, 0x62U, 0x45U, 0x58U, 0x0BU, 0x16U, 0x31U, 0x2CU,
+    0x97U, 0x8AU, 0xADU, 0xB0U, 0xE3U, 0xFEU, 0xD9U, 0xC4U,
+};
+
+// poly = 0x131, reverse = True
+static const UINT8 predefinedTable3[256] = {
+    0x00U, 0x5EU, 0xBCU, 0xE2U, 0x61U, 0x3FU, 0xDDU, 0x83U,
+    0xC2U, 0x9CU, 0x7EU, 0x20U, 0xA3U, 0xFDU, 0x1FU, 0x41U,
+    0x9DU, 0xC3U, 0x21U, 0x7FU, 0xFCU, 0xA2U, 0x40U, 0x1EU,
+    0x5FU, 0x01U, 0xE3U, 0xBDU, 0x3EU, 0x60U, 0x82U, 0xDCU,
+    0x23U, 0x7DU, 0x9FU, 0xC1U, 0x42U, 0x1CU, 0xFEU, 0xA0U,
+    0xE1U, 0xBFU, 0x5DU, 0x03U, 0x80U, 0xDEU, 0x3CU, 0x62U,
+    0xBEU, 0xE0U, 0x02U, 0x5CU, 0xDFU, 0x81U, 0x63U, 0x3DU,
+    0x7CU, 0x22U, 0xC0U, 0x9EU, 0x1DU, 0x43U, 0xA1U, 0xFFU,
+    0x46U, 0x18U, 0xFAU, 0xA4U, 0x27U, 0x79U, 0x9BU, 0xC5U,
+    0x84U, 0xDAU, 0x38U, 0x66U, 0xE5U, 0xBBU, 0x59U, 0x07U,
+    0xDBU, 0x85U, 0x67U, 0x39U, 0xBAU, 0xE4U, 0x06U, 0x58U,
+    0x19U, 0x47U, 0xA5U, 0xFBU, 0x78U, 0x26U, 0xC4U, 0x9AU,
+    0x65U, 0x3BU, 0xD9U, 0x87U, 0x04U, 0x5AU, 0xB8U, 0xE6U,
+    0xA7U, 0xF9U, 0x1BU, 0x45U, 0xC6U, 0x98U, 0x7AU, 0x24U,
+    0xF8U, 0xA6U, 0x44U, 0x1AU, 0x99U, 0xC7U, 0x25U, 0x7BU,
+    0x3AU, 0x64U, 0x86U, 0xD8U, 0x5BU, 0x05U, 0xE7U, 0xB9U,
+    0x8CU, 0xD2U, 0x30U, 0x6EU, 0xEDU, 0xB3U, 0x51U, 0x0FU,
+    0x4EU, 0x10U, 0xF2U, 0xACU, 0x2FU, 0x71U, 0x93U, 0xCDU,
+    0x11U, 0x4FU, 0xADU, 0xF3U, 0x70U, 0x2EU, 0xCCU, 0x92U,
+    0xD3U, 0x8DU, 0x6FU, 0x31U, 0xB2U, 0xECU, 0x0EU, 0x50U,
+    0xAFU, 0xF1U, 0x13U, 0x4DU, 0xCEU, 0x90U, 0x72U, 0x2CU,
+    0x6DU, 0x33U, 0xD1U, 0x8FU, 0x0CU, 0x52U, 0xB0U, 0xEEU,
+    0x32U, 0x6CU, 0x8EU, 0xD0U, 0x53U, 0x0DU, 0xEFU, 0xB1U,
+    0xF0U, 0xAEU, 0x4CU, 0x12U, 0x91U, 0xCFU, 0x2DU, 0x73U,
+    0xCAU, 0x94U, 0x76U, 0x28U, 0xABU, 0xF5U, 0x17U, 0x49U,
+    0x08U, 0x56U, 0xB4U, 0xEAU, 0x69U, 0x37U, 0xD5U, 0x8BU,
+    0x57U, 0x09U, 0xEBU, 0xB5U, 0x36U, 0x68U, 0x8AU, 0xD4U,
+    0x95U, 0xCBU, 0x29U, 0x77U, 0xF4U, 0xAAU, 0x48U, 0x16U,
+    0xE9U, 0xB7U, 0x55U, 0x0BU, 0x88U, 0xD6U, 0x34U, 0x6AU,
+    0x2BU, 0x75U, 0x97U, 0xC9U, 0x4AU, 0x14U, 0xF6U, 0xA8U,
+    0x74U, 0x2AU, 0xC8U, 0x96U, 0x15U, 0x4BU, 0xA9U, 0xF7U,
+    0xB6U, 0xE8U, 0x0AU, 0x54U, 0xD7U, 0x89U, 0x6BU, 0x35U,
+};
+
+// poly = 0x107, reverse = True
+static const UINT8 predefinedTable4[256] = {
+    0x00U, 0x91U, 0xE3U, 0x72U, 0x07U, 0x96U, 0xE4U, 0x75U,
+    0x0EU, 0x9FU, 0xEDU, 0x7CU, 0x09U, 0x98U, 0xEAU, 0x7BU,
+    0x1CU, 0x8DU, 0xFFU, 0x6EU, 0x1BU, 0x8AU, 0xF8U, 0x69U,
+    0x12U, 0x83U, 0xF1U, 0x60U, 0x15U, 0x84U, 0xF6U, 0x67U,
+    0x38U, 0xA9U, 0xDBU, 0x4AU, 0x3FU, 0xAEU, 0xDCU, 0x4DU,
+    0x36U, 0xA7U, 0xD5U, 0x44U, 0x31U, 0xA0U, 0xD2U, 0x43U,
+    0x24U, 0xB5U, 0xC7U, 0x56U, 0x23U, 0xB2U, 0xC0U, 0x51U,
+    0x2AU, 0xBBU, 0xC9U, 0x58U, 0x2DU, 0xBCU, 0xCEU, 0x5FU,
+    0x70U, 0xE1U, 0x93U, 0x02U, 0x77U, 0xE6U, 0x94U, 0x05U,
+    0x7EU, 0xEFU, 0x9DU, 0x0CU, 0x79U, 0xE8U, 0x9AU, 0x0BU,
+    0x6CU, 0xFDU, 0x8FU, 0x1EU, 0x6BU, 0xFAU, 0x88U, 0x19U,
+    0x62U, 0xF3U, 0x81U, 0x10U, 0x65U, 0xF4U, 0x86U, 0x17U,
+    0x48U, 0xD9U, 0xABU, 0x3AU, 0x4FU, 0xDEU, 0xACU, 0x3DU,
+    0x46U, 0xD7U, 0xA5U, 0x34U, 0x41U, 0xD0U, 0xA2U, 0x33U,
+    0x54U, 0xC5U, 0xB7U, 0x26U, 0x53U, 0xC2U, 0xB0U, 0x21U,
+    0x5AU, 0xCBU, 0xB9U, 0x28U, 0x5DU, 0xCCU, 0xBEU, 0x2FU,
+    0xE0U, 0x71U, 0x03U, 0x92U, 0xE7U, 0x76U, 0x04U, 0x95U,
+    0xEEU, 0x7FU, 0x0DU, 0x9CU, 0xE9U, 0x78U, 0x0AU, 0x9BU,
+    0xFCU, 0x6DU, 0x1FU, 0x8EU, 0xFBU, 0x6AU, 0x18U, 0x89U,
+    0xF2U, 0x63U, 0x11U, 0x80U, 0xF5U, 0x64U, 0x16U, 0x87U,
+    0xD8U, 0x49U, 0x3BU, 0xAAU, 0xDFU, 0x4EU, 0x3CU, 0xADU,
+    0xD6U, 0x47U, 0x35U, 0xA4U, 0xD1U, 0x40U, 0x32U, 0xA3U,
+    0xC4U, 0x55U, 0x27U, 0xB6U, 0xC3U, 0x52U, 0x20U, 0xB1U,
+    0xCAU, 0x5BU, 0x29U, 0xB8U, 0xCDU, 0x5CU, 0x2EU, 0xBFU,
+    0x90U, 0x01U, 0x73U, 0xE2U, 0x97U, 0x06U, 0x74U, 0xE5U,
+    0x9EU, 0x0FU, 0x7DU, 0xECU, 0x99U, 0x08U, 0x7AU, 0xEBU,
+    0x8CU, 0x1DU, 0x6FU, 0xFEU, 0x8BU, 0x1AU, 0x68U, 0xF9U,
+    0x82U, 0x13U, 0x61U, 0xF0U, 0x85U, 0x14U, 0x66U, 0xF7U,
+    0xA8U, 0x39U, 0x4BU, 0xDAU, 0xAFU, 0x3EU, 0x4CU, 0xDDU,
+    0xA6U, 0x37U, 0x45U, 0xD4U, 0xA1U, 0x30U, 0x42U, 0xD3U,
+    0xB4U, 0x25U, 0x57U, 0xC6U, 0xB3U, 0x22U, 0x50U, 0xC1U,
+    0xBAU, 0x2BU, 0x59U, 0xC8U, 0xBDU, 0x2CU, 0x5EU, 0xCFU,
+};
+
+// poly = 0x19B, reverse = True
+static const UINT8 predefinedTable5[256] = {
+    0x00U, 0xD0U, 0x13U, 0xC3U, 0x26U, 0xF6U, 0x35U, 0xE5U,
+    0x4CU, 0x9CU, 0x5FU, 0x8FU, 0x6AU, 0xBAU, 0x79U, 0xA9U,
+    0x98U, 0x48U, 0x8BU, 0x5BU, 0xBEU, 0x6EU, 0xADU, 0x7DU,
+    0xD4U, 0x04U, 0xC7U, 0x17U, 0xF2U, 0x22U, 0xE1U, 0x31U,
+    0x83U, 0x53U, 0x90U, 0x40U, 0xA5U, 0x75U, 0xB6U, 0x66U,
+    0xCFU, 0x1FU, 0xDCU, 0x0CU, 0xE9U, 0x39U, 0xFAU, 0x2AU,
+    0x1BU, 0xCBU, 0x08U, 0xD8U, 0x3DU, 0xEDU, 0x2EU, 0xFEU,
+    0x57U, 0x87U, 0x44U, 0x94U, 0x71U, 0xA1U, 0x62U, 0xB2U,
+    0xB5U, 0x65U, 0xA6U, 0x76U, 0x93U, 0x43U, 0x80U, 0x50U,
+    0xF9U, 0x29U, 0xEAU, 0x3AU, 0xDFU, 0x0FU, 0xCCU, 0x1CU,
+    0x2DU, 0xFDU, 0x3EU, 0xEEU, 0x0BU, 0xDBU, 0x18U, 0xC8U,
+    0x61U, 0xB1U, 0x72U, 0xA2U, 0x47U, 0x97U, 0x54U, 0x84U,
+    0x36U, 0xE6U, 0x25U, 0xF5U, 0x10U, 0xC0U, 0x03U, 0xD3U,
+    0x7AU, 0xAAU, 0x69U, 0xB9U, 0x5CU, 0x8CU, 0x4FU, 0x9FU,
+    0xAEU, 0x7EU, 0xBDU, 0x6DU, 0x88U, 0x58U, 0x9BU, 0x4BU,
+    0xE2U, 0x32U, 0xF1U, 0x21U, 0xC4U, 0x14U, 0xD7U, 0x07U,
+    0xD9U, 0x09U, 0xCAU, 0x1AU, 0xFFU, 0x2FU, 0xECU, 0x3CU,
+    0x95U, 0x45U, 0x86U, 0x56U, 0xB3U, 0x63U, 0xA0U, 0x70U,
+    0x41U, 0x91U, 0x52U, 0x82U, 0x67U, 0xB7U, 0x74U, 0xA4U,
+    0x0DU, 0xDDU, 0x1EU, 0xCEU, 0x2BU, 0xFBU, 0x38U, 0xE8U,
+    0x5AU, 0x8AU, 0x49U, 0x99U, 0x7CU, 0xACU, 0x6FU, 0xBFU,
+    0x16U, 0xC6U, 0x05U, 0xD5U, 0x30U, 0xE0U, 0x23U, 0xF3U,
+    0xC2U, 0x12U, 0xD1U, 0x01U, 0xE4U, 0x34U, 0xF7U, 0x27U,
+    0x8EU, 0x5EU, 0x9DU, 0x4DU, 0xA8U, 0x78U, 0xBBU, 0x6BU,
+    0x6CU, 0xBCU, 0x7FU, 0xAFU, 0x4AU, 0x9AU, 0x59U, 0x89U,
+    0x20U, 0xF0U, 0x33U, 0xE3U, 0x06U, 0xD6U, 0x15U, 0xC5U,
+    0xF4U, 0x24U, 0xE7U, 0x37U, 0xD2U, 0x02U, 0xC1U, 0x11U,
+    0xB8U, 0x68U, 0xABU, 0x7BU, 0x9EU, 0x4EU, 0x8DU, 0x5DU,
+    0xEFU, 0x3FU, 0xFCU, 0x2CU, 0xC9U, 0x19U, 0xDAU, 0x0AU,
+    0xA3U, 0x73U, 0xB0U, 0x60U, 0x85U, 0x55U, 0x96U, 0x46U,
+    0x77U, 0xA7U, 0x64U, 0xB4U, 0x51U, 0x81U, 0x42U, 0x92U,
+    0x3BU, 0xEBU, 0x28U, 0xF8U, 0x1DU, 0xCDU, 0x0EU, 0xDEU,
+};
+
+// poly = 0x18005, reverse = True
+static const UINT16 predefinedTable6[256] = {
+    0x0000U, 0xC0C1U, 0xC181U, 0x0140U, 0xC301U, 0x03C0U, 0x0280U, 0xC241U,
+    0xC601U, 0x06C0U, 0x0780U, 0xC741U, 0x0500U, 0xC5C1U, 0xC481U, 0x0440U,
+    0xCC01U, 0x0CC0U, 0x0D80U, 0xCD41U, 0x0F00U, 0xCFC1U, 0xCE81U, 0x0E40U,
+    0x0A00U, 0xCAC1U, 0xCB81U, 0x0B40U, 0xC901U, 0x09C0U, 0x0880U, 0xC841U,
+    0xD801U, 0x18C0U, 0x1980U, 0xD941U, 0x1B00U, 0xDBC1U, 0xDA81U, 0x1A40U,
+    0x1E00U, 0xDEC1U, 0xDF81U, 0x1F40U, 0xDD01U, 0x1DC0U, 0x1C80U, 0xDC41U,
+    0x1400U, 0xD4C1U, 0xD581U, 0x1540U, 0xD701U, 0x17C0U, 0x1680U, 0xD641U,
+    0xD201U, 0x12C0U, 0x1380U, 0xD341U, 0x1100U, 0xD1C1U, 0xD081U, 0x1040U,
+    0xF001U, 0x30C0U, 0x3180U, 0xF141U, 0x3300U, 0xF3C1U, 0xF281U, 0x3240U,
+    0x3600U, 0xF6C1U, 0xF781U, 0x3740U, 0xF501U, 0x35C0U, 0x3480U, 0xF441U,
+    0x3C00U, 0xFCC1U, 0xFD81U, 0x3D40U, 0xFF01U, 0x3FC0U, 0x3E80U, 0xFE41U,
+    0xFA01U, 0x3AC0U, 0x3B80U, 0xFB41U, 0x3900U, 0xF9C1U, 0xF881U, 0x3840U,
+    0x2800U, 0xE8C1U, 0xE981U, 0x2940U, 0xEB01U, 0x2BC0U, 0x2A80U, 0xEA41U,
+    0xEE01U, 0x2EC0U, 0x2F80U, 0xEF41U, 0x2D00U, 0xEDC1U, 0xEC81U, 0x2C40U,
+    0xE401U, 0x24C0U, 0x2580U, 0xE541U, 0x2700U, 0xE7C1U, 0xE681U, 0x2640U,
+    0x2200U, 0xE2C1U, 0xE381U, 0x2340U, 0xE101U, 0x21C0U, 0x2080U, 0xE041U,
+    0xA001U, 0x60C0U, 0x6180U, 0xA141U, 0x6300U, 0xA3C1U, 0xA281U, 0x6240U,
+    0x6600U, 0xA6C1U, 0xA781U, 0x6740U, 0xA501U, 0x65C0U, 0x6480U, 0xA441U,
+    0x6C00U, 0xACC1U, 0xAD81U, 0x6D40U, 0xAF01U, 0x6FC0U, 0x6E80U, 0xAE41U,
+    0xAA01U, 0x6AC0U, 0x6B80U, 0xAB41U, 0x6900U, 0xA9C1U, 0xA881U, 0x6840U,
+    0x7800U, 0xB8C1U, 0xB981U, 0x7940U, 0xBB01U, 0x7BC0U, 0x7A80U, 0xBA41U,
+    0xBE01U, 0x7EC0U, 0x7F80U, 0xBF41U, 0x7D00U, 0xBDC1U, 0xBC81U, 0x7C40U,
+    0xB401U, 0x74C0U, 0x7580U, 0xB541U, 0x7700U, 0xB7C1U, 0xB681U, 0x7640U,
+    0x7200U, 0xB2C1U, 0xB381U, 0x7340U, 0xB101U, 0x71C0U, 0x7080U, 0xB041U,
+    0x5000U, 0x90C1U, 0x9181U, 0x5140U, 0x9301U, 0x53C0U, 0x5280U, 0x9241U,
+    0x9601U, 0x56C0U, 0x5780U, 0x9741U, 0x5500U, 0x95C1U, 0x9481U, 0x5440U,
+    0x9C01U, 0x5CC0U, 0x5D80U, 0x9D41U, 0x5F00U, 0x9FC1U, 0x9E81U, 0x5E40U,
+    0x5A00U, 0x9AC1U, 0x9B81U, 0x5B40U, 0x9901U, 0x59C0U, 0x5880U, 0x9841U,
+    0x8801U, 0x48C0U, 0x4980U, 0x8941U, 0x4B00U, 0x8BC1U, 0x8A81U, 0x4A40U,
+    0x4E00U, 0x8EC1U, 0x8F81U, 0x4F40U, 0x8D01U, 0x4DC0U, 0x4C80U, 0x8C41U,
+    0x4400U, 0x84C1U, 0x8581U, 0x4540U, 0x8701U, 0x47C0U, 0x4680U, 0x8641U,
+    0x8201U, 0x42C0U, 0x4380U, 0x8341U, 0x4100U, 0x81C1U, 0x8081U, 0x4040U,
+};
+
+// poly = 0x18005, reverse = False
+static const UINT16 predefinedTable7[256] = {
+    0x0000U, 0x8005U, 0x800FU, 0x000AU, 0x801BU, 0x001EU, 0x0014U, 0x8011U,
+    0x8033U, 0x0036U, 0x003CU, 0x8039U, 0x0028U, 0x802DU, 0x8027U, 0x0022U,
+    0x8063U, 0x0066U, 0x006CU, 0x8069U, 0x0078U, 0x807DU, 0x8077U, 0x0072U,
+    0x0050U, 0x8055U, 0x805FU, 0x005AU, 0x804BU, 0x004EU, 0x0044U, 0x8041U,
+    0x80C3U, 0x00C6U, 0x00CCU, 0x80C9U, 0x00D8U, 0x80DDU, 0x80D7U, 0x00D2U,
+    0x00F0U, 0x80F5U, 0x80FFU, 0x00FAU, 0x80EBU, 0x00EEU, 0x00E4U, 0x80E1U,
+    0x00A0U, 0x80A5U, 0x80AFU, 0x00AAU, 0x80BBU, 0x00BEU, 0x00B4U, 0x80B1U,
+    0x8093U, 0x0096U, 0x009CU, 0x8099U, 0x0088U, 0x808DU, 0x8087U, 0x0082U,
+    0x8183U, 0x0186U, 0x018CU, 0x8189U, 0x0198U, 0x819DU, 0x8197U, 0x0192U,
+    0x01B0U, 0x81B5U, 0x81BFU, 0x01BAU, 0x81ABU, 0x01AEU, 0x01A4U, 0x81A1U,
+    0x01E0U, 0x81E5U, 0x81EFU, 0x01EAU, 0x81FBU, 0x01FEU, 0x01F4U, 0x81F1U,
+    0x81D3U, 0x01D6U, 0x01DCU, 0x81D9U, 0x01C8U, 0x81CDU, 0x81C7U, 0x01C2U,
+    0x0140U, 0x8145U, 0x814FU, 0x014AU, 0x815BU, 0x015EU, 0x0154U, 0x8151U,
+    0x8173U, 0x0176U, 0x017CU, 0x8179U, 0x0168U, 0x816DU, 0x8167U, 0x0162U,
+    0x8123U, 0x0126U, 0x012CU, 0x8129U, 0x0138U, 0x813DU, 0x8137U, 0x0132U,
+    0x0110U, 0x8115U, 0x811FU, 0x011AU, 0x810BU, 0x010EU, 0x0104U, 0x8101U,
+    0x8303U, 0x0306U, 0x030CU, 0x8309U, 0x0318U, 0x831DU, 0x8317U, 0x0312U,
+    0x0330U, 0x8335U, 0x833FU, 0x033AU, 0x832BU, 0x032EU, 0x0324U, 0x8321U,
+    0x0360U, 0x8365U, 0x836FU, 0x036AU, 0x837BU, 0x037EU, 0x0374U, 0x8371U,
+    0x8353U, 0x0356U, 0x035CU, 0x8359U, 0x0348U, 0x834DU, 0x8347U, 0x0342U,
+    0x03C0U, 0x83C5U, 0x83CFU, 0x03CAU, 0x83DBU, 0x03DEU, 0x03D4U, 0x83D1U,
+    0x83F3U, 0x03F6U, 0x03FCU, 0x83F9U, 0x03E8U, 0x83EDU, 0x83E7U, 0x03E2U,
+    0x83A3U, 0x03A6U, 0x03ACU, 0x83A9U, 0x03B8U, 0x83BDU, 0x83B7U, 0x03B2U,
+    0x0390U, 0x8395U, 0x839FU, 0x039AU, 0x838BU, 0x038EU, 0x0384U, 0x8381U,
+    0x0280U, 0x8285U, 0x828FU, 0x028AU, 0x829BU, 0x029EU, 0x0294U, 0x8291U,
+    0x82B3U, 0x02B6U, 0x02BCU, 0x82B9U, 0x02A8U, 0x82ADU, 0x82A7U, 0x02A2U,
+    0x82E3U, 0x02E6U, 0x02ECU, 0x82E9U, 0x02F8U, 0x82FDU, 0x82F7U, 0x02F2U,
+    0x02D0U, 0x82D5U, 0x82DFU, 0x02DAU, 0x82CBU, 0x02CEU, 0x02C4U, 0x82C1U,
+    0x8243U, 0x0246U, 0x024CU, 0x8249U, 0x0258U, 0x825DU, 0x8257U, 0x0252U,
+    0x0270U, 0x8275U, 0x827FU, 0x027AU, 0x826BU, 0x026EU, 0x0264U, 0x8261U,
+    0x0220U, 0x8225U, 0x822FU, 0x022AU, 0x823BU, 0x023EU, 0x0234U, 0x8231U,
+    0x8213U, 0x0216U, 0x021CU, 0x8219U, 0x0208U, 0x820DU, 0x8207U, 0x0202U,
+};
+
+// poly = 0x10589, reverse = False
+static const UINT16 predefinedTable8[256] = {
+    0x0000U, 0x0589U, 0x0B12U, 0x0E9BU, 0x1624U, 0x13ADU, 0x1D36U, 0x18BFU,
+    0x2C48U, 0x29C1U, 0x275AU, 0x22D3U, 0x3A6CU, 0x3FE5U, 0x317EU, 0x34F7U,
+    0x5890U, 0x5D19U, 0x5382U, 0x560BU, 0x4EB4U, 0x4B3DU, 0x45A6U, 0x402FU,
+    0x74D8U, 0x7151U, 0x7FCAU, 0x7A43U, 0x62FCU, 0x6775U, 0x69EEU, 0x6C67U,
+    0xB120U, 0xB4A9U, 0xBA32U, 0xBFBBU, 0xA704U, 0xA28DU, 0xAC16U, 0xA99FU,
+    0x9D68U, 0x98E1U, 0x967AU, 0x93F3U, 0x8B4CU, 0x8EC5U, 0x805EU, 0x85D7U,
+    0xE9B0U, 0xEC39U, 0xE2A2U, 0xE72BU, 0xFF94U, 0xFA1DU, 0xF486U, 0xF10FU,
+    0xC5F8U, 0xC071U, 0xCEEAU, 0xCB63U, 0xD3DCU, 0xD655U, 0xD8CEU, 0xDD47U,
+    0x67C9U, 0x6240U, 0x6CDBU, 0x6952U, 0x71EDU, 0x7464U, 0x7AFFU, 0x7F76U,
+    0x4B81U, 0x4E08U, 0x4093U, 0x451AU, 0x5DA5U, 0x582CU, 0x56B7U, 0x533EU,
+    0x3F59U, 0x3AD0U, 0x344BU, 0x31C2U, 0x297DU, 0x2CF4U, 0x226FU, 0x27E6U,
+    0x1311U, 0x1698U, 0x1803U, 0x1D8AU, 0x0535U, 0x00BCU, 0x0E27U, 0x0BAEU,
+    0xD6E9U, 0xD360U, 0xDDFBU, 0xD872U, 0xC0CDU, 0xC544U, 0xCBDFU, 0xCE56U,
+    0xFAA1U, 0xFF28U, 0xF1B3U, 0xF43AU, 0xEC85U, 0xE90CU, 0xE797U, 0xE21EU,
+    0x8E79U, 0x8BF0U, 0x856BU, 0x80E2U, 0x985DU, 0x9DD4U, 0x934FU, 0x96C6U,
+    0xA231U, 0xA7B8U, 0xA923U, 0xACAAU, 0xB415U, 0xB19CU, 0xBF07U, 0xBA8EU,
+    0xCF92U, 0xCA1BU, 0xC480U, 0xC109U, 0xD9B6U, 0xDC3FU, 0xD2A4U, 0xD72DU,
+    0xE3DAU, 0xE653U, 0xE8C8U, 0xED41U, 0xF5FEU, 0xF077U, 0xFEECU, 0xFB65U,
+    0x9702U, 0x928BU, 0x9C10U, 0x9999U, 0x8126U, 0x84AFU, 0x8A34U, 0x8FBDU,
+    0xBB4AU, 0xBEC3U, 0xB058U, 0xB5D1U, 0xAD6EU, 0xA8E7U, 0xA67CU, 0xA3F5U,
+    0x7EB2U, 0x7B3BU, 0x75A0U, 0x7029U, 0x6896U, 0x6D1FU, 0x6384U, 0x660DU,
+    0x52FAU, 0x5773U, 0x59E8U, 0x5C61U, 0x44DEU, 0x4157U, 0x4FCCU, 0x4A45U,
+    0x2622U, 0x23ABU, 0x2D30U, 0x28B9U, 0x3006U, 0x358FU, 0x3B14U, 0x3E9DU,
+    0x0A6AU, 0x0FE3U, 0x0178U, 0x04F1U, 0x1C4EU, 0x19C7U, 0x175CU, 0x12D5U,
+    0xA85BU, 0xADD2U, 0xA349U, 0xA6C0U, 0xBE7FU, 0xBBF6U, 0xB56DU, 0xB0E4U,
+    0x8413U, 0x819AU, 0x8F01U, 0x8A88U, 0x9237U, 0x97BEU, 0x9925U, 0x9CACU,
+    0xF0CBU, 0xF542U, 0xFBD9U, 0xFE50U, 0xE6EFU, 0xE366U, 0xEDFDU, 0xE874U,
+    0xDC83U, 0xD90AU, 0xD791U, 0xD218U, 0xCAA7U, 0xCF2EU, 0xC1B5U, 0xC43CU,
+    0x197BU, 0x1CF2U, 0x1269U, 0x17E0U, 0x0F5FU, 0x0AD6U, 0x044DU, 0x01C4U,
+    0x3533U, 0x30BAU, 0x3E21U, 0x3BA8U, 0x2317U, 0x269EU, 0x2805U, 0x2D8CU,
+    0x41EBU, 0x4462U, 0x4AF9U, 0x4F70U, 0x57CFU, 0x5246U, 0x5CDDU, 0x5954U,
+    0x6DA3U, 0x682AU, 0x66B1U, 0x6338U, 0x7B87U, 0x7E0EU, 0x7095U, 0x751CU,
+};
+
+// poly = 0x13D65, reverse = True
+static const UINT16 predefinedTable9[256] = {
+    0x0000U, 0x365EU, 0x6CBCU, 0x5AE2U, 0xD978U, 0xEF26U, 0xB5C4U, 0x839AU,
+    0xFF89U, 0xC9D7U, 0x9335U, 0xA56BU, 0x26F1U, 0x10AFU, 0x4A4DU, 0x7C13U,
+    0xB26BU, 0x8435U, 0xDED7U, 0xE889U, 0x6B13U, 0x5D4DU, 0x07AFU, 0x31F1U,
+    0x4DE2U, 0x7BBCU, 0x215EU, 0x1700U, 0x949AU, 0xA2C4U, 0xF826U, 0xCE78U,
+    0x29AFU, 0x1FF1U, 0x4513U, 0x734DU, 0xF0D7U, 0xC689U, 0x9C6BU, 0xAA35U,
+    0xD626U, 0xE078U, 0xBA9AU, 0x8CC4U, 0x0F5EU, 0x3900U, 0x63E2U, 0x55BCU,
+    0x9BC4U, 0xAD9AU, 0xF778U, 0xC126U, 0x42BCU, 0x74E2U, 0x2E00U, 0x185EU,
+    0x644DU, 0x5213U, 0x08F1U, 0x3EAFU, 0xBD35U, 0x8B6BU, 0xD189U, 0xE7D7U,
+    0x535EU, 0x6500U, 0x3FE2U, 0x09BCU, 0x8A26U, 0xBC78U, 0xE69AU, 0xD0C4U,
+    0xACD7U, 0x9A89U, 0xC06BU, 0xF635U, 0x75AFU, 0x43F1U, 0x1913U, 0x2F4DU,
+    0xE135U, 0xD76BU, 0x8D89U, 0xBBD7U, 0x384DU, 0x0E13U, 0x54F1U, 0x62AFU,
+    0x1EBCU, 0x28E2U, 0x7200U, 0x445EU, 0xC7C4U, 0xF19AU, 0xAB78U, 0x9D26U,
+    0x7AF1U, 0x4CAFU, 0x164DU, 0x2013U, 0xA389U, 0x95D7U, 0xCF35U, 0xF96BU,
+    0x8578U, 0xB326U, 0xE9C4U, 0xDF9AU, 0x5C00U, 0x6A5EU, 0x30BCU, 0x06E2U,
+    0xC89AU, 0xFEC4U, 0xA426U, 0x9278U, 0x11E2U, 0x27BCU, 0x7D5EU, 0x4B00U,
+    0x3713U, 0x014DU, 0x5BAFU, 0x6DF1U, 0xEE6BU, 0xD835U, 0x82D7U, 0xB489U,
+    0xA6BCU, 0x90E2U, 0xCA00U, 0xFC5EU, 0x7FC4U, 0x499AU, 0x1378U, 0x2526U,
+    0x5935U, 0x6F6BU, 0x3589U, 0x03D7U, 0x804DU, 0xB613U, 0xECF1U, 0xDAAFU,
+    0x14D7U, 0x2289U, 0x786BU, 0x4E35U, 0xCDAFU, 0xFBF1U, 0xA113U, 0x974DU,
+    0xEB5EU, 0xDD00U, 0x87E2U, 0xB1BCU, 0x3226U, 0x0478U, 0x5E9AU, 0x68C4U,
+    0x8F13U, 0xB94DU, 0xE3AFU, 0xD5F1U, 0x566BU, 0x6035U, 0x3AD7U, 0x0C89U,
+    0x709AU, 0x46C4U, 0x1C26U, 0x2A78U, 0xA9E2U, 0x9FBCU, 0xC55EU, 0xF300U,
+    0x3D78U, 0x0B26U, 0x51C4U, 0x679AU, 0xE400U, 0xD25EU, 0x88BCU, 0xBEE2U,
+    0xC2F1U, 0xF4AFU, 0xAE4DU, 0x9813U, 0x1B89U, 0x2DD7U, 0x7735U, 0x416BU,
+    0xF5E2U, 0xC3BCU, 0x995EU, 0xAF00U, 0x2C9AU, 0x1AC4U, 0x4026U, 0x7678U,
+    0x0A6BU, 0x3C35U, 0x66D7U, 0x5089U, 0xD313U, 0xE54DU, 0xBFAFU, 0x89F1U,
+    0x4789U, 0x71D7U, 0x2B35U, 0x1D6BU, 0x9EF1U, 0xA8AFU, 0xF24DU, 0xC413U,
+    0xB800U, 0x8E5EU, 0xD4BCU, 0xE2E2U, 0x6178U, 0x5726U, 0x0DC4U, 0x3B9AU,
+    0xDC4DU, 0xEA13U, 0xB0F1U, 0x86AFU, 0x0535U, 0x336BU, 0x6989U, 0x5FD7U,
+    0x23C4U, 0x159AU, 0x4F78U, 0x7926U, 0xFABCU, 0xCCE2U, 0x9600U, 0xA05EU,
+    0x6E26U, 0x5878U, 0x029AU, 0x34C4U, 0xB75EU, 0x8100U, 0xDBE2U, 0xEDBCU,
+    0x91AFU, 0xA7F1U, 0xFD13U, 0xCB4DU, 0x48D7U, 0x7E89U, 0x246BU, 0x1235U,
+};
+
+// poly = 0x13D65, reverse = False
+static const UINT16 predefinedTable10[256] = {
+    0x0000U, 0x3D65U, 0x7ACAU, 0x47AFU, 0xF594U, 0xC8F1U, 0x8F5EU, 0xB23BU,
+    0xD64DU, 0xEB28U, 0xAC87U, 0x91E2U, 0x23D9U, 0x1EBCU, 0x5913U, 0x6476U,
+    0x91FFU, 0xAC9AU, 0xEB35U, 0xD650U, 0x646BU, 0x590EU, 0x1EA1U, 0x23C4U,
+    0x47B2U, 0x7AD7U, 0x3D78U, 0x001DU, 0xB226U, 0x8F43U, 0xC8ECU, 0xF589U,
+    0x1E9BU, 0x23FEU, 0x6451U, 0x5934U, 0xEB0FU, 0xD66AU, 0x91C5U, 0xACA0U,
+    0xC8D6U, 0xF5B3U, 0xB21CU, 0x8F79U, 0x3D42U, 0x0027U, 0x4788U, 0x7AEDU,
+    0x8F64U, 0xB201U, 0xF5AEU, 0xC8CBU, 0x7AF0U, 0x4795U, 0x003AU, 0x3D5FU,
+    0x5929U, 0x644CU, 0x23E3U, 0x1E86U, 0xACBDU, 0x91D8U, 0xD677U, 0xEB12U,
+    0x3D36U, 0x0053U, 0x47FCU, 0x7A99U, 0xC8A2U, 0xF5C7U, 0xB268U, 0x8F0DU,
+    0xEB7BU, 0xD61EU, 0x91B1U, 0xACD4U, 0x1EEFU, 0x238AU, 0x6425U, 0x5940U,
+    0xACC9U, 0x91ACU, 0xD603U, 0xEB66U, 0x595DU, 0x6438U, 0x2397U, 0x1EF2U,
+    0x7A84U, 0x47E1U, 0x004EU, 0x3D2BU, 0x8F10U, 0xB275U, 0xF5DAU, 0xC8BFU,
+    0x23ADU, 0x1EC8U, 0x5967U, 0x6402U, 0xD639U, 0xEB5CU, 0xACF3U, 0x9196U,
+    0xF5E0U, 0xC885U, 0x8F2AU, 0xB24FU, 0x0074U, 0x3D11U, 0x7ABEU, 0x47DBU,
+    0xB252U, 0x8F37U, 0xC898U, 0xF5FDU, 0x47C6U, 0x7AA3U, 0x3D0CU, 0x0069U,
+    0x641FU, 0x597AU, 0x1ED5U, 0x23B0U, 0x918BU, 0xACEEU, 0xEB41U, 0xD624U,
+    0x7A6CU, 0x4709U, 0x00A6U, 0x3DC3U, 0x8FF8U, 0xB29DU, 0xF532U, 0xC857U,
+    0xAC21U, 0x9144U, 0xD6EBU, 0xEB8EU, 0x59B5U, 0x64D0U, 0x237FU, 0x1E1AU,
+    0xEB93U, 0xD6F6U, 0x9159U, 0xAC3CU, 0x1E07U, 0x2362U, 0x64CDU, 0x59A8U,
+    0x3DDEU, 0x00BBU, 0x4714U, 0x7A71U, 0xC84AU, 0xF52FU, 0xB280U, 0x8FE5U,
+    0x64F7U, 0x5992U, 0x1E3DU, 0x2358U, 0x9163U, 0xAC06U, 0xEBA9U, 0xD6CCU,
+    0xB2BAU, 0x8FDFU, 0xC870U, 0xF515U, 0x472EU, 0x7A4BU, 0x3DE4U, 0x0081U,
+    0xF508U, 0xC86DU, 0x8FC2U, 0xB2A7U, 0x009CU, 0x3DF9U, 0x7A56U, 0x4733U,
+    0x2345U, 0x1E20U, 0x598FU, 0x64EAU, 0xD6D1U, 0xEBB4U, 0xAC1BU, 0x917EU,
+    0x475AU, 0x7A3FU, 0x3D90U, 0x00F5U, 0xB2CEU, 0x8FABU, 0xC804U, 0xF561U,
+    0x9117U, 0xAC72U, 0xEBDDU, 0xD6B8U, 0x6483U, 0x59E6U, 0x1E49U, 0x232CU,
+    0xD6A5U, 0xEBC0U, 0xAC6FU, 0x910AU, 0x2331U, 0x1E54U, 0x59FBU, 0x649EU,
+    0x00E8U, 0x3D8DU, 0x7A22U, 0x4747U, 0xF57CU, 0xC819U, 0x8FB6U, 0xB2D3U,
+    0x59C1U, 0x64A4U, 0x230BU, 0x1E6EU, 0xAC55U, 0x9130U, 0xD69FU, 0xEBFAU,
+    0x8F8CU, 0xB2E9U, 0xF546U, 0xC823U, 0x7A18U, 0x477DU, 0x00D2U, 0x3DB7U,
+    0xC83EU, 0xF55BU, 0xB2F4U, 0x8F91U, 0x3DAAU, 0x00CFU, 0x4760U, 0x7A05U,
+    0x1E73U, 0x2316U, 0x64B9U, 0x59DCU, 0xEBE7U, 0xD682U, 0x912DU, 0xAC48U,
+};
+
+// poly = 0x11021, reverse = False
+static const UINT16 predefinedTable11[256] = {
+    0x0000U, 0x1021U, 0x2042U, 0x3063U, 0x4084U, 0x50A5U, 0x60C6U, 0x70E7U,
+    0x8108U, 0x9129U, 0xA14AU, 0xB16BU, 0xC18CU, 0xD1ADU, 0xE1CEU, 0xF1EFU,
+    0x1231U, 0x0210U, 0x3273U, 0x2252U, 0x52B5U, 0x4294U, 0x72F7U, 0x62D6U,
+    0x9339U, 0x8318U, 0xB37BU, 0xA35AU, 0xD3BDU, 0xC39CU, 0xF3FFU, 0xE3DEU,
+    0x2462U, 0x3443U, 0x0420U, 0x1401U, 0x64E6U, 0x74C7U, 0x44A4U, 0x5485U,
+    0xA56AU, 0xB54BU, 0x8528U, 0x9509U, 0xE5EEU, 0xF5CFU, 0xC5ACU, 0xD58DU,
+    0x3653U, 0x2672U, 0x1611U, 0x0630U, 0x76D7U, 0x66F6U, 0x5695U, 0x46B4U,
+    0xB75BU, 0xA77AU, 0x9719U, 0x8738U, 0xF7DFU, 0xE7FEU, 0xD79DU, 0xC7BCU,
+    0x48C4U, 0x58E5U, 0x6886U, 0x78A7U, 0x0840U, 0x1861U, 0x2802U, 0x3823U,
+    0xC9CCU, 0xD9EDU, 0xE98EU, 0xF9AFU, 0x8948U, 0x9969U, 0xA90AU, 0xB92BU,
+    0x5AF5U, 0x4AD4U, 0x7AB7U, 0x6A96U, 0x1A71U, 0x0A50U, 0x3A33U, 0x2A12U,
+    0xDBFDU, 0xCBDCU, 0xFBBFU, 0xEB9EU, 0x9B79U, 0x8B58U, 0xBB3BU, 0xAB1AU,
+    0x6CA6U, 0x7C87U, 0x4CE4U, 0x5CC5U, 0x2C22U, 0x3C03U, 0x0C60U, 0x1C41U,
+    0xEDAEU, 0xFD8FU, 0xCDECU, 0xDDCDU, 0xAD2AU, 0xBD0BU, 0x8D68U, 0x9D49U,
+    0x7E97U, 0x6EB6U, 0x5ED5U, 0x4EF4U, 0x3E13U, 0x2E32U, 0x1E51U, 0x0E70U,
+    0xFF9FU, 0xEFBEU, 0xDFDDU, 0xCFFCU, 0xBF1BU, 0xAF3AU, 0x9F59U, 0x8F78U,
+    0x9188U, 0x81A9U, 0xB1CAU, 0xA1EBU, 0xD10CU, 0xC12DU, 0xF14EU, 0xE16FU,
+    0x1080U, 0x00A1U, 0x30C2U, 0x20E3U, 0x5004U, 0x4025U, 0x7046U, 0x6067U,
+    0x83B9U, 0x9398U, 0xA3FBU, 0xB3DAU, 0xC33DU, 0xD31CU, 0xE37FU, 0xF35EU,
+    0x02B1U, 0x1290U, 0x22F3U, 0x32D2U, 0x4235U, 0x5214U, 0x6277U, 0x7256U,
+    0xB5EAU, 0xA5CBU, 0x95A8U, 0x8589U, 0xF56EU, 0xE54FU, 0xD52CU, 0xC50DU,
+    0x34E2U, 0x24C3U, 0x14A0U, 0x0481U, 0x7466U, 0x6447U, 0x5424U, 0x4405U,
+    0xA7DBU, 0xB7FAU, 0x8799U, 0x97B8U, 0xE75FU, 0xF77EU, 0xC71DU, 0xD73CU,
+    0x26D3U, 0x36F2U, 0x0691U, 0x16B0U, 0x6657U, 0x7676U, 0x4615U, 0x5634U,
+    0xD94CU, 0xC96DU, 0xF90EU, 0xE92FU, 0x99C8U, 0x89E9U, 0xB98AU, 0xA9ABU,
+    0x5844U, 0x4865U, 0x7806U, 0x6827U, 0x18C0U, 0x08E1U, 0x3882U, 0x28A3U,
+    0xCB7DU, 0xDB5CU, 0xEB3FU, 0xFB1EU, 0x8BF9U, 0x9BD8U, 0xABBBU, 0xBB9AU,
+    0x4A75U, 0x5A54U, 0x6A37U, 0x7A16U, 0x0AF1U, 0x1AD0U, 0x2AB3U, 0x3A92U,
+    0xFD2EU, 0xED0FU, 0xDD6CU, 0xCD4DU, 0xBDAAU, 0xAD8BU, 0x9DE8U, 0x8DC9U,
+    0x7C26U, 0x6C07U, 0x5C64U, 0x4C45U, 0x3CA2U, 0x2C83U, 0x1CE0U, 0x0CC1U,
+    0xEF1FU, 0xFF3EU, 0xCF5DU, 0xDF7CU, 0xAF9BU, 0xBFBAU, 0x8FD9U, 0x9FF8U,
+    0x6E17U, 0x7E36U, 0x4E55U, 0x5E74U, 0x2E93U, 0x3EB2U, 0x0ED1U, 0x1EF0U,
+};
+
+// poly = 0x11021, reverse = True
+static const UINT16 predefinedTable12[256] = {
+    0x0000U, 0x1189U, 0x2312U, 0x329BU, 0x4624U, 0x57ADU, 0x6536U, 0x74BFU,
+    0x8C48U, 0x9DC1U, 0xAF5AU, 0xBED3U, 0xCA6CU, 0xDBE5U, 0xE97EU, 0xF8F7U,
+    0x1081U, 0x0108U, 0x3393U, 0x221AU, 0x56A5U, 0x472CU, 0x75B7U, 0x643EU,
+    0x9CC9U, 0x8D40U, 0xBFDBU, 0xAE52U, 0xDAEDU, 0xCB64U, 0xF9FFU, 0xE876U,
+    0x2102U, 0x308BU, 0x0210U, 0x1399U, 0x6726U, 0x76AFU, 0x4434U, 0x55BDU,
+    0xAD4AU, 0xBCC3U, 0x8E58U, 0x9FD1U, 0xEB6EU, 0xFAE7U, 0xC87CU, 0xD9F5U,
+    0x3183U, 0x200AU, 0x1291U, 0x0318U, 0x77A7U, 0x662EU, 0x54B5U, 0x453CU,
+    0xBDCBU, 0xAC42U, 0x9ED9U, 0x8F50U, 0xFBEFU, 0xEA66U, 0xD8FDU, 0xC974U,
+    0x4204U, 0x538DU, 0x6116U, 0x709FU, 0x0420U, 0x15A9U, 0x2732U, 0x36BBU,
+    0xCE4CU, 0xDFC5U, 0xED5EU, 0xFCD7U, 0x8868U, 0x99E1U, 0xAB7AU, 0xBAF3U,
+    0x5285U, 0x430CU, 0x7197U, 0x601EU, 0x14A1U, 0x0528U, 0x37B3U, 0x263AU,
+    0xDECDU, 0xCF44U, 0xFDDFU, 0xEC56U, 0x98E9U, 0x8960U, 0xBBFBU, 0xAA72U,
+    0x6306U, 0x728FU, 0x4014U, 0x519DU, 0x2522U, 0x34ABU, 0x0630U, 0x17B9U,
+    0xEF4EU, 0xFEC7U, 0xCC5CU, 0xDDD5U, 0xA96AU, 0xB8E3U, 0x8A78U, 0x9BF1U,
+    0x7387U, 0x620EU, 0x5095U, 0x411CU, 0x35A3U, 0x242AU, 0x16B1U, 0x0738U,
+    0xFFCFU, 0xEE46U, 0xDCDDU, 0xCD54U, 0xB9EBU, 0xA862U, 0x9AF9U, 0x8B70U,
+    0x8408U, 0x9581U, 0xA71AU, 0xB693U, 0xC22CU, 0xD3A5U, 0xE13EU, 0xF0B7U,
+    0x0840U, 0x19C9U, 0x2B52U, 0x3ADBU, 0x4E64U, 0x5FEDU, 0x6D76U, 0x7CFFU,
+    0x9489U, 0x8500U, 0xB79BU, 0xA612U, 0xD2ADU, 0xC324U, 0xF1BFU, 0xE036U,
+    0x18C1U, 0x0948U, 0x3BD3U, 0x2A5AU, 0x5EE5U, 0x4F6CU, 0x7DF7U, 0x6C7EU,
+    0xA50AU, 0xB483U, 0x8618U, 0x9791U, 0xE32EU, 0xF2A7U, 0xC03CU, 0xD1B5U,
+    0x2942U, 0x38CBU, 0x0A50U, 0x1BD9U, 0x6F66U, 0x7EEFU, 0x4C74U, 0x5DFDU,
+    0xB58BU, 0xA402U, 0x9699U, 0x8710U, 0xF3AFU, 0xE226U, 0xD0BDU, 0xC134U,
+    0x39C3U, 0x284AU, 0x1AD1U, 0x0B58U, 0x7FE7U, 0x6E6EU, 0x5CF5U, 0x4D7CU,
+    0xC60CU, 0xD785U, 0xE51EU, 0xF497U, 0x8028U, 0x91A1U, 0xA33AU, 0xB2B3U,
+    0x4A44U, 0x5BCDU, 0x6956U, 0x78DFU, 0x0C60U, 0x1DE9U, 0x2F72U, 0x3EFBU,
+    0xD68DU, 0xC704U, 0xF59FU, 0xE416U, 0x90A9U, 0x8120U, 0xB3BBU, 0xA232U,
+    0x5AC5U, 0x4B4CU, 0x79D7U, 0x685EU, 0x1CE1U, 0x0D68U, 0x3FF3U, 0x2E7AU,
+    0xE70EU, 0xF687U, 0xC41CU, 0xD595U, 0xA12AU, 0xB0A3U, 0x8238U, 0x93B1U,
+    0x6B46U, 0x7ACFU, 0x4854U, 0x59DDU, 0x2D62U, 0x3CEBU, 0x0E70U, 0x1FF9U,
+    0xF78FU, 0xE606U, 0xD49DU, 0xC514U, 0xB1ABU, 0xA022U, 0x92B9U, 0x8330U,
+    0x7BC7U, 0x6A4EU, 0x58D5U, 0x495CU, 0x3DE3U, 0x2C6AU, 0x1EF1U, 0x0F78U,
+};
+
+// poly = 0x18BB7, reverse = False
+static const UINT16 predefinedTable13[256] = {
+    0x0000U, 0x8BB7U, 0x9CD9U, 0x176EU, 0xB205U, 0x39B2U, 0x2EDCU, 0xA56BU,
+    0xEFBDU, 0x640AU, 0x7364U, 0xF8D3U, 0x5DB8U, 0xD60FU, 0xC161U, 0x4AD6U,
+    0x54CDU, 0xDF7AU, 0xC814U, 0x43A3U, 0xE6C8U, 0x6D7FU, 0x7A11U, 0xF1A6U,
+    0xBB70U, 0x30C7U, 0x27A9U, 0xAC1EU, 0x0975U, 0x82C2U, 0x95ACU, 0x1E1BU,
+    0xA99AU, 0x222DU, 0x3543U, 0xBEF4U, 0x1B9FU, 0x9028U, 0x8746U, 0x0CF1U,
+    0x4627U, 0xCD90U, 0xDAFEU, 0x5149U, 0xF422U, 0x7F95U, 0x68FBU, 0xE34CU,
+    0xFD57U, 0x76E0U, 0x618EU, 0xEA39U, 0x4F52U, 0xC4E5U, 0xD38BU, 0x583CU,
+    0x12EAU, 0x995DU, 0x8E33U, 0x0584U, 0xA0EFU, 0x2B58U, 0x3C36U, 0xB781U,
+    0xD883U, 0x5334U, 0x445AU, 0xCFEDU, 0x6A86U, 0xE131U, 0xF65FU, 0x7DE8U,
+    0x373EU, 0xBC89U, 0xABE7U, 0x2050U, 0x853BU, 0x0E8CU, 0x19E2U, 0x9255U,
+    0x8C4EU, 0x07F9U, 0x1097U, 0x9B20U, 0x3E4BU, 0xB5FCU, 0xA292U, 0x2925U,
+    0x63F3U, 0xE844U, 0xFF2AU, 0x749DU, 0xD1F6U, 0x5A41U, 0x4D2FU, 0xC698U,
+    0x7119U, 0xFAAEU, 0xEDC0U, 0x6677U, 0xC31CU, 0x48ABU, 0x5FC5U, 0xD472U,
+    0x9EA4U, 0x1513U, 0x027DU, 0x89CAU, 0x2CA1U, 0xA716U, 0xB078U, 0x3BCFU,
+    0x25D4U, 0xAE63U, 0xB90DU, 0x32BAU, 0x97D1U, 0x1C66U, 0x0B08U, 0x80BFU,
+    0xCA69U, 0x41DEU, 0x56B0U, 0xDD07U, 0x786CU, 0xF3DBU, 0xE4B5U, 0x6F02U,
+    0x3AB1U, 0xB106U, 0xA668U, 0x2DDFU, 0x88B4U, 0x0303U, 0x146DU, 0x9FDAU,
+    0xD50CU, 0x5EBBU, 0x49D5U, 0xC262U, 0x6709U, 0xECBEU, 0xFBD0U, 0x7067U,
+    0x6E7CU, 0xE5CBU, 0xF2A5U, 0x7912U, 0xDC79U, 0x57CEU, 0x40A0U, 0xCB17U,
+    0x81C1U, 0x0A76U, 0x1D18U, 0x96AFU, 0x33C4U, 0xB873U, 0xAF1DU, 0x24AAU,
+    0x932BU, 0x189CU, 0x0FF2U, 0x8445U, 0x212EU, 0xAA99U, 0xBDF7U, 0x3640U,
+    0x7C96U, 0xF721U, 0xE04FU, 0x6BF8U, 0xCE93U, 0x4524U, 0x524AU, 0xD9FDU,
+    0xC7E6U, 0x4C51U, 0x5B3FU, 0xD088U, 0x75E3U, 0xFE54U, 0xE93AU, 0x628DU,
+    0x285BU, 0xA3ECU, 0xB482U, 0x3F35U, 0x9A5EU, 0x11E9U, 0x0687U, 0x8D30U,
+    0xE232U, 0x6985U, 0x7EEBU, 0xF55CU, 0x5037U, 0xDB80U, 0xCCEEU, 0x4759U,
+    0x0D8FU, 0x8638U, 0x9156U, 0x1AE1U, 0xBF8AU, 0x343DU, 0x2353U, 0xA8E4U,
+    0xB6FFU, 0x3D48U, 0x2A26U, 0xA191U, 0x04FAU, 0x8F4DU, 0x9823U, 0x1394U,
+    0x5942U, 0xD2F5U, 0xC59BU, 0x4E2CU, 0xEB47U, 0x60F0U, 0x779EU, 0xFC29U,
+    0x4BA8U, 0xC01FU, 0xD771U, 0x5CC6U, 0xF9ADU, 0x721AU, 0x6574U, 0xEEC3U,
+    0xA415U, 0x2FA2U, 0x38CCU, 0xB37BU, 0x1610U, 0x9DA7U, 0x8AC9U, 0x017EU,
+    0x1F65U, 0x94D2U, 0x83BCU, 0x080BU, 0xAD60U, 0x26D7U, 0x31B9U, 0xBA0EU,
+    0xF0D8U, 0x7B6FU, 0x6C01U, 0xE7B6U, 0x42DDU, 0xC96AU, 0xDE04U, 0x55B3U,
+};
+
+// poly = 0x1A097, reverse = False
+static const UINT16 predefinedTable14[256] = {
+    0x0000U, 0xA097U, 0xE1B9U, 0x412EU, 0x63E5U, 0xC372U, 0x825CU, 0x22CBU,
+    0xC7CAU, 0x675DU, 0x2673U, 0x86E4U, 0xA42FU, 0x04B8U, 0x4596U, 0xE501U,
+    0x2F03U, 0x8F94U, 0xCEBAU, 0x6E2DU, 0x4CE6U, 0xEC71U, 0xAD5FU, 0x0DC8U,
+    0xE8C9U, 0x485EU, 0x0970U, 0xA9E7U, 0x8B2CU, 0x2BBBU, 0x6A95U, 0xCA02U,
+    0x5E06U, 0xFE91U, 0xBFBFU, 0x1F28U, 0x3DE3U, 0x9D74U, 0xDC5AU, 0x7CCDU,
+    0x99CCU, 0x395BU, 0x7875U, 0xD8E2U, 0xFA29U, 0x5ABEU, 0x1B90U, 0xBB07U,
+    0x7105U, 0xD192U, 0x90BCU, 0x302BU, 0x12E0U, 0xB277U, 0xF359U, 0x53CEU,
+    0xB6CFU, 0x1658U, 0x5776U, 0xF7E1U, 0xD52AU, 0x75BDU, 0x3493U, 0x9404U,
+    0xBC0CU, 0x1C9BU, 0x5DB5U, 0xFD22U, 0xDFE9U, 0x7F7EU, 0x3E50U, 0x9EC7U,
+    0x7BC6U, 0xDB51U, 0x9A7FU, 0x3AE8U, 0x1823U, 0xB8B4U, 0xF99AU, 0x590DU,
+    0x930FU, 0x3398U, 0x72B6U, 0xD221U, 0xF0EAU, 0x507DU, 0x1153U, 0xB1C4U,
+    0x54C5U, 0xF452U, 0xB57CU, 0x15EBU, 0x3720U, 0x97B7U, 0xD699U, 0x760EU,
+    0xE20AU, 0x429DU, 0x03B3U, 0xA324U, 0x81EFU, 0x2178U, 0x6056U, 0xC0C1U,
+    0x25C0U, 0x8557U, 0xC479U, 0x64EEU, 0x4625U, 0xE6B2U, 0xA79CU, 0x070BU,
+    0xCD09U, 0x6D9EU, 0x2CB0U, 0x8C27U, 0xAEECU, 0x0E7BU, 0x4F55U, 0xEFC2U,
+    0x0AC3U, 0xAA54U, 0xEB7AU, 0x4BEDU, 0x6926U, 0xC9B1U, 0x889FU, 0x2808U,
+    0xD88FU, 0x7818U, 0x3936U, 0x99A1U, 0xBB6AU, 0x1BFDU, 0x5AD3U, 0xFA44U,
+    0x1F45U, 0xBFD2U, 0xFEFCU, 0x5E6BU, 0x7CA0U, 0xDC37U, 0x9D19U, 0x3D8EU,
+    0xF78CU, 0x571BU, 0x1635U, 0xB6A2U, 0x9469U, 0x34FEU, 0x75D0U, 0xD547U,
+    0x3046U, 0x90D1U, 0xD1FFU, 0x7168U, 0x53A3U, 0xF334U, 0xB21AU, 0x128DU,
+    0x8689U, 0x261EU, 0x6730U, 0xC7A7U, 0xE56CU, 0x45FBU, 0x04D5U, 0xA442U,
+    0x4143U, 0xE1D4U, 0xA0FAU, 0x006DU, 0x22A6U, 0x8231U, 0xC31FU, 0x6388U,
+    0xA98AU, 0x091DU, 0x4833U, 0xE8A4U, 0xCA6FU, 0x6AF8U, 0x2BD6U, 0x8B41U,
+    0x6E40U, 0xCED7U, 0x8FF9U, 0x2F6EU, 0x0DA5U, 0xAD32U, 0xEC1CU, 0x4C8BU,
+    0x6483U, 0xC414U, 0x853AU, 0x25ADU, 0x0766U, 0xA7F1U, 0xE6DFU, 0x4648U,
+    0xA349U, 0x03DEU, 0x42F0U, 0xE267U, 0xC0ACU, 0x603BU, 0x2115U, 0x8182U,
+    0x4B80U, 0xEB17U, 0xAA39U, 0x0AAEU, 0x2865U, 0x88F2U, 0xC9DCU, 0x694BU,
+    0x8C4AU, 0x2CDDU, 0x6DF3U, 0xCD64U, 0xEFAFU, 0x4F38U, 0x0E16U, 0xAE81U,
+    0x3A85U, 0x9A12U, 0xDB3CU, 0x7BABU, 0x5960U, 0xF9F7U, 0xB8D9U, 0x184EU,
+    0xFD4FU, 0x5DD8U, 0x1CF6U, 0xBC61U, 0x9EAAU, 0x3E3DU, 0x7F13U, 0xDF84U,
+    0x1586U, 0xB511U, 0xF43FU, 0x54A8U, 0x7663U, 0xD6F4U, 0x97DAU, 0x374DU,
+    0xD24CU, 0x72DBU, 0x33F5U, 0x9362U, 0xB1A9U, 0x113EU, 0x5010U, 0xF087U,
+};
+
+// poly = 0x1864CFB, reverse = False
+static const UINT32 predefinedTable15[256] = {
+    0x000000U, 0x864CFBU, 0x8AD50DU, 0x0C99F6U,
+    0x93E6E1U, 0x15AA1AU, 0x1933ECU, 0x9F7F17U,
+    0xA18139U, 0x27CDC2U, 0x2B5434U, 0xAD18CFU,
+    0x3267D8U, 0xB42B23U, 0xB8B2D5U, 0x3EFE2EU,
+    0xC54E89U, 0x430272U, 0x4F9B84U, 0xC9D77FU,
+    0x56A868U, 0xD0E493U, 0xDC7D65U, 0x5A319EU,
+    0x64CFB0U, 0xE2834BU, 0xEE1ABDU, 0x685646U,
+    0xF72951U, 0x7165AAU, 0x7DFC5CU, 0xFBB0A7U,
+    0x0CD1E9U, 0x8A9D12U, 0x8604E4U, 0x00481FU,
+    0x9F3708U, 0x197BF3U, 0x15E205U, 0x93AEFEU,
+    0xAD50D0U, 0x2B1C2BU, 0x2785DDU, 0xA1C926U,
+    0x3EB631U, 0xB8FACAU, 0xB4633CU, 0x322FC7U,
+    0xC99F60U, 0x4FD39BU, 0x434A6DU, 0xC50696U,
+    0x5A7981U, 0xDC357AU, 0xD0AC8CU, 0x56E077U,
+    0x681E59U, 0xEE52A2U, 0xE2CB54U, 0x6487AFU,
+    0xFBF8B8U, 0x7DB443U, 0x712DB5U, 0xF7614EU,
+    0x19A3D2U, 0x9FEF29U, 0x9376DFU, 0x153A24U,
+    0x8A4533U, 0x0C09C8U, 0x00903EU, 0x86DCC5U,
+    0xB822EBU, 0x3E6E10U, 0x32F7E6U, 0xB4BB1DU,
+    0x2BC40AU, 0xAD88F1U, 0xA11107U, 0x275DFCU,
+    0xDCED5BU, 0x5AA1A0U, 0x563856U, 0xD074ADU,
+    0x4F0BBAU, 0xC94741U, 0xC5DEB7U, 0x43924CU,
+    0x7D6C62U, 0xFB2099U, 0xF7B96FU, 0x71F594U,
+    0xEE8A83U, 0x68C678U, 0x645F8EU, 0xE21375U,
+    0x15723BU, 0x933EC0U, 0x9FA736U, 0x19EBCDU,
+    0x8694DAU, 0x00D821U, 0x0C41D7U, 0x8A0D2CU,
+    0xB4F302U, 0x32BFF9U, 0x3E260FU, 0xB86AF4U,
+    0x2715E3U, 0xA15918U, 0xADC0EEU, 0x2B8C15U,
+    0xD03CB2U, 0x567049U, 0x5AE9BFU, 0xDCA544U,
+    0x43DA53U, 0xC596A8U, 0xC90F5EU, 0x4F43A5U,
+    0x71BD8BU, 0xF7F170U, 0xFB6886U, 0x7D247DU,
+    0xE25B6AU, 0x641791U, 0x688E67U, 0xEEC29CU,
+    0x3347A4U, 0xB50B5FU, 0xB992A9U, 0x3FDE52U,
+    0xA0A145U, 0x26EDBEU, 0x2A7448U, 0xAC38B3U,
+    0x92C69DU, 0x148A66U, 0x181390U, 0x9E5F6BU,
+    0x01207CU, 0x876C87U, 0x8BF571U, 0x0DB98AU,
+    0xF6092DU, 0x7045D6U, 0x7CDC20U, 0xFA90DBU,
+    0x65EFCCU, 0xE3A337U, 0xEF3AC1U, 0x69763AU,
+    0x578814U, 0xD1C4EFU, 0xDD5D19U, 0x5B11E2U,
+    0xC46EF5U, 0x42220EU, 0x4EBBF8U, 0xC8F703U,
+    0x3F964DU, 0xB9DAB6U, 0xB54340U, 0x330FBBU,
+    0xAC70ACU, 0x2A3C57U, 0x26A5A1U, 0xA0E95AU,
+    0x9E1774U, 0x185B8FU, 0x14C279U, 0x928E82U,
+    0x0DF195U, 0x8BBD6EU, 0x872498U, 0x016863U,
+    0xFAD8C4U, 0x7C943FU, 0x700DC9U, 0xF64132U,
+    0x693E25U, 0xEF72DEU, 0xE3EB28U, 0x65A7D3U,
+    0x5B59FDU, 0xDD1506U, 0xD18CF0U, 0x57C00BU,
+    0xC8BF1CU, 0x4EF3E7U, 0x426A11U, 0xC426EAU,
+    0x2AE476U, 0xACA88DU, 0xA0317BU, 0x267D80U,
+    0xB90297U, 0x3F4E6CU, 0x33D79AU, 0xB59B61U,
+    0x8B654FU, 0x0D29B4U, 0x01B042U, 0x87FCB9U,
+    0x1883AEU, 0x9ECF55U, 0x9256A3U, 0x141A58U,
+    0xEFAAFFU, 0x69E604U, 0x657FF2U, 0xE33309U,
+    0x7C4C1EU, 0xFA00E5U, 0xF69913U, 0x70D5E8U,
+    0x4E2BC6U, 0xC8673DU, 0xC4FECBU, 0x42B230U,
+    0xDDCD27U, 0x5B81DCU, 0x57182AU, 0xD154D1U,
+    0x26359FU, 0xA07964U, 0xACE092U, 0x2AAC69U,
+    0xB5D37EU, 0x339F85U, 0x3F0673U, 0xB94A88U,
+    0x87B4A6U, 0x01F85DU, 0x0D61ABU, 0x8B2D50U,
+    0x145247U, 0x921EBCU, 0x9E874AU, 0x18CBB1U,
+    0xE37B16U, 0x6537EDU, 0x69AE1BU, 0xEFE2E0U,
+    0x709DF7U, 0xF6D10CU, 0xFA48FAU, 0x7C0401U,
+    0x42FA2FU, 0xC4B6D4U, 0xC82F22U, 0x4E63D9U,
+    0xD11CCEU, 0x575035U, 0x5BC9C3U, 0xDD8538U,
+};
+
+// poly = 0x15D6DCB, reverse = False
+static const UINT32 predefinedTable16[256] = {
+    0x000000U, 0x5D6DCBU, 0xBADB96U, 0xE7B65DU,
+    0x28DAE7U, 0x75B72CU, 0x920171U, 0xCF6CBAU,
+    0x51B5CEU, 0x0CD805U, 0xEB6E58U, 0xB60393U,
+    0x796F29U, 0x2402E2U, 0xC3B4BFU, 0x9ED974U,
+    0xA36B9CU, 0xFE0657U, 0x19B00AU, 0x44DDC1U,
+    0x8BB17BU, 0xD6DCB0U, 0x316AEDU, 0x6C0726U,
+    0xF2DE52U, 0xAFB399U, 0x4805C4U, 0x15680FU,
+    0xDA04B5U, 0x87697EU, 0x60DF23U, 0x3DB2E8U,
+    0x1BBAF3U, 0x46D738U, 0xA16165U, 0xFC0CAEU,
+    0x336014U, 0x6E0DDFU, 0x89BB82U, 0xD4D649U,
+    0x4A0F3DU, 0x1762F6U, 0xF0D4ABU, 0xADB960U,
+    0x62D5DAU, 0x3FB811U, 0xD80E4CU, 0x856387U,
+    0xB8D16FU, 0xE5BCA4U, 0x020AF9U, 0x5F6732U,
+    0x900B88U, 0xCD6643U, 0x2AD01EU, 0x77BDD5U,
+    0xE964A1U, 0xB4096AU, 0x53BF37U, 0x0ED2FCU,
+    0xC1BE46U, 0x9CD38DU, 0x7B65D0U, 0x26081BU,
+    0x3775E6U, 0x6A182DU, 0x8DAE70U, 0xD0C3BBU,
+    0x1FAF01U, 0x42C2CAU, 0xA57497U, 0xF8195CU,
+    0x66C028U, 0x3BADE3U, 0xDC1BBEU, 0x817675U,
+    0x4E1ACFU, 0x137704U, 0xF4C159U, 0xA9AC92U,
+    0x941E7AU, 0xC973B1U, 0x2EC5ECU, 0x73A827U,
+    0xBCC49DU, 0xE1A956U, 0x061F0BU, 0x5B72C0U,
+    0xC5ABB4U, 0x98C67FU, 0x7F7022U, 0x221DE9U,
+    0xED7153U, 0xB01C98U, 0x57AAC5U, 0x0AC70EU,
+    0x2CCF15U, 0x71A2DEU, 0x961483U, 0xCB7948U,
+    0x0415F2U, 0x597839U, 0xBECE64U, 0xE3A3AFU,
+    0x7D7ADBU, 0x201710U, 0xC7A14DU, 0x9ACC86U,
+    0x55A03CU, 0x08CDF7U, 0xEF7BAAU, 0xB21661U,
+    0x8FA489U, 0xD2C942U, 0x357F1FU, 0x6812D4U,
+    0xA77E6EU, 0xFA13A5U, 0x1DA5F8U, 0x40C833U,
+    0xDE1147U, 0x837C8CU, 0x64CAD1U, 0x39A71AU,
+    0xF6CBA0U, 0xABA66BU, 0x4C1036U, 0x117DFDU,
+    0x6EEBCCU, 0x338607U, 0xD4305AU, 0x895D91U,
+    0x46312BU, 0x1B5CE0U, 0xFCEABDU, 0xA18776U,
+    0x3F5E02U, 0x6233C9U, 0x858594U, 0xD8E85FU,
+    0x1784E5U, 0x4AE92EU, 0xAD5F73U, 0xF032B8U,
+    0xCD8050U, 0x90ED9BU, 0x775BC6U, 0x2A360DU,
+    0xE55AB7U, 0xB8377CU, 0x5F8121U, 0x02ECEAU,
+    0x9C359EU, 0xC15855U, 0x26EE08U, 0x7B83C3U,
+    0xB4EF79U, 0xE982B2U, 0x0E34EFU, 0x535924U,
+    0x75513FU, 0x283CF4U, 0xCF8AA9U, 0x92E762U,
+    0x5D8BD8U, 0x00E613U, 0xE7504EU, 0xBA3D85U,
+    0x24E4F1U, 0x79893AU, 0x9E3F67U, 0xC352ACU,
+    0x0C3E16U, 0x5153DDU, 0xB6E580U, 0xEB884BU,
+    0xD63AA3U, 0x8B5768U, 0x6CE135U, 0x318CFEU,
+    0xFEE044U, 0xA38D8FU, 0x443BD2U, 0x195619U,
+    0x878F6DU, 0xDAE2A6U, 0x3D54FBU, 0x603930U,
+    0xAF558AU, 0xF23841U, 0x158E1CU, 0x48E3D7U,
+    0x599E2AU, 0x04F3E1U, 0xE345BCU, 0xBE2877U,
+    0x7144CDU, 0x2C2906U, 0xCB9F5BU, 0x96F290U,
+    0x082BE4U, 0x55462FU, 0xB2F072U, 0xEF9DB9U,
+    0x20F103U, 0x7D9CC8U, 0x9A2A95U, 0xC7475EU,
+    0xFAF5B6U, 0xA7987DU, 0x402E20U, 0x1D43EBU,
+    0xD22F51U, 0x8F429AU, 0x68F4C7U, 0x35990CU,
+    0xAB4078U, 0xF62DB3U, 0x119BEEU, 0x4CF625U,
+    0x839A9FU, 0xDEF754U, 0x394109U, 0x642CC2U,
+    0x4224D9U, 0x1F4912U, 0xF8FF4FU, 0xA59284U,
+    0x6AFE3EU, 0x3793F5U, 0xD025A8U, 0x8D4863U,
+    0x139117U, 0x4EFCDCU, 0xA94A81U, 0xF4274AU,
+    0x3B4BF0U, 0x66263BU, 0x819066U, 0xDCFDADU,
+    0xE14F45U, 0xBC228EU, 0x5B94D3U, 0x06F918U,
+    0xC995A2U, 0x94F869U, 0x734E34U, 0x2E23FFU,
+    0xB0FA8BU, 0xED9740U, 0x0A211DU, 0x574CD6U,
+    0x98206CU, 0xC54DA7U, 0x22FBFAU, 0x7F9631U,
+};
+
+// poly = 0x104C11DB7, reverse = True
+static const UINT32 predefinedTable17[256] = {
+    0x00000000U, 0x77073096U, 0xEE0E612CU, 0x990951BAU,
+    0x076DC419U, 0x706AF48FU, 0xE963A535U, 0x9E6495A3U,
+    0x0EDB8832U, 0x79DCB8A4U, 0xE0D5E91EU, 0x97D2D988U,
+    0x09B64C2BU, 0x7EB17CBDU, 0xE7B82D07U, 0x90BF1D91U,
+    0x1DB71064U, 0x6AB020F2U, 0xF3B97148U, 0x84BE41DEU,
+    0x1ADAD47DU, 0x6DDDE4EBU, 0xF4D4B551U, 0x83D385C7U,
+    0x136C9856U, 0x646BA8C0U, 0xFD62F97AU, 0x8A65C9ECU,
+    0x14015C4FU, 0x63066CD9U, 0xFA0F3D63U, 0x8D080DF5U,
+    0x3B6E20C8U, 0x4C69105EU, 0xD56041E4U, 0xA2677172U,
+    0x3C03E4D1U, 0x4B04D447U, 0xD20D85FDU, 0xA50AB56BU,
+    0x35B5A8FAU, 0x42B2986CU, 0xDBBBC9D6U, 0xACBCF940U,
+    0x32D86CE3U, 0x45DF5C75U, 0xDCD60DCFU, 0xABD13D59U,
+    0x26D930ACU, 0x51DE003AU, 0xC8D75180U, 0xBFD06116U,
+    0x21B4F4B5U, 0x56B3C423U, 0xCFBA9599U, 0xB8BDA50FU,
+    0x2802B89EU, 0x5F058808U, 0xC60CD9B2U, 0xB10BE924U,
+    0x2F6F7C87U, 0x58684C11U, 0xC1611DABU, 0xB6662D3DU,
+    0x76DC4190U, 0x01DB7106U, 0x98D220BCU, 0xEFD5102AU,
+    0x71B18589U, 0x06B6B51FU, 0x9FBFE4A5U, 0xE8B8D433U,
+    0x7807C9A2U, 0x0F00F934U, 0x9609A88EU, 0xE10E9818U,
+    0x7F6A0DBBU, 0x086D3D2DU, 0x91646C97U, 0xE6635C01U,
+    0x6B6B51F4U, 0x1C6C6162U, 0x856530D8U, 0xF262004EU,
+    0x6C0695EDU, 0x1B01A57BU, 0x8208F4C1U, 0xF50FC457U,
+    0x65B0D9C6U, 0x12B7E950U, 0x8BBEB8EAU, 0xFCB9887CU,
+    0x62DD1DDFU, 0x15DA2D49U, 0x8CD37CF3U, 0xFBD44C65U,
+    0x4DB26158U, 0x3AB551CEU, 0xA3BC0074U, 0xD4BB30E2U,
+    0x4ADFA541U, 0x3DD895D7U, 0xA4D1C46DU, 0xD3D6F4FBU,
+    0x4369E96AU, 0x346ED9FCU, 0xAD678846U, 0xDA60B8D0U,
+    0x44042D73U, 0x33031DE5U, 0xAA0A4C5FU, 0xDD0D7CC9U,
+    0x5005713CU, 0x270241AAU, 0xBE0B1010U, 0xC90C2086U,
+    0x5768B525U, 0x206F85B3U, 0xB966D409U, 0xCE61E49FU,
+    0x5EDEF90EU, 0x29D9C998U, 0xB0D09822U, 0xC7D7A8B4U,
+    0x59B33D17U, 0x2EB40D81U, 0xB7BD5C3BU, 0xC0BA6CADU,
+    0xEDB88320U, 0x9ABFB3B6U, 0x03B6E20CU, 0x74B1D29AU,
+    0xEAD54739U, 0x9DD277AFU, 0x04DB2615U, 0x73DC1683U,
+    0xE3630B12U, 0x94643B84U, 0x0D6D6A3EU, 0x7A6A5AA8U,
+    0xE40ECF0BU, 0x9309FF9DU, 0x0A00AE27U, 0x7D079EB1U,
+    0xF00F9344U, 0x8708A3D2U, 0x1E01F268U, 0x6906C2FEU,
+    0xF762575DU, 0x806567CBU, 0x196C3671U, 0x6E6B06E7U,
+    0xFED41B76U, 0x89D32BE0U, 0x10DA7A5AU, 0x67DD4ACCU,
+    0xF9B9DF6FU, 0x8EBEEFF9U, 0x17B7BE43U, 0x60B08ED5U,
+    0xD6D6A3E8U, 0xA1D1937EU, 0x38D8C2C4U, 0x4FDFF252U,
+    0xD1BB67F1U, 0xA6BC5767U, 0x3FB506DDU, 0x48B2364BU,
+    0xD80D2BDAU, 0xAF0A1B4CU, 0x36034AF6U, 0x41047A60U,
+    0xDF60EFC3U, 0xA867DF55U, 0x316E8EEFU, 0x4669BE79U,
+    0xCB61B38CU, 0xBC66831AU, 0x256FD2A0U, 0x5268E236U,
+    0xCC0C7795U, 0xBB0B4703U, 0x220216B9U, 0x5505262FU,
+    0xC5BA3BBEU, 0xB2BD0B28U, 0x2BB45A92U, 0x5CB36A04U,
+    0xC2D7FFA7U, 0xB5D0CF31U, 0x2CD99E8BU, 0x5BDEAE1DU,
+    0x9B64C2B0U, 0xEC63F226U, 0x756AA39CU, 0x026D930AU,
+    0x9C0906A9U, 0xEB0E363FU, 0x72076785U, 0x05005713U,
+    0x95BF4A82U, 0xE2B87A14U, 0x7BB12BAEU, 0x0CB61B38U,
+    0x92D28E9BU, 0xE5D5BE0DU, 0x7CDCEFB7U, 0x0BDBDF21U,
+    0x86D3D2D4U, 0xF1D4E242U, 0x68DDB3F8U, 0x1FDA836EU,
+    0x81BE16CDU, 0xF6B9265BU, 0x6FB077E1U, 0x18B74777U,
+    0x88085AE6U, 0xFF0F6A70U, 0x66063BCAU, 0x11010B5CU,
+    0x8F659EFFU, 0xF862AE69U, 0x616BFFD3U, 0x166CCF45U,
+    0xA00AE278U, 0xD70DD2EEU, 0x4E048354U, 0x3903B3C2U,
+    0xA7672661U, 0xD06016F7U, 0x4969474DU, 0x3E6E77DBU,
+    0xAED16A4AU, 0xD9D65ADCU, 0x40DF0B66U, 0x37D83BF0U,
+    0xA9BCAE53U, 0xDEBB9EC5U, 0x47B2CF7FU, 0x30B5FFE9U,
+    0xBDBDF21CU, 0xCABAC28AU, 0x53B39330U, 0x24B4A3A6U,
+    0xBAD03605U, 0xCDD70693U, 0x54DE5729U, 0x23D967BFU,
+    0xB3667A2EU, 0xC4614AB8U, 0x5D681B02U, 0x2A6F2B94U,
+    0xB40BBE37U, 0xC30C8EA1U, 0x5A05DF1BU, 0x2D02EF8DU,
+};
+
+// poly = 0x104C11DB7, reverse = False
+static const UINT32 predefinedTable18[256] = {
+    0x00000000U, 0x04C11DB7U, 0x09823B6EU, 0x0D4326D9U,
+    0x130476DCU, 0x17C56B6BU, 0x1A864DB2U, 0x1E475005U,
+    0x2608EDB8U, 0x22C9F00FU, 0x2F8AD6D6U, 0x2B4BCB61U,
+    0x350C9B64U, 0x31CD86D3U, 0x3C8EA00AU, 0x384FBDBDU,
+    0x4C11DB70U, 0x48D0C6C7U, 0x4593E01EU, 0x4152FDA9U,
+    0x5F15ADACU, 0x5BD4B01BU, 0x569796C2U, 0x52568B75U,
+    0x6A1936C8U, 0x6ED82B7FU, 0x639B0DA6U, 0x675A1011U,
+    0x791D4014U, 0x7DDC5DA3U, 0x709F7B7AU, 0x745E66CDU,
+    0x9823B6E0U, 0x9CE2AB57U, 0x91A18D8EU, 0x95609039U,
+    0x8B27C03CU, 0x8FE6DD8BU, 0x82A5FB52U, 0x8664E6E5U,
+    0xBE2B5B58U, 0xBAEA46EFU, 0xB7A96036U, 0xB3687D81U,
+    0xAD2F2D84U, 0xA9EE3033U, 0xA4AD16EAU, 0xA06C0B5DU,
+    0xD4326D90U, 0xD0F37027U, 0xDDB056FEU, 0xD9714B49U,
+    0xC7361B4CU, 0xC3F706FBU, 0xCEB42022U, 0xCA753D95U,
+    0xF23A8028U, 0xF6FB9D9FU, 0xFBB8BB46U, 0xFF79A6F1U,
+    0xE13EF6F4U, 0xE5FFEB43U, 0xE8BCCD9AU, 0xEC7DD02DU,
+    0x34867077U, 0x30476DC0U, 0x3D044B19U, 0x39C556AEU,
+    0x278206ABU, 0x23431B1CU, 0x2E003DC5U, 0x2AC12072U,
+    0x128E9DCFU, 0x164F8078U, 0x1B0CA6A1U, 0x1FCDBB16U,
+    0x018AEB13U, 0x054BF6A4U, 0x0808D07DU, 0x0CC9CDCAU,
+    0x7897AB07U, 0x7C56B6B0U, 0x71159069U, 0x75D48DDEU,
+    0x6B93DDDBU, 0x6F52C06CU, 0x6211E6B5U, 0x66D0FB02U,
+    0x5E9F46BFU, 0x5A5E5B08U, 0x571D7DD1U, 0x53DC6066U,
+    0x4D9B3063U, 0x495A2DD4U, 0x44190B0DU, 0x40D816BAU,
+    0xACA5C697U, 0xA864DB20U, 0xA527FDF9U, 0xA1E6E04EU,
+    0xBFA1B04BU, 0xBB60ADFCU, 0xB6238B25U, 0xB2E29692U,
+    0x8AAD2B2FU, 0x8E6C3698U, 0x832F1041U, 0x87EE0DF6U,
+    0x99A95DF3U, 0x9D684044U, 0x902B669DU, 0x94EA7B2AU,
+    0xE0B41DE7U, 0xE4750050U, 0xE9362689U, 0xEDF73B3EU,
+    0xF3B06B3BU, 0xF771768CU, 0xFA325055U, 0xFEF34DE2U,
+    0xC6BCF05FU, 0xC27DEDE8U, 0xCF3ECB31U, 0xCBFFD686U,
+    0xD5B88683U, 0xD1799B34U, 0xDC3ABDEDU, 0xD8FBA05AU,
+    0x690CE0EEU, 0x6DCDFD59U, 0x608EDB80U, 0x644FC637U,
+    0x7A089632U, 0x7EC98B85U, 0x738AAD5CU, 0x774BB0EBU,
+    0x4F040D56U, 0x4BC510E1U, 0x46863638U, 0x42472B8FU,
+    0x5C007B8AU, 0x58C1663DU, 0x558240E4U, 0x51435D53U,
+    0x251D3B9EU, 0x21DC2629U, 0x2C9F00F0U, 0x285E1D47U,
+    0x36194D42U, 0x32D850F5U, 0x3F9B762CU, 0x3B5A6B9BU,
+    0x0315D626U, 0x07D4CB91U, 0x0A97ED48U, 0x0E56F0FFU,
+    0x1011A0FAU, 0x14D0BD4DU, 0x19939B94U, 0x1D528623U,
+    0xF12F560EU, 0xF5EE4BB9U, 0xF8AD6D60U, 0xFC6C70D7U,
+    0xE22B20D2U, 0xE6EA3D65U, 0xEBA91BBCU, 0xEF68060BU,
+    0xD727BBB6U, 0xD3E6A601U, 0xDEA580D8U, 0xDA649D6FU,
+    0xC423CD6AU, 0xC0E2D0DDU, 0xCDA1F604U, 0xC960EBB3U,
+    0xBD3E8D7EU, 0xB9FF90C9U, 0xB4BCB610U, 0xB07DABA7U,
+    0xAE3AFBA2U, 0xAAFBE615U, 0xA7B8C0CCU, 0xA379DD7BU,
+    0x9B3660C6U, 0x9FF77D71U, 0x92B45BA8U, 0x9675461FU,
+    0x8832161AU, 0x8CF30BADU, 0x81B02D74U, 0x857130C3U,
+    0x5D8A9099U, 0x594B8D2EU, 0x5408ABF7U, 0x50C9B640U,
+    0x4E8EE645U, 0x4A4FFBF2U, 0x470CDD2BU, 0x43CDC09CU,
+    0x7B827D21U, 0x7F436096U, 0x7200464FU, 0x76C15BF8U,
+    0x68860BFDU, 0x6C47164AU, 0x61043093U, 0x65C52D24U,
+    0x119B4BE9U, 0x155A565EU, 0x18197087U, 0x1CD86D30U,
+    0x029F3D35U, 0x065E2082U, 0x0B1D065BU, 0x0FDC1BECU,
+    0x3793A651U, 0x3352BBE6U, 0x3E119D3FU, 0x3AD08088U,
+    0x2497D08DU, 0x2056CD3AU, 0x2D15EBE3U, 0x29D4F654U,
+    0xC5A92679U, 0xC1683BCEU, 0xCC2B1D17U, 0xC8EA00A0U,
+    0xD6AD50A5U, 0xD26C4D12U, 0xDF2F6BCBU, 0xDBEE767CU,
+    0xE3A1CBC1U, 0xE760D676U, 0xEA23F0AFU, 0xEEE2ED18U,
+    0xF0A5BD1DU, 0xF464A0AAU, 0xF9278673U, 0xFDE69BC4U,
+    0x89B8FD09U, 0x8D79E0BEU, 0x803AC667U, 0x84FBDBD0U,
+    0x9ABC8BD5U, 0x9E7D9662U, 0x933EB0BBU, 0x97FFAD0CU,
+    0xAFB010B1U, 0xAB710D06U, 0xA6322BDFU, 0xA2F33668U,
+    0xBCB4666DU, 0xB8757BDAU, 0xB5365D03U, 0xB1F740B4U,
+};
+
+// poly = 0x11EDC6F41, reverse = True
+static const UINT32 predefinedTable19[256] = {
+    0x00000000U, 0xF26B8303U, 0xE13B70F7U, 0x1350F3F4U,
+    0xC79A971FU, 0x35F1141CU, 0x26A1E7E8U, 0xD4CA64EBU,
+    0x8AD958CFU, 0x78B2DBCCU, 0x6BE22838U, 0x9989AB3BU,
+    0x4D43CFD0U, 0xBF284CD3U, 0xAC78BF27U, 0x5E133C24U,
+    0x105EC76FU, 0xE235446CU, 0xF165B798U, 0x030E349BU,
+    0xD7C45070U, 0x25AFD373U, 0x36FF2087U, 0xC494A384U,
+    0x9A879FA0U, 0x68EC1CA3U, 0x7BBCEF57U, 0x89D76C54U,
+    0x5D1D08BFU, 0xAF768BBCU, 0xBC267848U, 0x4E4DFB4BU,
+    0x20BD8EDEU, 0xD2D60DDDU, 0xC186FE29U, 0x33ED7D2AU,
+    0xE72719C1U, 0x154C9AC2U, 0x061C6936U, 0xF477EA35U,
+    0xAA64D611U, 0x580F5512U, 0x4B5FA6E6U, 0xB93425E5U,
+    0x6DFE410EU, 0x9F95C20DU, 0x8CC531F9U, 0x7EAEB2FAU,
+    0x30E349B1U, 0xC288CAB2U, 0xD1D83946U, 0x23B3BA45U,
+    0xF779DEAEU, 0x05125DADU, 0x1642AE59U, 0xE4292D5AU,
+    0xBA3A117EU, 0x4851927DU, 0x5B016189U, 0xA96AE28AU,
+    0x7DA08661U, 0x8FCB0562U, 0x9C9BF696U, 0x6EF07595U,
+    0x417B1DBCU, 0xB3109EBFU, 0xA0406D4BU, 0x522BEE48U,
+    0x86E18AA3U, 0x748A09A0U, 0x67DAFA54U, 0x95B17957U,
+    0xCBA24573U, 0x39C9C670U, 0x2A993584U, 0xD8F2B687U,
+    0x0C38D26CU, 0xFE53516FU, 0xED03A29BU, 0x1F682198U,
+    0x5125DAD3U, 0xA34E59D0U, 0xB01EAA24U, 0x42752927U,
+    0x96BF4DCCU, 0x64D4CECFU, 0x77843D3BU, 0x85EFBE38U,
+    0xDBFC821CU, 0x2997011FU, 0x3AC7F2EBU, 0xC8AC71E8U,
+    0x1C661503U, 0xEE0D9600U, 0xFD5D65F4U, 0x0F36E6F7U,
+    0x61C69362U, 0x93AD1061U, 0x80FDE395U, 0x72966096U,
+    0xA65C047DU, 0x5437877EU, 0x4767748AU, 0xB50CF789U,
+    0xEB1FCBADU, 0x197448AEU, 0x0A24BB5AU, 0xF84F3859U,
+    0x2C855CB2U, 0xDEEEDFB1U, 0xCDBE2C45U, 0x3FD5AF46U,
+    0x7198540DU, 0x83F3D70EU, 0x90A324FAU, 0x62C8A7F9U,
+    0xB602C312U, 0x44694011U, 0x5739B3E5U, 0xA55230E6U,
+    0xFB410CC2U, 0x092A8FC1U, 0x1A7A7C35U, 0xE811FF36U,
+    0x3CDB9BDDU, 0xCEB018DEU, 0xDDE0EB2AU, 0x2F8B6829U,
+    0x82F63B78U, 0x709DB87BU, 0x63CD4B8FU, 0x91A6C88CU,
+    0x456CAC67U, 0xB7072F64U, 0xA457DC90U, 0x563C5F93U,
+    0x082F63B7U, 0xFA44E0B4U, 0xE9141340U, 0x1B7F9043U,
+    0xCFB5F4A8U, 0x3DDE77ABU, 0x2E8E845FU, 0xDCE5075CU,
+    0x92A8FC17U, 0x60C37F14U, 0x73938CE0U, 0x81F80FE3U,
+    0x55326B08U, 0xA759E80BU, 0xB4091BFFU, 0x466298FCU,
+    0x1871A4D8U, 0xEA1A27DBU, 0xF94AD42FU, 0x0B21572CU,
+    0xDFEB33C7U, 0x2D80B0C4U, 0x3ED04330U, 0xCCBBC033U,
+    0xA24BB5A6U, 0x502036A5U, 0x4370C551U, 0xB11B4652U,
+    0x65D122B9U, 0x97BAA1BAU, 0x84EA524EU, 0x7681D14DU,
+    0x2892ED69U, 0xDAF96E6AU, 0xC9A99D9EU, 0x3BC21E9DU,
+    0xEF087A76U, 0x1D63F975U, 0x0E330A81U, 0xFC588982U,
+    0xB21572C9U, 0x407EF1CAU, 0x532E023EU, 0xA145813DU,
+    0x758FE5D6U, 0x87E466D5U, 0x94B49521U, 0x66DF1622U,
+    0x38CC2A06U, 0xCAA7A905U, 0xD9F75AF1U, 0x2B9CD9F2U,
+    0xFF56BD19U, 0x0D3D3E1AU, 0x1E6DCDEEU, 0xEC064EEDU,
+    0xC38D26C4U, 0x31E6A5C7U, 0x22B65633U, 0xD0DDD530U,
+    0x0417B1DBU, 0xF67C32D8U, 0xE52CC12CU, 0x1747422FU,
+    0x49547E0BU, 0xBB3FFD08U, 0xA86F0EFCU, 0x5A048DFFU,
+    0x8ECEE914U, 0x7CA56A17U, 0x6FF599E3U, 0x9D9E1AE0U,
+    0xD3D3E1ABU, 0x21B862A8U, 0x32E8915CU, 0xC083125FU,
+    0x144976B4U, 0xE622F5B7U, 0xF5720643U, 0x07198540U,
+    0x590AB964U, 0xAB613A67U, 0xB831C993U, 0x4A5A4A90U,
+    0x9E902E7BU, 0x6CFBAD78U, 0x7FAB5E8CU, 0x8DC0DD8FU,
+    0xE330A81AU, 0x115B2B19U, 0x020BD8EDU, 0xF0605BEEU,
+    0x24AA3F05U, 0xD6C1BC06U, 0xC5914FF2U, 0x37FACCF1U,
+    0x69E9F0D5U, 0x9B8273D6U, 0x88D28022U, 0x7AB90321U,
+    0xAE7367CAU, 0x5C18E4C9U, 0x4F48173DU, 0xBD23943EU,
+    0xF36E6F75U, 0x0105EC76U, 0x12551F82U, 0xE03E9C81U,
+    0x34F4F86AU, 0xC69F7B69U, 0xD5CF889DU, 0x27A40B9EU,
+    0x79B737BAU, 0x8BDCB4B9U, 0x988C474DU, 0x6AE7C44EU,
+    0xBE2DA0A5U, 0x4C4623A6U, 0x5F16D052U, 0xAD7D5351U,
+};
+
+// poly = 0x1A833982B, reverse = True
+static const UINT32 predefinedTable20[256] = {
+    0x00000000U, 0x2BDDD04FU, 0x57BBA09EU, 0x7C6670D1U,
+    0xAF77413CU, 0x84AA9173U, 0xF8CCE1A2U, 0xD31131EDU,
+    0xF6DD1A53U, 0xDD00CA1CU, 0xA166BACDU, 0x8ABB6A82U,
+    0x59AA5B6FU, 0x72778B20U, 0x0E11FBF1U, 0x25CC2BBEU,
+    0x4589AC8DU, 0x6E547CC2U, 0x12320C13U, 0x39EFDC5CU,
+    0xEAFEEDB1U, 0xC1233DFEU, 0xBD454D2FU, 0x96989D60U,
+    0xB354B6DEU, 0x98896691U, 0xE4EF1640U, 0xCF32C60FU,
+    0x1C23F7E2U, 0x37FE27ADU, 0x4B98577CU, 0x60458733U,
+    0x8B13591AU, 0xA0CE8955U, 0xDCA8F984U, 0xF77529CBU,
+    0x24641826U, 0x0FB9C869U, 0x73DFB8B8U, 0x580268F7U,
+    0x7DCE4349U, 0x56139306U, 0x2A75E3D7U, 0x01A83398U,
+    0xD2B90275U, 0xF964D23AU, 0x8502A2EBU, 0xAEDF72A4U,
+    0xCE9AF597U, 0xE54725D8U, 0x99215509U, 0xB2FC8546U,
+    0x61EDB4ABU, 0x4A3064E4U, 0x36561435U, 0x1D8BC47AU,
+    0x3847EFC4U, 0x139A3F8BU, 0x6FFC4F5AU, 0x44219F15U,
+    0x9730AEF8U, 0xBCED7EB7U, 0xC08B0E66U, 0xEB56DE29U,
+    0xBE152A1FU, 0x95C8FA50U, 0xE9AE8A81U, 0xC2735ACEU,
+    0x11626B23U, 0x3ABFBB6CU, 0x46D9CBBDU, 0x6D041BF2U,
+    0x48C8304CU, 0x6315E003U, 0x1F7390D2U, 0x34AE409DU,
+    0xE7BF7170U, 0xCC62A13FU, 0xB004D1EEU, 0x9BD901A1U,
+    0xFB9C8692U, 0xD04156DDU, 0xAC27260CU, 0x87FAF643U,
+    0x54EBC7AEU, 0x7F3617E1U, 0x03506730U, 0x288DB77FU,
+    0x0D419CC1U, 0x269C4C8EU, 0x5AFA3C5FU, 0x7127EC10U,
+    0xA236DDFDU, 0x89EB0DB2U, 0xF58D7D63U, 0xDE50AD2CU,
+    0x35067305U, 0x1EDBA34AU, 0x62BDD39BU, 0x496003D4U,
+    0x9A713239U, 0xB1ACE276U, 0xCDCA92A7U, 0xE61742E8U,
+    0xC3DB6956U, 0xE806B919U, 0x9460C9C8U, 0xBFBD1987U,
+    0x6CAC286AU, 0x4771F825U, 0x3B1788F4U, 0x10CA58BBU,
+    0x708FDF88U, 0x5B520FC7U, 0x27347F16U, 0x0CE9AF59U,
+    0xDFF89EB4U, 0xF4254EFBU, 0x88433E2AU, 0xA39EEE65U,
+    0x8652C5DBU, 0xAD8F1594U, 0xD1E96545U, 0xFA34B50AU,
+    0x292584E7U, 0x02F854A8U, 0x7E9E2479U, 0x5543F436U,
+    0xD419CC15U, 0xFFC41C5AU, 0x83A26C8BU, 0xA87FBCC4U,
+    0x7B6E8D29U, 0x50B35D66U, 0x2CD52DB7U, 0x0708FDF8U,
+    0x22C4D646U, 0x09190609U, 0x757F76D8U, 0x5EA2A697U,
+    0x8DB3977AU, 0xA66E4735U, 0xDA0837E4U, 0xF1D5E7ABU,
+    0x91906098U, 0xBA4DB0D7U, 0xC62BC006U, 0xEDF61049U,
+    0x3EE721A4U, 0x153AF1EBU, 0x695C813AU, 0x42815175U,
+    0x674D7ACBU, 0x4C90AA84U, 0x30F6DA55U, 0x1B2B0A1AU,
+    0xC83A3BF7U, 0xE3E7EBB8U, 0x9F819B69U, 0xB45C4B26U,
+    0x5F0A950FU, 0x74D74540U, 0x08B13591U, 0x236CE5DEU,
+    0xF07DD433U, 0xDBA0047CU, 0xA7C674ADU, 0x8C1BA4E2U,
+    0xA9D78F5CU, 0x820A5F13U, 0xFE6C2FC2U, 0xD5B1FF8DU,
+    0x06A0CE60U, 0x2D7D1E2FU, 0x511B6EFEU, 0x7AC6BEB1U,
+    0x1A833982U, 0x315EE9CDU, 0x4D38991CU, 0x66E54953U,
+    0xB5F478BEU, 0x9E29A8F1U, 0xE24FD820U, 0xC992086FU,
+    0xEC5E23D1U, 0xC783F39EU, 0xBBE5834FU, 0x90385300U,
+    0x432962EDU, 0x68F4B2A2U, 0x1492C273U, 0x3F4F123CU,
+    0x6A0CE60AU, 0x41D13645U, 0x3DB74694U, 0x166A96DBU,
+    0xC57BA736U, 0xEEA67779U, 0x92C007A8U, 0xB91DD7E7U,
+    0x9CD1FC59U, 0xB70C2C16U, 0xCB6A5CC7U, 0xE0B78C88U,
+    0x33A6BD65U, 0x187B6D2AU, 0x641D1DFBU, 0x4FC0CDB4U,
+    0x2F854A87U, 0x04589AC8U, 0x783EEA19U, 0x53E33A56U,
+    0x80F20BBBU, 0xAB2FDBF4U, 0xD749AB25U, 0xFC947B6AU,
+    0xD95850D4U, 0xF285809BU, 0x8EE3F04AU, 0xA53E2005U,
+    0x762F11E8U, 0x5DF2C1A7U, 0x2194B176U, 0x0A496139U,
+    0xE11FBF10U, 0xCAC26F5FU, 0xB6A41F8EU, 0x9D79CFC1U,
+    0x4E68FE2CU, 0x65B52E63U, 0x19D35EB2U, 0x320E8EFDU,
+    0x17C2A543U, 0x3C1F750CU, 0x407905DDU, 0x6BA4D592U,
+    0xB8B5E47FU, 0x93683430U, 0xEF0E44E1U, 0xC4D394AEU,
+    0xA496139DU, 0x8F4BC3D2U, 0xF32DB303U, 0xD8F0634CU,
+    0x0BE152A1U, 0x203C82EEU, 0x5C5AF23FU, 0x77872270U,
+    0x524B09CEU, 0x7996D981U, 0x05F0A950U, 0x2E2D791FU,
+    0xFD3C48F2U, 0xD6E198BDU, 0xAA87E86CU, 0x815A3823U,
+};
+
+// poly = 0x1814141AB, reverse = False
+static const UINT32 predefinedTable21[256] = {
+    0x00000000U, 0x814141ABU, 0x83C3C2FDU, 0x02828356U,
+    0x86C6C451U, 0x078785FAU, 0x050506ACU, 0x84444707U,
+    0x8CCCC909U, 0x0D8D88A2U, 0x0F0F0BF4U, 0x8E4E4A5FU,
+    0x0A0A0D58U, 0x8B4B4CF3U, 0x89C9CFA5U, 0x08888E0EU,
+    0x98D8D3B9U, 0x19999212U, 0x1B1B1144U, 0x9A5A50EFU,
+    0x1E1E17E8U, 0x9F5F5643U, 0x9DDDD515U, 0x1C9C94BEU,
+    0x14141AB0U, 0x95555B1BU, 0x97D7D84DU, 0x169699E6U,
+    0x92D2DEE1U, 0x13939F4AU, 0x11111C1CU, 0x90505DB7U,
+    0xB0F0E6D9U, 0x31B1A772U, 0x33332424U, 0xB272658FU,
+    0x36362288U, 0xB7776323U, 0xB5F5E075U, 0x34B4A1DEU,
+    0x3C3C2FD0U, 0xBD7D6E7BU, 0xBFFFED2DU, 0x3EBEAC86U,
+    0xBAFAEB81U, 0x3BBBAA2AU, 0x3939297CU, 0xB87868D7U,
+    0x28283560U, 0xA96974CBU, 0xABEBF79DU, 0x2AAAB636U,
+    0xAEEEF131U, 0x2FAFB09AU, 0x2D2D33CCU, 0xAC6C7267U,
+    0xA4E4FC69U, 0x25A5BDC2U, 0x27273E94U, 0xA6667F3FU,
+    0x22223838U, 0xA3637993U, 0xA1E1FAC5U, 0x20A0BB6EU,
+    0xE0A08C19U, 0x61E1CDB2U, 0x63634EE4U, 0xE2220F4FU,
+    0x66664848U, 0xE72709E3U, 0xE5A58AB5U, 0x64E4CB1EU,
+    0x6C6C4510U, 0xED2D04BBU, 0xEFAF87EDU, 0x6EEEC646U,
+    0xEAAA8141U, 0x6BEBC0EAU, 0x696943BCU, 0xE8280217U,
+    0x78785FA0U, 0xF9391E0BU, 0xFBBB9D5DU, 0x7AFADCF6U,
+    0xFEBE9BF1U, 0x7FFFDA5AU, 0x7D7D590CU, 0xFC3C18A7U,
+    0xF4B496A9U, 0x75F5D702U, 0x77775454U, 0xF63615FFU,
+    0x727252F8U, 0xF3331353U, 0xF1B19005U, 0x70F0D1AEU,
+    0x50506AC0U, 0xD1112B6BU, 0xD393A83DU, 0x52D2E996U,
+    0xD696AE91U, 0x57D7EF3AU, 0x55556C6CU, 0xD4142DC7U,
+    0xDC9CA3C9U, 0x5DDDE262U, 0x5F5F6134U, 0xDE1E209FU,
+    0x5A5A6798U, 0xDB1B2633U, 0xD999A565U, 0x58D8E4CEU,
+    0xC888B979U, 0x49C9F8D2U, 0x4B4B7B84U, 0xCA0A3A2FU,
+    0x4E4E7D28U, 0xCF0F3C83U, 0xCD8DBFD5U, 0x4CCCFE7EU,
+    0x44447070U, 0xC50531DBU, 0xC787B28DU, 0x46C6F326U,
+    0xC282B421U, 0x43C3F58AU, 0x414176DCU, 0xC0003777U,
+    0x40005999U, 0xC1411832U, 0xC3C39B64U, 0x4282DACFU,
+    0xC6C69DC8U, 0x4787DC63U, 0x45055F35U, 0xC4441E9EU,
+    0xCCCC9090U, 0x4D8DD13BU, 0x4F0F526DU, 0xCE4E13C6U,
+    0x4A0A54C1U, 0xCB4B156AU, 0xC9C9963CU, 0x4888D797U,
+    0xD8D88A20U, 0x5999CB8BU, 0x5B1B48DDU, 0xDA5A0976U,
+    0x5E1E4E71U, 0xDF5F0FDAU, 0xDDDD8C8CU, 0x5C9CCD27U,
+    0x54144329U, 0xD5550282U, 0xD7D781D4U, 0x5696C07FU,
+    0xD2D28778U, 0x5393C6D3U, 0x51114585U, 0xD050042EU,
+    0xF0F0BF40U, 0x71B1FEEBU, 0x73337DBDU, 0xF2723C16U,
+    0x76367B11U, 0xF7773ABAU, 0xF5F5B9ECU, 0x74B4F847U,
+    0x7C3C7649U, 0xFD7D37E2U, 0xFFFFB4B4U, 0x7EBEF51FU,
+    0xFAFAB218U, 0x7BBBF3B3U, 0x793970E5U, 0xF878314EU,
+    0x68286CF9U, 0xE9692D52U, 0xEBEBAE04U, 0x6AAAEFAFU,
+    0xEEEEA8A8U, 0x6FAFE903U, 0x6D2D6A55U, 0xEC6C2BFEU,
+    0xE4E4A5F0U, 0x65A5E45BU, 0x6727670DU, 0xE66626A6U,
+    0x622261A1U, 0xE363200AU, 0xE1E1A35CU, 0x60A0E2F7U,
+    0xA0A0D580U, 0x21E1942BU, 0x2363177DU, 0xA22256D6U,
+    0x266611D1U, 0xA727507AU, 0xA5A5D32CU, 0x24E49287U,
+    0x2C6C1C89U, 0xAD2D5D22U, 0xAFAFDE74U, 0x2EEE9FDFU,
+    0xAAAAD8D8U, 0x2BEB9973U, 0x29691A25U, 0xA8285B8EU,
+    0x38780639U, 0xB9394792U, 0xBBBBC4C4U, 0x3AFA856FU,
+    0xBEBEC268U, 0x3FFF83C3U, 0x3D7D0095U, 0xBC3C413EU,
+    0xB4B4CF30U, 0x35F58E9BU, 0x37770DCDU, 0xB6364C66U,
+    0x32720B61U, 0xB3334ACAU, 0xB1B1C99CU, 0x30F08837U,
+    0x10503359U, 0x911172F2U, 0x9393F1A4U, 0x12D2B00FU,
+    0x9696F708U, 0x17D7B6A3U, 0x155535F5U, 0x9414745EU,
+    0x9C9CFA50U, 0x1DDDBBFBU, 0x1F5F38ADU, 0x9E1E7906U,
+    0x1A5A3E01U, 0x9B1B7FAAU, 0x9999FCFCU, 0x18D8BD57U,
+    0x8888E0E0U, 0x09C9A14BU, 0x0B4B221DU, 0x8A0A63B6U,
+    0x0E4E24B1U, 0x8F0F651AU, 0x8D8DE64CU, 0x0CCCA7E7U,
+    0x044429E9U, 0x85056842U, 0x8787EB14U, 0x06C6AABFU,
+    0x8282EDB8U, 0x03C3AC13U, 0x01412F45U, 0x80006EEEU,
+};
+
+// poly = 0x1000000AF, reverse = False
+static const UINT32 predefinedTable22[256] = {
+    0x00000000U, 0x000000AFU, 0x0000015EU, 0x000001F1U,
+    0x000002BCU, 0x00000213U, 0x000003E2U, 0x0000034DU,
+    0x00000578U, 0x000005D7U, 0x00000426U, 0x00000489U,
+    0x000007C4U, 0x0000076BU, 0x0000069AU, 0x00000635U,
+    0x00000AF0U, 0x00000A5FU, 0x00000BAEU, 0x00000B01U,
+    0x0000084CU, 0x000008E3U, 0x00000912U, 0x000009BDU,
+    0x00000F88U, 0x00000F27U, 0x00000ED6U, 0x00000E79U,
+    0x00000D34U, 0x00000D9BU, 0x00000C6AU, 0x00000CC5U,
+    0x000015E0U, 0x0000154FU, 0x000014BEU, 0x00001411U,
+    0x0000175CU, 0x000017F3U, 0x00001602U, 0x000016ADU,
+    0x00001098U, 0x00001037U, 0x000011C6U, 0x00001169U,
+    0x00001224U, 0x0000128BU, 0x0000137AU, 0x000013D5U,
+    0x00001F10U, 0x00001FBFU, 0x00001E4EU, 0x00001EE1U,
+    0x00001DACU, 0x00001D03U, 0x00001CF2U, 0x00001C5DU,
+    0x00001A68U, 0x00001AC7U, 0x00001B36U, 0x00001B99U,
+    0x000018D4U, 0x0000187BU, 0x0000198AU, 0x00001925U,
+    0x00002BC0U, 0x00002B6FU, 0x00002A9EU, 0x00002A31U,
+    0x0000297CU, 0x000029D3U, 0x00002822U, 0x0000288DU,
+    0x00002EB8U, 0x00002E17U, 0x00002FE6U, 0x00002F49U,
+    0x00002C04U, 0x00002CABU, 0x00002D5AU, 0x00002DF5U,
+    0x00002130U, 0x0000219FU, 0x0000206EU, 0x000020C1U,
+    0x0000238CU, 0x00002323U, 0x000022D2U, 0x0000227DU,
+    0x00002448U, 0x000024E7U, 0x00002516U, 0x000025B9U,
+    0x000026F4U, 0x0000265BU, 0x000027AAU, 0x00002705U,
+    0x00003E20U, 0x00003E8FU, 0x00003F7EU, 0x00003FD1U,
+    0x00003C9CU, 0x00003C33U, 0x00003DC2U, 0x00003D6DU,
+    0x00003B58U, 0x00003BF7U, 0x00003A06U, 0x00003AA9U,
+    0x000039E4U, 0x0000394BU, 0x000038BAU, 0x00003815U,
+    0x000034D0U, 0x0000347FU, 0x0000358EU, 0x00003521U,
+    0x0000366CU, 0x000036C3U, 0x00003732U, 0x0000379DU,
+    0x000031A8U, 0x00003107U, 0x000030F6U, 0x00003059U,
+    0x00003314U, 0x000033BBU, 0x0000324AU, 0x000032E5U,
+    0x00005780U, 0x0000572FU, 0x000056DEU, 0x00005671U,
+    0x0000553CU, 0x00005593U, 0x00005462U, 0x000054CDU,
+    0x000052F8U, 0x00005257U, 0x000053A6U, 0x00005309U,
+    0x00005044U, 0x000050EBU, 0x0000511AU, 0x000051B5U,
+    0x00005D70U, 0x00005DDFU, 0x00005C2EU, 0x00005C81U,
+    0x00005FCCU, 0x00005F63U, 0x00005E92U, 0x00005E3DU,
+    0x00005808U, 0x000058A7U, 0x00005956U, 0x000059F9U,
+    0x00005AB4U, 0x00005A1BU, 0x00005BEAU, 0x00005B45U,
+    0x00004260U, 0x000042CFU, 0x0000433EU, 0x00004391U,
+    0x000040DCU, 0x00004073U, 0x00004182U, 0x0000412DU,
+    0x00004718U, 0x000047B7U, 0x00004646U, 0x000046E9U,
+    0x000045A4U, 0x0000450BU, 0x000044FAU, 0x00004455U,
+    0x00004890U, 0x0000483FU, 0x000049CEU, 0x00004961U,
+    0x00004A2CU, 0x00004A83U, 0x00004B72U, 0x00004BDDU,
+    0x00004DE8U, 0x00004D47U, 0x00004CB6U, 0x00004C19U,
+    0x00004F54U, 0x00004FFBU, 0x00004E0AU, 0x00004EA5U,
+    0x00007C40U, 0x00007CEFU, 0x00007D1EU, 0x00007DB1U,
+    0x00007EFCU, 0x00007E53U, 0x00007FA2U, 0x00007F0DU,
+    0x00007938U, 0x00007997U, 0x00007866U, 0x000078C9U,
+    0x00007B84U, 0x00007B2BU, 0x00007ADAU, 0x00007A75U,
+    0x000076B0U, 0x0000761FU, 0x000077EEU, 0x00007741U,
+    0x0000740CU, 0x000074A3U, 0x00007552U, 0x000075FDU,
+    0x000073C8U, 0x00007367U, 0x00007296U, 0x00007239U,
+    0x00007174U, 0x000071DBU, 0x0000702AU, 0x00007085U,
+    0x000069A0U, 0x0000690FU, 0x000068FEU, 0x00006851U,
+    0x00006B1CU, 0x00006BB3U, 0x00006A42U, 0x00006AEDU,
+    0x00006CD8U, 0x00006C77U, 0x00006D86U, 0x00006D29U,
+    0x00006E64U, 0x00006ECBU, 0x00006F3AU, 0x00006F95U,
+    0x00006350U, 0x000063FFU, 0x0000620EU, 0x000062A1U,
+    0x000061ECU, 0x00006143U, 0x000060B2U, 0x0000601DU,
+    0x00006628U, 0x00006687U, 0x00006776U, 0x000067D9U,
+    0x00006494U, 0x0000643BU, 0x000065CAU, 0x00006565U,
+};
+
+// poly = 0x1000000000000001B, reverse = True
+static const UINT64 predefinedTable23[256] = {
+    0x0000000000000000ULL, 0x01B0000000000000ULL, 0x0360000000000000ULL,
+    0x02D0000000000000ULL, 0x06C0000000000000ULL, 0x0770000000000000ULL,
+    0x05A0000000000000ULL, 0x0410000000000000ULL, 0x0D80000000000000ULL,
+    0x0C30000000000000ULL, 0x0EE0000000000000ULL, 0x0F50000000000000ULL,
+    0x0B40000000000000ULL, 0x0AF0000000000000ULL, 0x0820000000000000ULL,
+    0x0990000000000000ULL, 0x1B00000000000000ULL, 0x1AB0000000000000ULL,
+    0x1860000000000000ULL, 0x19D0000000000000ULL, 0x1DC0000000000000ULL,
+    0x1C70000000000000ULL, 0x1EA0000000000000ULL, 0x1F10000000000000ULL,
+    0x1680000000000000ULL, 0x1730000000000000ULL, 0x15E0000000000000ULL,
+    0x1450000000000000ULL, 0x1040000000000000ULL, 0x11F0000000000000ULL,
+    0x1320000000000000ULL, 0x1290000000000000ULL, 0x3600000000000000ULL,
+    0x37B0000000000000ULL, 0x3560000000000000ULL, 0x34D0000000000000ULL,
+    0x30C0000000000000ULL, 0x3170000000000000ULL, 0x33A0000000000000ULL,
+    0x3210000000000000ULL, 0x3B80000000000000ULL, 0x3A30000000000000ULL,
+    0x38E0000000000000ULL, 0x3950000000000000ULL, 0x3D40000000000000ULL,
+    0x3CF0000000000000ULL, 0x3E20000000000000ULL, 0x3F90000000000000ULL,
+    0x2D00000000000000ULL, 0x2CB0000000000000ULL, 0x2E60000000000000ULL,
+    0x2FD0000000000000ULL, 0x2BC0000000000000ULL, 0x2A70000000000000ULL,
+    0x28A0000000000000ULL, 0x2910000000000000ULL, 0x2080000000000000ULL,
+    0x2130000000000000ULL, 0x23E0000000000000ULL, 0x2250000000000000ULL,
+    0x2640000000000000ULL, 0x27F0000000000000ULL, 0x2520000000000000ULL,
+    0x2490000000000000ULL, 0x6C00000000000000ULL, 0x6DB0000000000000ULL,
+    0x6F60000000000000ULL, 0x6ED0000000000000ULL, 0x6AC0000000000000ULL,
+    0x6B70000000000000ULL, 0x69A0000000000000ULL, 0x6810000000000000ULL,
+    0x6180000000000000ULL, 0x6030000000000000ULL, 0x62E0000000000000ULL,
+    0x6350000000000000ULL, 0x6740000000000000ULL, 0x66F0000000000000ULL,
+    0x6420000000000000ULL, 0x6590000000000000ULL, 0x7700000000000000ULL,
+    0x76B0000000000000ULL, 0x7460000000000000ULL, 0x75D0000000000000ULL,
+    0x71C0000000000000ULL, 0x7070000000000000ULL, 0x72A0000000000000ULL,
+    0x7310000000000000ULL, 0x7A80000000000000ULL, 0x7B30000000000000ULL,
+    0x79E0000000000000ULL, 0x7850000000000000ULL, 0x7C40000000000000ULL,
+    0x7DF0000000000000ULL, 0x7F20000000000000ULL, 0x7E90000000000000ULL,
+    0x5A00000000000000ULL, 0x5BB0000000000000ULL, 0x5960000000000000ULL,
+    0x58D0000000000000ULL, 0x5CC0000000000000ULL, 0x5D70000000000000ULL,
+    0x5FA0000000000000ULL, 0x5E10000000000000ULL, 0x5780000000000000ULL,
+    0x5630000000000000ULL, 0x54E0000000000000ULL, 0x5550000000000000ULL,
+    0x5140000000000000ULL, 0x50F0000000000000ULL, 0x5220000000000000ULL,
+    0x5390000000000000ULL, 0x4100000000000000ULL, 0x40B0000000000000ULL,
+    0x4260000000000000ULL, 0x43D0000000000000ULL, 0x47C0000000000000ULL,
+    0x4670000000000000ULL, 0x44A0000000000000ULL, 0x4510000000000000ULL,
+    0x4C80000000000000ULL, 0x4D30000000000000ULL, 0x4FE0000000000000ULL,
+    0x4E50000000000000ULL, 0x4A40000000000000ULL, 0x4BF0000000000000ULL,
+    0x4920000000000000ULL, 0x4890000000000000ULL, 0xD800000000000000ULL,
+    0xD9B0000000000000ULL, 0xDB60000000000000ULL, 0xDAD0000000000000ULL,
+    0xDEC0000000000000ULL, 0xDF70000000000000ULL, 0xDDA0000000000000ULL,
+    0xDC10000000000000ULL, 0xD580000000000000ULL, 0xD430000000000000ULL,
+    0xD6E0000000000000ULL, 0xD750000000000000ULL, 0xD340000000000000ULL,
+    0xD2F0000000000000ULL, 0xD020000000000000ULL, 0xD190000000000000ULL,
+    0xC300000000000000ULL, 0xC2B0000000000000ULL, 0xC060000000000000ULL,
+    0xC1D0000000000000ULL, 0xC5C0000000000000ULL, 0xC470000000000000ULL,
+    0xC6A0000000000000ULL, 0xC710000000000000ULL, 0xCE80000000000000ULL,
+    0xCF30000000000000ULL, 0xCDE0000000000000ULL, 0xCC50000000000000ULL,
+    0xC840000000000000ULL, 0xC9F0000000000000ULL, 0xCB20000000000000ULL,
+    0xCA90000000000000ULL, 0xEE00000000000000ULL, 0xEFB0000000000000ULL,
+    0xED60000000000000ULL, 0xECD0000000000000ULL, 0xE8C0000000000000ULL,
+    0xE970000000000000ULL, 0xEBA0000000000000ULL, 0xEA10000000000000ULL,
+    0xE380000000000000ULL, 0xE230000000000000ULL, 0xE0E0000000000000ULL,
+    0xE150000000000000ULL, 0xE540000000000000ULL, 0xE4F0000000000000ULL,
+    0xE620000000000000ULL, 0xE790000000000000ULL, 0xF500000000000000ULL,
+    0xF4B0000000000000ULL, 0xF660000000000000ULL, 0xF7D0000000000000ULL,
+    0xF3C0000000000000ULL, 0xF270000000000000ULL, 0xF0A0000000000000ULL,
+    0xF110000000000000ULL, 0xF880000000000000ULL, 0xF930000000000000ULL,
+    0xFBE0000000000000ULL, 0xFA50000000000000ULL, 0xFE40000000000000ULL,
+    0xFFF0000000000000ULL, 0xFD20000000000000ULL, 0xFC90000000000000ULL,
+    0xB400000000000000ULL, 0xB5B0000000000000ULL, 0xB760000000000000ULL,
+    0xB6D0000000000000ULL, 0xB2C0000000000000ULL, 0xB370000000000000ULL,
+    0xB1A0000000000000ULL, 0xB010000000000000ULL, 0xB980000000000000ULL,
+    0xB830000000000000ULL, 0xBAE0000000000000ULL, 0xBB50000000000000ULL,
+    0xBF40000000000000ULL, 0xBEF0000000000000ULL, 0xBC20000000000000ULL,
+    0xBD90000000000000ULL, 0xAF00000000000000ULL, 0xAEB0000000000000ULL,
+    0xAC60000000000000ULL, 0xADD0000000000000ULL, 0xA9C0000000000000ULL,
+    0xA870000000000000ULL, 0xAAA0000000000000ULL, 0xAB10000000000000ULL,
+    0xA280000000000000ULL, 0xA330000000000000ULL, 0xA1E0000000000000ULL,
+    0xA050000000000000ULL, 0xA440000000000000ULL, 0xA5F0000000000000ULL,
+    0xA720000000000000ULL, 0xA690000000000000ULL, 0x8200000000000000ULL,
+    0x83B0000000000000ULL, 0x8160000000000000ULL, 0x80D0000000000000ULL,
+    0x84C0000000000000ULL, 0x8570000000000000ULL, 0x87A0000000000000ULL,
+    0x8610000000000000ULL, 0x8F80000000000000ULL, 0x8E30000000000000ULL,
+    0x8CE0000000000000ULL, 0x8D50000000000000ULL, 0x8940000000000000ULL,
+    0x88F0000000000000ULL, 0x8A20000000000000ULL, 0x8B90000000000000ULL,
+    0x9900000000000000ULL, 0x98B0000000000000ULL, 0x9A60000000000000ULL,
+    0x9BD0000000000000ULL, 0x9FC0000000000000ULL, 0x9E70000000000000ULL,
+    0x9CA0000000000000ULL, 0x9D10000000000000ULL, 0x9480000000000000ULL,
+    0x9530000000000000ULL, 0x97E0000000000000ULL, 0x9650000000000000ULL,
+    0x9240000000000000ULL, 0x93F0000000000000ULL, 0x9120000000000000ULL,
+    0x9090000000000000ULL,
+};
+
+// poly = 0x142F0E1EBA9EA3693, reverse = False
+static const UINT64 predefinedTable24[256] = {
+    0x0000000000000000ULL, 0x42F0E1EBA9EA3693ULL, 0x85E1C3D753D46D26ULL,
+    0xC711223CFA3E5BB5ULL, 0x493366450E42ECDFULL, 0x0BC387AEA7A8DA4CULL,
+    0xCCD2A5925D9681F9ULL, 0x8E224479F47CB76AULL, 0x9266CC8A1C85D9BEULL,
+    0xD0962D61B56FEF2DULL, 0x17870F5D4F51B498ULL, 0x5577EEB6E6BB820BULL,
+    0xDB55AACF12C73561ULL, 0x99A54B24BB2D03F2ULL, 0x5EB4691841135847ULL,
+    0x1C4488F3E8F96ED4ULL, 0x663D78FF90E185EFULL, 0x24CD9914390BB37CULL,
+    0xE3DCBB28C335E8C9ULL, 0xA12C5AC36ADFDE5AULL, 0x2F0E1EBA9EA36930ULL,
+    0x6DFEFF5137495FA3ULL, 0xAAEFDD6DCD770416ULL, 0xE81F3C86649D3285ULL,
+    0xF45BB4758C645C51ULL, 0xB6AB559E258E6AC2ULL, 0x71BA77A2DFB03177ULL,
+    0x334A9649765A07E4ULL, 0xBD68D2308226B08EULL, 0xFF9833DB2BCC861DULL,
+    0x388911E7D1F2DDA8ULL, 0x7A79F00C7818EB3BULL, 0xCC7AF1FF21C30BDEULL,
+    0x8E8A101488293D4DULL, 0x499B3228721766F8ULL, 0x0B6BD3C3DBFD506BULL,
+    0x854997BA2F81E701ULL, 0xC7B97651866BD192ULL, 0x00A8546D7C558A27ULL,
+    0x4258B586D5BFBCB4ULL, 0x5E1C3D753D46D260ULL, 0x1CECDC9E94ACE4F3ULL,
+    0xDBFDFEA26E92BF46ULL, 0x990D1F49C77889D5ULL, 0x172F5B3033043EBFULL,
+    0x55DFBADB9AEE082CULL, 0x92CE98E760D05399ULL, 0xD03E790CC93A650AULL,
+    0xAA478900B1228E31ULL, 0xE8B768EB18C8B8A2ULL, 0x2FA64AD7E2F6E317ULL,
+    0x6D56AB3C4B1CD584ULL, 0xE374EF45BF6062EEULL, 0xA1840EAE168A547DULL,
+    0x66952C92ECB40FC8ULL, 0x2465CD79455E395BULL, 0x3821458AADA7578FULL,
+    0x7AD1A461044D611CULL, 0xBDC0865DFE733AA9ULL, 0xFF3067B657990C3AULL,
+    0x711223CFA3E5BB50ULL, 0x33E2C2240A0F8DC3ULL, 0xF4F3E018F031D676ULL,
+    0xB60301F359DBE0E5ULL, 0xDA050215EA6C212FULL, 0x98F5E3FE438617BCULL,
+    0x5FE4C1C2B9B84C09ULL, 0x1D14202910527A9AULL, 0x93366450E42ECDF0ULL,
+    0xD1C685BB4DC4FB63ULL, 0x16D7A787B7FAA0D6ULL, 0x5427466C1E109645ULL,
+    0x4863CE9FF6E9F891ULL, 0x0A932F745F03CE02ULL, 0xCD820D48A53D95B7ULL,
+    0x8F72ECA30CD7A324ULL, 0x0150A8DAF8AB144EULL, 0x43A04931514122DDULL,
+    0x84B16B0DAB7F7968ULL, 0xC6418AE602954FFBULL, 0xBC387AEA7A8DA4C0ULL,
+    0xFEC89B01D3679253ULL, 0x39D9B93D2959C9E6ULL, 0x7B2958D680B3FF75ULL,
+    0xF50B1CAF74CF481FULL, 0xB7FBFD44DD257E8CULL, 0x70EADF78271B2539ULL,
+    0x321A3E938EF113AAULL, 0x2E5EB66066087D7EULL, 0x6CAE578BCFE24BEDULL,
+    0xABBF75B735DC1058ULL, 0xE94F945C9C3626CBULL, 0x676DD025684A91A1ULL,
+    0x259D31CEC1A0A732ULL, 0xE28C13F23B9EFC87ULL, 0xA07CF2199274CA14ULL,
+    0x167FF3EACBAF2AF1ULL, 0x548F120162451C62ULL, 0x939E303D987B47D7ULL,
+    0xD16ED1D631917144ULL, 0x5F4C95AFC5EDC62EULL, 0x1DBC74446C07F0BDULL,
+    0xDAAD56789639AB08ULL, 0x985DB7933FD39D9BULL, 0x84193F60D72AF34FULL,
+    0xC6E9DE8B7EC0C5DCULL, 0x01F8FCB784FE9E69ULL, 0x43081D5C2D14A8FAULL,
+    0xCD2A5925D9681F90ULL, 0x8FDAB8CE70822903ULL, 0x48CB9AF28ABC72B6ULL,
+    0x0A3B7B1923564425ULL, 0x70428B155B4EAF1EULL, 0x32B26AFEF2A4998DULL,
+    0xF5A348C2089AC238ULL, 0xB753A929A170F4ABULL, 0x3971ED50550C43C1ULL,
+    0x7B810CBBFCE67552ULL, 0xBC902E8706D82EE7ULL, 0xFE60CF6CAF321874ULL,
+    0xE224479F47CB76A0ULL, 0xA0D4A674EE214033ULL, 0x67C58448141F1B86ULL,
+    0x253565A3BDF52D15ULL, 0xAB1721DA49899A7FULL, 0xE9E7C031E063ACECULL,
+    0x2EF6E20D1A5DF759ULL, 0x6C0603E6B3B7C1CAULL, 0xF6FAE5C07D3274CDULL,
+    0xB40A042BD4D8425EULL, 0x731B26172EE619EBULL, 0x31EBC7FC870C2F78ULL,
+    0xBFC9838573709812ULL, 0xFD39626EDA9AAE81ULL, 0x3A28405220A4F534ULL,
+    0x78D8A1B9894EC3A7ULL, 0x649C294A61B7AD73ULL, 0x266CC8A1C85D9BE0ULL,
+    0xE17DEA9D3263C055ULL, 0xA38D0B769B89F6C6ULL, 0x2DAF4F0F6FF541ACULL,
+    0x6F5FAEE4C61F773FULL, 0xA84E8CD83C212C8AULL, 0xEABE6D3395CB1A19ULL,
+    0x90C79D3FEDD3F122ULL, 0xD2377CD44439C7B1ULL, 0x15265EE8BE079C04ULL,
+    0x57D6BF0317EDAA97ULL, 0xD9F4FB7AE3911DFDULL, 0x9B041A914A7B2B6EULL,
+    0x5C1538ADB04570DBULL, 0x1EE5D94619AF4648ULL, 0x02A151B5F156289CULL,
+    0x4051B05E58BC1E0FULL, 0x87409262A28245BAULL, 0xC5B073890B687329ULL,
+    0x4B9237F0FF14C443ULL, 0x0962D61B56FEF2D0ULL, 0xCE73F427ACC0A965ULL,
+    0x8C8315CC052A9FF6ULL, 0x3A80143F5CF17F13ULL, 0x7870F5D4F51B4980ULL,
+    0xBF61D7E80F251235ULL, 0xFD913603A6CF24A6ULL, 0x73B3727A52B393CCULL,
+    0x31439391FB59A55FULL, 0xF652B1AD0167FEEAULL, 0xB4A25046A88DC879ULL,
+    0xA8E6D8B54074A6ADULL, 0xEA16395EE99E903EULL, 0x2D071B6213A0CB8BULL,
+    0x6FF7FA89BA4AFD18ULL, 0xE1D5BEF04E364A72ULL, 0xA3255F1BE7DC7CE1ULL,
+    0x64347D271DE22754ULL, 0x26C49CCCB40811C7ULL, 0x5CBD6CC0CC10FAFCULL,
+    0x1E4D8D2B65FACC6FULL, 0xD95CAF179FC497DAULL, 0x9BAC4EFC362EA149ULL,
+    0x158E0A85C2521623ULL, 0x577EEB6E6BB820B0ULL, 0x906FC95291867B05ULL,
+    0xD29F28B9386C4D96ULL, 0xCEDBA04AD0952342ULL, 0x8C2B41A1797F15D1ULL,
+    0x4B3A639D83414E64ULL, 0x09CA82762AAB78F7ULL, 0x87E8C60FDED7CF9DULL,
+    0xC51827E4773DF90EULL, 0x020905D88D03A2BBULL, 0x40F9E43324E99428ULL,
+    0x2CFFE7D5975E55E2ULL, 0x6E0F063E3EB46371ULL, 0xA91E2402C48A38C4ULL,
+    0xEBEEC5E96D600E57ULL, 0x65CC8190991CB93DULL, 0x273C607B30F68FAEULL,
+    0xE02D4247CAC8D41BULL, 0xA2DDA3AC6322E288ULL, 0xBE992B5F8BDB8C5CULL,
+    0xFC69CAB42231BACFULL, 0x3B78E888D80FE17AULL, 0x7988096371E5D7E9ULL,
+    0xF7AA4D1A85996083ULL, 0xB55AACF12C735610ULL, 0x724B8ECDD64D0DA5ULL,
+    0x30BB6F267FA73B36ULL, 0x4AC29F2A07BFD00DULL, 0x08327EC1AE55E69EULL,
+    0xCF235CFD546BBD2BULL, 0x8DD3BD16FD818BB8ULL, 0x03F1F96F09FD3CD2ULL,
+    0x41011884A0170A41ULL, 0x86103AB85A2951F4ULL, 0xC4E0DB53F3C36767ULL,
+    0xD8A453A01B3A09B3ULL, 0x9A54B24BB2D03F20ULL, 0x5D45907748EE6495ULL,
+    0x1FB5719CE1045206ULL, 0x919735E51578E56CULL, 0xD367D40EBC92D3FFULL,
+    0x1476F63246AC884AULL, 0x568617D9EF46BED9ULL, 0xE085162AB69D5E3CULL,
+    0xA275F7C11F7768AFULL, 0x6564D5FDE549331AULL, 0x279434164CA30589ULL,
+    0xA9B6706FB8DFB2E3ULL, 0xEB46918411358470ULL, 0x2C57B3B8EB0BDFC5ULL,
+    0x6EA7525342E1E956ULL, 0x72E3DAA0AA188782ULL, 0x30133B4B03F2B111ULL,
+    0xF7021977F9CCEAA4ULL, 0xB5F2F89C5026DC37ULL, 0x3BD0BCE5A45A6B5DULL,
+    0x79205D0E0DB05DCEULL, 0xBE317F32F78E067BULL, 0xFCC19ED95E6430E8ULL,
+    0x86B86ED5267CDBD3ULL, 0xC4488F3E8F96ED40ULL, 0x0359AD0275A8B6F5ULL,
+    0x41A94CE9DC428066ULL, 0xCF8B0890283E370CULL, 0x8D7BE97B81D4019FULL,
+    0x4A6ACB477BEA5A2AULL, 0x089A2AACD2006CB9ULL, 0x14DEA25F3AF9026DULL,
+    0x562E43B4931334FEULL, 0x913F6188692D6F4BULL, 0xD3CF8063C0C759D8ULL,
+    0x5DEDC41A34BBEEB2ULL, 0x1F1D25F19D51D821ULL, 0xD80C07CD676F8394ULL,
+    0x9AFCE626CE85B507ULL,
+};
+
+// poly = 0x1AD93D23594C935A9, reverse = True
+static const UINT64 predefinedTable25[256] = {
+    0x0000000000000000ULL, 0x7AD870C830358979ULL, 0xF5B0E190606B12F2ULL,
+    0x8F689158505E9B8BULL, 0xC038E5739841B68FULL, 0xBAE095BBA8743FF6ULL,
+    0x358804E3F82AA47DULL, 0x4F50742BC81F2D04ULL, 0xAB28ECB46814FE75ULL,
+    0xD1F09C7C5821770CULL, 0x5E980D24087FEC87ULL, 0x24407DEC384A65FEULL,
+    0x6B1009C7F05548FAULL, 0x11C8790FC060C183ULL, 0x9EA0E857903E5A08ULL,
+    0xE478989FA00BD371ULL, 0x7D08FF3B88BE6F81ULL, 0x07D08FF3B88BE6F8ULL,
+    0x88B81EABE8D57D73ULL, 0xF2606E63D8E0F40AULL, 0xBD301A4810FFD90EULL,
+    0xC7E86A8020CA5077ULL, 0x4880FBD87094CBFCULL, 0x32588B1040A14285ULL,
+    0xD620138FE0AA91F4ULL, 0xACF86347D09F188DULL, 0x2390F21F80C18306ULL,
+    0x594882D7B0F40A7FULL, 0x1618F6FC78EB277BULL, 0x6CC0863448DEAE02ULL,
+    0xE3A8176C18803589ULL, 0x997067A428B5BCF0ULL, 0xFA11FE77117CDF02ULL,
+    0x80C98EBF2149567BULL, 0x0FA11FE77117CDF0ULL, 0x75796F2F41224489ULL,
+    0x3A291B04893D698DULL, 0x40F16BCCB908E0F4ULL, 0xCF99FA94E9567B7FULL,
+    0xB5418A5CD963F206ULL, 0x513912C379682177ULL, 0x2BE1620B495DA80EULL,
+    0xA489F35319033385ULL, 0xDE51839B2936BAFCULL, 0x9101F7B0E12997F8ULL,
+    0xEBD98778D11C1E81ULL, 0x64B116208142850AULL, 0x1E6966E8B1770C73ULL,
+    0x8719014C99C2B083ULL, 0xFDC17184A9F739FAULL, 0x72A9E0DCF9A9A271ULL,
+    0x08719014C99C2B08ULL, 0x4721E43F0183060CULL, 0x3DF994F731B68F75ULL,
+    0xB29105AF61E814FEULL, 0xC849756751DD9D87ULL, 0x2C31EDF8F1D64EF6ULL,
+    0x56E99D30C1E3C78FULL, 0xD9810C6891BD5C04ULL, 0xA3597CA0A188D57DULL,
+    0xEC09088B6997F879ULL, 0x96D1784359A27100ULL, 0x19B9E91B09FCEA8BULL,
+    0x636199D339C963F2ULL, 0xDF7ADABD7A6E2D6FULL, 0xA5A2AA754A5BA416ULL,
+    0x2ACA3B2D1A053F9DULL, 0x50124BE52A30B6E4ULL, 0x1F423FCEE22F9BE0ULL,
+    0x659A4F06D21A1299ULL, 0xEAF2DE5E82448912ULL, 0x902AAE96B271006BULL,
+    0x74523609127AD31AULL, 0x0E8A46C1224F5A63ULL, 0x81E2D7997211C1E8ULL,
+    0xFB3AA75142244891ULL, 0xB46AD37A8A3B6595ULL, 0xCEB2A3B2BA0EECECULL,
+    0x41DA32EAEA507767ULL, 0x3B024222DA65FE1EULL, 0xA2722586F2D042EEULL,
+    0xD8AA554EC2E5CB97ULL, 0x57C2C41692BB501CULL, 0x2D1AB4DEA28ED965ULL,
+    0x624AC0F56A91F461ULL, 0x1892B03D5AA47D18ULL, 0x97FA21650AFAE693ULL,
+    0xED2251AD3ACF6FEAULL, 0x095AC9329AC4BC9BULL, 0x7382B9FAAAF135E2ULL,
+    0xFCEA28A2FAAFAE69ULL, 0x8632586ACA9A2710ULL, 0xC9622C4102850A14ULL,
+    0xB3BA5C8932B0836DULL, 0x3CD2CDD162EE18E6ULL, 0x460ABD1952DB919FULL,
+    0x256B24CA6B12F26DULL, 0x5FB354025B277B14ULL, 0xD0DBC55A0B79E09FULL,
+    0xAA03B5923B4C69E6ULL, 0xE553C1B9F35344E2ULL, 0x9F8BB171C366CD9BULL,
+    0x10E3202993385610ULL, 0x6A3B50E1A30DDF69ULL, 0x8E43C87E03060C18ULL,
+    0xF49BB8B633338561ULL, 0x7BF329EE636D1EEAULL, 0x012B592653589793ULL,
+    0x4E7B2D0D9B47BA97ULL, 0x34A35DC5AB7233EEULL, 0xBBCBCC9DFB2CA865ULL,
+    0xC113BC55CB19211CULL, 0x5863DBF1E3AC9DECULL, 0x22BBAB39D3991495ULL,
+    0xADD33A6183C78F1EULL, 0xD70B4AA9B3F20667ULL, 0x985B3E827BED2B63ULL,
+    0xE2834E4A4BD8A21AULL, 0x6DEBDF121B863991ULL, 0x1733AFDA2BB3B0E8ULL,
+    0xF34B37458BB86399ULL, 0x8993478DBB8DEAE0ULL, 0x06FBD6D5EBD3716BULL,
+    0x7C23A61DDBE6F812ULL, 0x3373D23613F9D516ULL, 0x49ABA2FE23CC5C6FULL,
+    0xC6C333A67392C7E4ULL, 0xBC1B436E43A74E9DULL, 0x95AC9329AC4BC9B5ULL,
+    0xEF74E3E19C7E40CCULL, 0x601C72B9CC20DB47ULL, 0x1AC40271FC15523EULL,
+    0x5594765A340A7F3AULL, 0x2F4C0692043FF643ULL, 0xA02497CA54616DC8ULL,
+    0xDAFCE7026454E4B1ULL, 0x3E847F9DC45F37C0ULL, 0x445C0F55F46ABEB9ULL,
+    0xCB349E0DA4342532ULL, 0xB1ECEEC59401AC4BULL, 0xFEBC9AEE5C1E814FULL,
+    0x8464EA266C2B0836ULL, 0x0B0C7B7E3C7593BDULL, 0x71D40BB60C401AC4ULL,
+    0xE8A46C1224F5A634ULL, 0x927C1CDA14C02F4DULL, 0x1D148D82449EB4C6ULL,
+    0x67CCFD4A74AB3DBFULL, 0x289C8961BCB410BBULL, 0x5244F9A98C8199C2ULL,
+    0xDD2C68F1DCDF0249ULL, 0xA7F41839ECEA8B30ULL, 0x438C80A64CE15841ULL,
+    0x3954F06E7CD4D138ULL, 0xB63C61362C8A4AB3ULL, 0xCCE411FE1CBFC3CAULL,
+    0x83B465D5D4A0EECEULL, 0xF96C151DE49567B7ULL, 0x76048445B4CBFC3CULL,
+    0x0CDCF48D84FE7545ULL, 0x6FBD6D5EBD3716B7ULL, 0x15651D968D029FCEULL,
+    0x9A0D8CCEDD5C0445ULL, 0xE0D5FC06ED698D3CULL, 0xAF85882D2576A038ULL,
+    0xD55DF8E515432941ULL, 0x5A3569BD451DB2CAULL, 0x20ED197575283BB3ULL,
+    0xC49581EAD523E8C2ULL, 0xBE4DF122E51661BBULL, 0x3125607AB548FA30ULL,
+    0x4BFD10B2857D7349ULL, 0x04AD64994D625E4DULL, 0x7E7514517D57D734ULL,
+    0xF11D85092D094CBFULL, 0x8BC5F5C11D3CC5C6ULL, 0x12B5926535897936ULL,
+    0x686DE2AD05BCF04FULL, 0xE70573F555E26BC4ULL, 0x9DDD033D65D7E2BDULL,
+    0xD28D7716ADC8CFB9ULL, 0xA85507DE9DFD46C0ULL, 0x273D9686CDA3DD4BULL,
+    0x5DE5E64EFD965432ULL, 0xB99D7ED15D9D8743ULL, 0xC3450E196DA80E3AULL,
+    0x4C2D9F413DF695B1ULL, 0x36F5EF890DC31CC8ULL, 0x79A59BA2C5DC31CCULL,
+    0x037DEB6AF5E9B8B5ULL, 0x8C157A32A5B7233EULL, 0xF6CD0AFA9582AA47ULL,
+    0x4AD64994D625E4DAULL, 0x300E395CE6106DA3ULL, 0xBF66A804B64EF628ULL,
+    0xC5BED8CC867B7F51ULL, 0x8AEEACE74E645255ULL, 0xF036DC2F7E51DB2CULL,
+    0x7F5E4D772E0F40A7ULL, 0x05863DBF1E3AC9DEULL, 0xE1FEA520BE311AAFULL,
+    0x9B26D5E88E0493D6ULL, 0x144E44B0DE5A085DULL, 0x6E963478EE6F8124ULL,
+    0x21C640532670AC20ULL, 0x5B1E309B16452559ULL, 0xD476A1C3461BBED2ULL,
+    0xAEAED10B762E37ABULL, 0x37DEB6AF5E9B8B5BULL, 0x4D06C6676EAE0222ULL,
+    0xC26E573F3EF099A9ULL, 0xB8B627F70EC510D0ULL, 0xF7E653DCC6DA3DD4ULL,
+    0x8D3E2314F6EFB4ADULL, 0x0256B24CA6B12F26ULL, 0x788EC2849684A65FULL,
+    0x9CF65A1B368F752EULL, 0xE62E2AD306BAFC57ULL, 0x6946BB8B56E467DCULL,
+    0x139ECB4366D1EEA5ULL, 0x5CCEBF68AECEC3A1ULL, 0x2616CFA09EFB4AD8ULL,
+    0xA97E5EF8CEA5D153ULL, 0xD3A62E30FE90582AULL, 0xB0C7B7E3C7593BD8ULL,
+    0xCA1FC72BF76CB2A1ULL, 0x45775673A732292AULL, 0x3FAF26BB9707A053ULL,
+    0x70FF52905F188D57ULL, 0x0A2722586F2D042EULL, 0x854FB3003F739FA5ULL,
+    0xFF97C3C80F4616DCULL, 0x1BEF5B57AF4DC5ADULL, 0x61372B9F9F784CD4ULL,
+    0xEE5FBAC7CF26D75FULL, 0x9487CA0FFF135E26ULL, 0xDBD7BE24370C7322ULL,
+    0xA10FCEEC0739FA5BULL, 0x2E675FB4576761D0ULL, 0x54BF2F7C6752E8A9ULL,
+    0xCDCF48D84FE75459ULL, 0xB71738107FD2DD20ULL, 0x387FA9482F8C46ABULL,
+    0x42A7D9801FB9CFD2ULL, 0x0DF7ADABD7A6E2D6ULL, 0x772FDD63E7936BAFULL,
+    0xF8474C3BB7CDF024ULL, 0x829F3CF387F8795DULL, 0x66E7A46C27F3AA2CULL,
+    0x1C3FD4A417C62355ULL, 0x935745FC4798B8DEULL, 0xE98F353477AD31A7ULL,
+    0xA6DF411FBFB21CA3ULL, 0xDC0731D78F8795DAULL, 0x536FA08FDFD90E51ULL,
+    0x29B7D047EFEC8728ULL,
+};
+
+static const PredefinedTable predefinedTables[] = {
+    {8, 0, 0x7ULL, predefinedTable0,
+     {0x0000000000000026ULL, 0x0000000000000002ULL,
+      0x0000000000000037ULL, 0x0000000000000010ULL}},
+    {8, 1, 0x39ULL, predefinedTable1,
+     {0x0800000000000000ULL, 0x9C00000000000000ULL,
+      0xE400000000000000ULL, 0x4000000000000000ULL}},
+    {8, 0, 0x1DULL, predefinedTable2,
+     {0x0000000000000082ULL, 0x0000000000000085ULL,
+      0x0000000000000061ULL, 0x0000000000000004ULL}},
+    {8, 1, 0x31ULL, predefinedTable3,
+     {0x9200000000000000ULL, 0x8000000000000000ULL,
+      0x5400000000000000ULL, 0x1000000000000000ULL}},
+    {8, 1, 0x7ULL, predefinedTable4,
+     {0xC800000000000000ULL, 0x8000000000000000ULL,
+      0x1900000000000000ULL, 0x1000000000000000ULL}},
+    {8, 1, 0x9BULL, predefinedTable5,
+     {0xB900000000000000ULL, 0x8000000000000000ULL,
+      0x9400000000000000ULL, 0x1000000000000000ULL}},
+    {16, 1, 0x8005ULL, predefinedTable6,
+     {0xCCD0000000000000ULL, 0xC100000000000000ULL,
+      0xC450000000000000ULL, 0x8101000000000000ULL}},
+    {16, 0, 0x8005ULL, predefinedTable7,
+     {0x0000000000001666ULL, 0x0000000000000106ULL,
+      0x0000000000001446ULL, 0x0000000000008107ULL}},
+    {16, 0, 0x589ULL, predefinedTable8,
+     {0x0000000000009B74ULL, 0x000000000000FC85ULL,
+      0x0000000000003103ULL, 0x0000000000000010ULL}},
+    {16, 1, 0x3D65ULL, predefinedTable9,
+     {0x0CDC000000000000ULL, 0x3EF0000000000000ULL,
+      0x7116000000000000ULL, 0xF182000000000000ULL}},
+    {16, 0, 0x3D65ULL, predefinedTable10,
+     {0x0000000000007660ULL, 0x0000000000001EF8ULL,
+      0x000000000000D11CULL, 0x000000000000831EULL}},
+    {16, 0, 0x1021ULL, predefinedTable11,
+     {0x000000000000650BULL, 0x000000000000AEFCULL,
+      0x0000000000008832ULL, 0x00000000000013FCULL}},
+    {16, 1, 0x1021ULL, predefinedTable12,
+     {0xA95D000000000000ULL, 0x7EEA000000000000ULL,
+      0x9822000000000000ULL, 0x7F90000000000000ULL}},
+    {16, 0, 0x8BB7ULL, predefinedTable13,
+     {0x0000000000001FAAULL, 0x000000000000A010ULL,
+      0x000000000000DD31ULL, 0x0000000000001069ULL}},
+    {16, 0, 0xA097ULL, predefinedTable14,
+     {0x000000000000A9A2ULL, 0x000000000000668CULL,
+      0x0000000000004CD4ULL, 0x000000000000CCFBULL}},
+    {24, 0, 0x864CFBULL, predefinedTable15,
+     {0x0000000000B22B31ULL, 0x00000000006243DAULL,
+      0x0000000000B937A7ULL, 0x00000000007DB43EULL}},
+    {24, 0, 0x5D6DCBULL, predefinedTable16,
+     {0x000000000033FD8BULL, 0x0000000000E762F3ULL,
+      0x00000000000D1C5BULL, 0x0000000000C40595ULL}},
+    {32, 1, 0x4C11DB7ULL, predefinedTable17,
+     {0x65673B4600000000ULL, 0x9BA54C6F00000000ULL,
+      0x653D982200000000ULL, 0xCAD38E8F00000000ULL}},
+    {32, 0, 0x4C11DB7ULL, predefinedTable18,
+     {0x00000000C5B9CD4CULL, 0x00000000E8A45605ULL,
+      0x000000008833794CULL, 0x00000000E6228B11ULL}},
+    {32, 1, 0x1EDC6F41ULL, predefinedTable19,
+     {0x3743F7BD00000000ULL, 0x3171D43000000000ULL,
+      0x1C19243B00000000ULL, 0x75BBA45B00000000ULL}},
+    {32, 1, 0xA833982BULL, predefinedTable20,
+     {0xFD55812B00000000ULL, 0xBF29CF8200000000ULL,
+      0xE92C08FB00000000ULL, 0x8C7D5A7C00000000ULL}},
+    {32, 0, 0x814141ABULL, predefinedTable21,
+     {0x000000005603A6BCULL, 0x00000000A1FA6BECULL,
+      0x0000000010115FA6ULL, 0x000000006256AA77ULL}},
+    {32, 0, 0xAFULL, predefinedTable22,
+     {0x000000001157936AULL, 0x0000000010101111ULL,
+      0x000000005B5AE0C7ULL, 0x000000001BD81099ULL}},
+    {64, 1, 0x1BULL, predefinedTable23,
+     {0x6B70000000000001ULL, 0xF500000000000001ULL,
+      0x01B001B1B0000001ULL, 0xB100010100000001ULL}},
+    {64, 0, 0x42F0E1EBA9EA3693ULL, predefinedTable24,
+     {0x4EB938A7D257740EULL, 0x05F5C3C7EB52FAB6ULL,
+      0xDDF4B6981205B83FULL, 0x5F6843CA540DF020ULL}},
+    {64, 1, 0xAD93D23594C935A9ULL, predefinedTable25,
+     {0xD9D7BE7D505DA32CULL, 0x381D0015C96F4444ULL,
+      0xAF86EFB16D9AB4FBULL, 0xF49784A634F014E4ULL}},
+};
+
+#define PREDEFINED_TABLE_COUNT 26
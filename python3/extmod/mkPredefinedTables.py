@@ -0,0 +1,96 @@
+#-----------------------------------------------------------------------------
+# Generate _crcpredefined.h, which holds the CRC tables and the folding
+# constants of the algorithms defined in predefined.py as static C arrays.
+# The extension module looks up these tables instead of having crcmod build
+# them at runtime.  Run this script whenever the definitions change:
+#
+#     python3 mkPredefinedTables.py [output-file]
+#
+# Only the 256 entry table of each polynomial is stored; the extension module
+# derives the slicing tables from it.
+#-----------------------------------------------------------------------------
+
+import os
+import struct
+import sys
+import types
+
+extdir = os.path.dirname(os.path.abspath(__file__))
+srcdir = os.path.dirname(extdir)
+
+#-----------------------------------------------------------------------------
+# Import crcmod from the source tree, the same way the package __init__ does.
+# The extension module is not built there, so crcmod uses the Python
+# implementation, which is all that is needed to compute the tables.
+
+def importCrcmod():
+    pkg = types.ModuleType('crcmod')
+    pkg.__path__ = [srcdir]
+    sys.modules['crcmod'] = pkg
+    import crcmod.crcmod
+    for name in crcmod.crcmod.__all__:
+        setattr(pkg, name, getattr(crcmod.crcmod, name))
+    import crcmod.predefined
+    return sys.modules['crcmod.crcmod'], sys.modules['crcmod.predefined']
+
+_typeNames = {8:'UINT8', 16:'UINT16', 24:'UINT32', 32:'UINT32', 64:'UINT64'}
+
+def formatTable(name, table, n):
+    digits = (n + 3)//4
+    perLine = {8:8, 16:8, 24:4, 32:4, 64:3}[n]
+    suffix = 'ULL' if n == 64 else 'U'
+    lines = ['static const %s %s[256] = {' % (_typeNames[n], name)]
+    for i in range(0, 256, perLine):
+        items = ['0x%0*X%s' % (digits, x, suffix) for x in table[i:i+perLine]]
+        lines.append('    ' + ', '.join(items) + ',')
+    lines.append('};')
+    return '\n'.join(lines)
+
+def main(outName=os.path.join(extdir, '_crcpredefined.h')):
+    (crcmodule, predefined) = importCrcmod()
+
+    keys = []
+    for entry in predefined._crc_definitions_table:
+        (poly, rev) = (entry[2], entry[3])
+        n = crcmodule._verifyPoly(poly)
+        key = (n, poly, bool(rev))
+        if key not in keys:
+            keys.append(key)
+
+    out = []
+    out.append('// Automatically generated by mkPredefinedTables.py from the '
+               'definitions in')
+    out.append('// predefined.py.  Do not edit.')
+    out.append('')
+
+    entries = []
+    for (i, (n, poly, rev)) in enumerate(keys):
+        if rev:
+            table = crcmodule._mkTable_r(poly, n)
+        else:
+            table = crcmodule._mkTable(poly, n)
+        consts = struct.unpack('4Q', crcmodule._mkFoldConsts(poly, n, rev))
+        name = 'predefinedTable%d' % i
+        out.append('// poly = 0x%X, reverse = %s' % (poly, rev))
+        out.append(formatTable(name, table, n))
+        out.append('')
+        entries.append('{%d, %d, 0x%XULL, %s,\n'
+                       '     {0x%016XULL, 0x%016XULL,\n'
+                       '      0x%016XULL, 0x%016XULL}},'
+                       % ((n, int(rev), poly & ((1<<n) - 1), name) + consts))
+
+    out.append('static const PredefinedTable predefinedTables[] = {')
+    for entry in entries:
+        out.append('    ' + entry)
+    out.append('};')
+    out.append('')
+    out.append('#define PREDEFINED_TABLE_COUNT %d' % len(entries))
+    out.append('')
+
+    fd = open(outName, 'w')
+    fd.write('\n'.join(out))
+    fd.close()
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
@@ -118,23 +118,45 @@ def _simplify_name(name):
     return name
 
 
-_crc_definitions_by_name = {}
-_crc_definitions_by_identifier = {}
-_crc_definitions = []
+# The lookup tables below are built from _crc_definitions_table on first use,
+# so that importing this module is cheap.  __getattr__ provides them as
+# module attributes.
 
 _crc_table_headings = [ 'name', 'identifier', 'poly', 'reverse', 'init', 'xor_out', 'check' ]
 
-for table_entry in _crc_definitions_table:
-    crc_definition = dict(zip(_crc_table_headings, table_entry))
-    _crc_definitions.append(crc_definition)
-    name = _simplify_name(table_entry[0])
-    if name in _crc_definitions_by_name:
-        raise Exception("Duplicate entry for '{0}' in CRC table".format(name))
-    _crc_definitions_by_name[name] = crc_definition
-    _crc_definitions_by_identifier[table_entry[1]] = crc_definition
+_definitions_built = False
+
+
+def _build_definitions():
+    global _crc_definitions, _crc_definitions_by_name, _crc_definitions_by_identifier
+    global _definitions_built
+    by_name = {}
+    by_identifier = {}
+    definitions = []
+    for table_entry in _crc_definitions_table:
+        crc_definition = dict(zip(_crc_table_headings, table_entry))
+        definitions.append(crc_definition)
+        name = _simplify_name(table_entry[0])
+        if name in by_name:
+            raise Exception("Duplicate entry for '{0}' in CRC table".format(name))
+        by_name[name] = crc_definition
+        by_identifier[table_entry[1]] = crc_definition
+    _crc_definitions = definitions
+    _crc_definitions_by_identifier = by_identifier
+    _crc_definitions_by_name = by_name
+    _definitions_built = True
+
+
+def __getattr__(name):
+    if name in ('_crc_definitions', '_crc_definitions_by_name', '_crc_definitions_by_identifier'):
+        _build_definitions()
+        return globals()[name]
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
 
 
 def _get_definition_by_name(crc_name):
+    if not _definitions_built:
+        _build_definitions()
     definition = _crc_definitions_by_name.get(_simplify_name(crc_name), None)
     if not definition:
         definition = _crc_definitions_by_identifier.get(crc_name, None)
@@ -144,18 +166,18 @@ def _get_definition_by_name(crc_name):
 
 
 class PredefinedCrc(crcmod.Crc):
-    def __init__(self, crc_name):
+    def __init__(self, crc_name, backend=None):
         definition = _get_definition_by_name(crc_name)
-        super().__init__(poly=definition['poly'], initCrc=definition['init'], rev=definition['reverse'], xorOut=definition['xor_out'])
+        super().__init__(poly=definition['poly'], initCrc=definition['init'], rev=definition['reverse'], xorOut=definition['xor_out'], backend=backend)
 
 
 # crcmod.predefined.Crc is an alias for crcmod.predefined.PredefinedCrc
 Crc = PredefinedCrc
 
 
-def mkPredefinedCrcFun(crc_name):
+def mkPredefinedCrcFun(crc_name, backend=None):
     definition = _get_definition_by_name(crc_name)
-    return crcmod.mkCrcFun(poly=definition['poly'], initCrc=definition['init'], rev=definition['reverse'], xorOut=definition['xor_out'])
+    return crcmod.mkCrcFun(poly=definition['poly'], initCrc=definition['init'], rev=definition['reverse'], xorOut=definition['xor_out'], backend=backend)
 
 
 # crcmod.predefined.mkCrcFun is an alias for crcmod.predefined.mkPredefinedCrcFun
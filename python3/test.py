@@ -27,13 +27,48 @@ import unittest
 
 from array import array
 import binascii
-
-from .crcmod import mkCrcFun, Crc
+import copy
+import json
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+import asyncio
+import io
+import os
+import pickle
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+
+from .crcmod import mkCrcFun, Crc, setGilThreshold, combineCrc, shiftCrc
+from .crcmod import tableCacheInfo, clearTableCache, crcFile
+from .crcmod import CrcReader, CrcWriter, MultiCrc, RollingCrc, backends
+from .crcmod import tune
 from .crcmod import _usingExtension
+from .crcmod import _mkTable, _mkTable_r, _verifyParams, _useSse42
+from .crcmod import _bytecrc, _bytecrc_r, _bitrev
+from .crcmod import _packSliceTable, _mkFoldConsts, _sliceCount
+from . import _crcfunpy
+from . import _tuning
+try:
+    from . import _crcfunnp
+except ImportError:
+    _crcfunnp = None
+# The extension module, even if CRCMOD_BACKEND selects another one.
+try:
+    from . import _crcfunext
+except ImportError:
+    _crcfunext = None
+from . import aio
+from . import bench
 from .predefined import PredefinedCrc
 from .predefined import mkPredefinedCrcFun
 from .predefined import _crc_definitions as _predefined_crc_definitions
 
+# The package namespace hides the crcmod.crcmod module behind the package.
+_crcmodule = sys.modules[__package__ + '.crcmod']
+
 
 #-----------------------------------------------------------------------------
 # This polynomial was chosen because it is the product of two irreducible
@@ -418,6 +453,420 @@ xorOut   = 0xFFFFFFFF
 crcValue = 0x00000000'''
         self.assertEqual(str(y), str_rep)
 
+    def test_engine(self):
+        """Verify the engine attribute and that it is kept by new and copy"""
+        crc = Crc(g32)
+        if _usingExtension:
+            # The engine forced by CRCMOD_BACKEND, or the default one.  The
+            # sse42 engine only computes CRC-32C.
+            expected = _crcmodule._defaultEngine
+            if expected in (None, 'sse42'):
+                expected = 'clmul' if _crcmodule._useClmul else 'slicing'
+            self.assertEqual(crc.engine, expected)
+        else:
+            self.assertIn(crc.engine, ('numpy', 'python'))
+        self.assertEqual(crc.new().engine, crc.engine)
+        self.assertEqual(crc.copy().engine, crc.engine)
+
+
+class CrcFunTest(unittest.TestCase):
+    """Verify the calling conventions and attributes of the objects returned
+    by mkCrcFun"""
+
+    msg = b'CatMouse987654321'
+
+    def test_call(self):
+        crcfun = mkCrcFun(g32, 0, 1, 0xFFFFFFFF)
+        self.assertEqual(crcfun(self.msg), 0x084BFF58)
+        self.assertEqual(crcfun(self.msg, 0), 0x084BFF58)
+        self.assertEqual(crcfun(self.msg, crc=0), 0x084BFF58)
+        self.assertEqual(crcfun(self.msg, None), 0x084BFF58)
+        self.assertEqual(crcfun(data=self.msg), 0x084BFF58)
+        self.assertEqual(crcfun(self.msg[4:], crc=crcfun(self.msg[:4])), 0x084BFF58)
+        with self.assertRaises(TypeError):
+            crcfun()
+        with self.assertRaises(TypeError):
+            crcfun(self.msg, 0, 0)
+        with self.assertRaises(TypeError):
+            crcfun(self.msg, table=b'')
+
+    def test_attributes(self):
+        crcfun = mkCrcFun(g16, -1, False, 0x1234)
+        self.assertEqual(crcfun.width, 16)
+        self.assertEqual(crcfun.reverse, False)
+        self.assertEqual(crcfun.initCrc, 0xFFFF)
+        self.assertEqual(crcfun.xorOut, 0x1234)
+        self.assertEqual(crcfun.engine, Crc(g16, -1, False, 0x1234).engine)
+
+    def test_copy(self):
+        for engine in backends():
+            if engine['name'] == 'sse42':
+                poly = 0x11EDC6F41
+            else:
+                poly = g32
+            crcfun = mkCrcFun(poly, 0, True, 0xFFFFFFFF, engine['name'])
+            for other in [copy.copy(crcfun), copy.deepcopy(crcfun),
+                          pickle.loads(pickle.dumps(crcfun))]:
+                self.assertEqual(type(other), type(crcfun))
+                self.assertEqual(other.engine, crcfun.engine)
+                self.assertEqual(other.initCrc, crcfun.initCrc)
+                self.assertEqual(other(self.msg), crcfun(self.msg))
+        crc = Crc(g32)
+        crc.update(self.msg[:4])
+        other = copy.deepcopy(crc)
+        other.update(self.msg[4:])
+        self.assertEqual(other.crcValue, crc.new(self.msg).crcValue)
+
+    def test_many(self):
+        crcfun = mkCrcFun(g32, 0, 1, 0xFFFFFFFF)
+        buffers = [self.msg[:i] for i in range(len(self.msg) + 1)]
+        buffers.append(bytearray(self.msg))
+        buffers.append(memoryview(self.msg)[4:])
+        expected = [crcfun(x) for x in buffers]
+        self.assertEqual(crcfun.many(buffers), expected)
+        self.assertEqual(crcfun.many(iter(buffers)), expected)
+        self.assertEqual(crcfun.many(buffers[:]), expected)
+        self.assertEqual(crcfun.many([]), [])
+        self.assertEqual(crcfun.many([self.msg[4:]], crc=crcfun(self.msg[:4])),
+                         [0x084BFF58])
+        with self.assertRaises(TypeError):
+            crcfun.many(5)
+        with self.assertRaises(TypeError):
+            crcfun.many([self.msg, 'text'])
+
+    def test_records(self):
+        data = bytes((i*151 + 17) & 0xFF for i in range(1000))
+        for poly in [g8, g16, g24, g32, g64a]:
+            crcfun = mkCrcFun(poly)
+            for (stride, length, offset) in [(10, 7, 3), (16, 16, 0),
+                                             (5, 12, 1), (1000, 1000, 0),
+                                             (7, 0, 999), (3, 4, 1000)]:
+                starts = range(offset, len(data) - length + 1, stride)
+                expected = [crcfun(data[i:i+length]) for i in starts]
+                result = crcfun.records(data, stride, length, offset)
+                self.assertEqual(list(result), expected)
+                self.assertEqual(result.itemsize*8,
+                                 {24:32}.get(crcfun.width, crcfun.width))
+
+        crcfun = mkCrcFun(g32)
+        out = array('I', [0]*200)
+        self.assertIs(crcfun.records(memoryview(data), 10, 7, 3, out, crc=5), out)
+        self.assertEqual(out[:100].tolist(),
+                         [crcfun(data[i:i+7], 5) for i in range(3, 994, 10)])
+        self.assertEqual(out[100:].tolist(), [0]*100)
+        with self.assertRaises(ValueError):
+            crcfun.records(data, 10, 7, 3, array('I', [0]*99))
+        with self.assertRaises(ValueError):
+            crcfun.records(data, 10, 7, 3, bytearray(1000))
+        with self.assertRaises(ValueError):
+            crcfun.records(data, 0, 7)
+
+    def test_records_out_type(self):
+        # out must hold unsigned integers of the size of the CRC, and be
+        # writable and contiguous.
+        data = bytes(range(200))
+        for (poly, typeCode, wrong) in [(g8, 'B', ['b']),
+                                        (g32, 'I', ['f', 'i']),
+                                        (g64a, 'Q', ['d', 'q'])]:
+            crcfun = mkCrcFun(poly)
+            expected = [crcfun(data[i:i+10]) for i in range(0, 200, 10)]
+            out = array(typeCode, [0]*20)
+            crcfun.records(data, 10, 10, out=memoryview(out))
+            self.assertEqual(out.tolist(), expected)
+            for code in wrong:
+                out = array(code, [0]*20)
+                with self.assertRaises(ValueError):
+                    crcfun.records(data, 10, 10, out=out)
+                self.assertEqual(out.tolist(), [0]*20)
+        crcfun = mkCrcFun(g32)
+        with self.assertRaises(BufferError):
+            crcfun.records(data, 10, 10, out=bytes(80))
+        with self.assertRaises(BufferError):
+            crcfun.records(data, 10, 10,
+                           out=memoryview(array('I', [0]*40))[::2])
+
+    def test_crc_records(self):
+        data = bytes(range(256))
+        crc = Crc(g16)
+        crc.update(b'prefix')
+        value = crc.crcValue
+        result = crc.records(data, 16, 8, 4)
+        self.assertEqual(list(result),
+                         [crc.new(b'prefix' + data[i:i+8]).crcValue
+                          for i in range(4, 249, 16)])
+        self.assertEqual(crc.crcValue, value)
+
+    def test_crc_many(self):
+        crc = Crc(g32)
+        crc.update(self.msg[:4])
+        value = crc.crcValue
+        self.assertEqual(crc.many([self.msg[4:], b'']),
+                         [crc.new(self.msg).crcValue, value])
+        self.assertEqual(crc.crcValue, value)
+
+
+class TableTest(unittest.TestCase):
+    """Verify the tables built from the powers of two against the bit by bit
+    calculation of each entry."""
+
+    def test_tables(self):
+        for poly in [g8, g16, g24, g32, g64a, g64b]:
+            (n, initCrc, xorOut) = _verifyParams(poly, 0, 0)
+            mask = (1<<n) - 1
+            self.assertEqual(_mkTable(poly, n),
+                [_bytecrc(i<<(n-8), poly & mask, n) for i in range(256)])
+            self.assertEqual(_mkTable_r(poly, n),
+                [_bytecrc_r(i, _bitrev(poly & mask, n), n) for i in range(256)])
+
+
+class PredefinedTableTest(unittest.TestCase):
+    """Verify the static tables of the extension module against the tables
+    built by crcmod."""
+
+    @unittest.skipUnless(_usingExtension, 'requires the extension module')
+    def test_static_tables(self):
+        from . import _crcfunext
+        for definition in _predefined_crc_definitions:
+            poly = definition['poly']
+            rev = definition['reverse']
+            (n, initCrc, xorOut) = _verifyParams(poly, 0, 0)
+            static = _crcfunext._predefinedTable(n, poly & ((1<<n) - 1), rev,
+                                                 _sliceCount)
+            self.assertIsNotNone(static)
+            if rev:
+                table = _mkTable_r(poly, n)
+            else:
+                table = _mkTable(poly, n)
+            self.assertEqual(static[0], _packSliceTable(table, n, rev, _sliceCount))
+            self.assertEqual(static[1], _mkFoldConsts(poly, n, rev))
+        self.assertIsNone(_crcfunext._predefinedTable(32, 0x12345, True, 16))
+
+
+class TableCacheTest(unittest.TestCase):
+    """Verify that the tables are shared through the cache."""
+
+    def test_cache(self):
+        clearTableCache()
+        info = tableCacheInfo()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+        a = Crc(g32, 0, True, 0xFFFFFFFF)
+        b = Crc(g32, ~0, 1, 0)
+        crcfun = mkCrcFun(g32)
+        c = PredefinedCrc('crc-32')
+        info = tableCacheInfo()
+        self.assertEqual((info.hits, info.misses, info.currsize), (3, 1, 1))
+        self.assertIs(a.table, b.table)
+        self.assertIs(a.table, c.table)
+        self.assertEqual(crcfun(b'123456789'), 0xCBF43926 ^ 0xFFFFFFFF)
+
+        d = Crc(g32, rev=False)
+        self.assertIsNot(a.table, d.table)
+        self.assertEqual(tableCacheInfo().misses, 2)
+
+        clearTableCache()
+        self.assertEqual(tableCacheInfo().currsize, 0)
+        self.assertEqual(Crc(g32).new(b'123456789').crcValue,
+                         b.new(b'123456789').crcValue)
+
+        # The cache is bounded.
+        for i in range(tableCacheInfo().maxsize + 10):
+            mkCrcFun(0x10001 + 2*i)
+        self.assertEqual(tableCacheInfo().currsize, tableCacheInfo().maxsize)
+
+
+class SlicingKernelTest(unittest.TestCase):
+    """Verify that the multi-byte kernels used for large buffers give the same
+    answer as the byte-wise reference implementation."""
+
+    test_polys = [g8, g16, g24, g32, g64a, g64b]
+
+    # Lengths around the thresholds where the kernels switch algorithms.
+    test_lengths = list(range(0, 40)) + list(range(500, 530)) + [1000, 4099]
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(4200))
+
+    def reference_crc(self, poly, rev, data, crc):
+        (sizeBits, crc, xorOut) = _verifyParams(poly, crc, 0)
+        if rev:
+            table = _mkTable_r(poly, sizeBits)
+            fun = getattr(_crcfunpy, '_crc%dr' % sizeBits)
+        else:
+            table = _mkTable(poly, sizeBits)
+            fun = getattr(_crcfunpy, '_crc%d' % sizeBits)
+        return fun(data, crc, table)
+
+    def test_compare_reference(self):
+        for poly in self.test_polys:
+            for rev in (False, True):
+                crcfun = mkCrcFun(poly, 0, rev)
+                for i, n in enumerate(self.test_lengths):
+                    # Vary the alignment of the data as well as its length.
+                    data = memoryview(self.msg)[i % 8:i % 8 + n]
+                    crc = (0x5A3C96E1F00F1234 * (i + 1)) & 0xFFFFFFFFFFFFFFFF
+                    self.assertEqual(crcfun(data, crc),
+                                     self.reference_crc(poly, rev, data, crc),
+                                     "Wrong answer for poly 0x%X, rev %s, length %d" % (poly, rev, n))
+
+
+class WordKernelTest(unittest.TestCase):
+    """Verify that the slicing-by-4/8 kernels of the Python implementation
+    give the same answer as the byte-wise functions."""
+
+    test_polys = [g8, g16, g24, g32, g64a, g64b]
+
+    test_lengths = list(range(0, 40)) + [1000]
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(1010))
+
+    def test_compare_bytewise(self):
+        saved = _crcfunpy._wordSize
+        try:
+            for wordSize in (4, 8):
+                _crcfunpy._wordSize = wordSize
+                for poly in self.test_polys:
+                    for rev in (False, True):
+                        self.check(poly, rev, wordSize)
+        finally:
+            _crcfunpy._wordSize = saved
+
+    def check(self, poly, rev, wordSize):
+        (sizeBits, initCrc, xorOut) = _verifyParams(poly, ~0, 0x1234)
+        if rev:
+            table = _mkTable_r(poly, sizeBits)
+            fun = getattr(_crcfunpy, '_crc%dr' % sizeBits)
+        else:
+            table = _mkTable(poly, sizeBits)
+            fun = getattr(_crcfunpy, '_crc%d' % sizeBits)
+        crcfun = _crcfunpy.CrcFun(sizeBits, rev, table, initCrc, xorOut)
+        self.assertEqual(crcfun.wordSize, 8 if sizeBits > 32 else wordSize)
+        for i, n in enumerate(self.test_lengths):
+            data = self.msg[i % 8:i % 8 + n]
+            crc = (0x5A3C96E1F00F1234 * (i + 1)) & ((1 << sizeBits) - 1)
+            expected = xorOut ^ fun(data, crc ^ xorOut, table)
+            for obj in (data, bytearray(data), memoryview(data)):
+                self.assertEqual(crcfun(obj, crc), expected,
+                                 "Wrong answer for poly 0x%X, rev %s, length %d"
+                                 % (poly, rev, n))
+        self.assertEqual(crcfun.many([self.msg, b'']),
+                         [crcfun(self.msg), crcfun(b'')])
+        with self.assertRaises(TypeError):
+            crcfun('text' * 10)
+
+
+@unittest.skipIf(_crcfunnp is None, 'NumPy is not available')
+class NumpyBackendTest(unittest.TestCase):
+    """Verify that the NumPy lanes give the same answer as the Python
+    implementation."""
+
+    test_polys = [g8, g16, g24, g32, g64a, g64b]
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(5000))
+
+    def setUp(self):
+        # Small lanes, so that short messages go through all the steps.
+        self.saved = (_crcfunnp._numpyThreshold, _crcfunnp._maxLanesLog)
+        _crcfunnp._numpyThreshold = 64
+        _crcfunnp._maxLanesLog = 3
+
+    def tearDown(self):
+        (_crcfunnp._numpyThreshold, _crcfunnp._maxLanesLog) = self.saved
+
+    def test_compare_python(self):
+        for poly in self.test_polys:
+            for rev in (False, True):
+                (sizeBits, initCrc, xorOut) = _verifyParams(poly, ~0, 0x1234)
+                if rev:
+                    table = _mkTable_r(poly, sizeBits)
+                else:
+                    table = _mkTable(poly, sizeBits)
+                args = (sizeBits, rev, table, initCrc, xorOut)
+                crcfun = _crcfunnp.CrcFun(*args)
+                reference = _crcfunpy.CrcFun(*args)
+                self.assertEqual(crcfun.engine, 'numpy')
+                for n in [0, 63, 64, 65, 127, 200, 1000, 4999]:
+                    data = memoryview(self.msg)[1:1 + n]
+                    self.assertEqual(crcfun(data), reference(data))
+                    self.assertEqual(crcfun(data, 77), reference(data, 77))
+                data = memoryview(self.msg)[::3]
+                self.assertEqual(crcfun(data), reference(data))
+                data = array('I', self.msg[:4000])
+                self.assertEqual(crcfun(data), reference(data))
+                self.assertEqual(crcfun.many([self.msg, b'', b'1']),
+                                 reference.many([self.msg, b'', b'1']))
+        with self.assertRaises(TypeError):
+            crcfun('text')
+
+    def test_word_kernels(self):
+        # The slicing tables of the Python word kernels, used for short
+        # buffers and the remainders, are kept along with the shift tables.
+        saved = _crcfunpy._wordSize
+        try:
+            for wordSize in (4, 8):
+                _crcfunpy._wordSize = wordSize
+                for poly in self.test_polys:
+                    for rev in (False, True):
+                        (sizeBits, initCrc, xorOut) = _verifyParams(poly, ~0, 0)
+                        if rev:
+                            table = _mkTable_r(poly, sizeBits)
+                        else:
+                            table = _mkTable(poly, sizeBits)
+                        args = (sizeBits, rev, table, initCrc, xorOut)
+                        crcfun = _crcfunnp.CrcFun(*args)
+                        self.assertTrue(crcfun.wordSize)
+                        for n in [0, 20, 63, 64, 100, 1000, 4999]:
+                            data = self.msg[:n]
+                            self.assertEqual(crcfun(data),
+                                             _crcfunpy.CrcFun(*args)(data))
+        finally:
+            _crcfunpy._wordSize = saved
+
+    def test_threads(self):
+        # The shift tables are built on first use, possibly by several
+        # threads at once.
+        (sizeBits, initCrc, xorOut) = _verifyParams(g32, ~0, 0)
+        args = (sizeBits, True, _mkTable_r(g32, sizeBits), initCrc, xorOut)
+        reference = _crcfunpy.CrcFun(*args)
+        buffers = [memoryview(self.msg)[:n] for n in
+                   [4999, 2000, 1000, 600, 300, 4096, 129, 64]*4]
+        expected = [reference(data) for data in buffers]
+        with ThreadPoolExecutor(8) as executor:
+            for i in range(20):
+                crcfun = _crcfunnp.CrcFun(*args)
+                self.assertEqual(list(executor.map(crcfun, buffers)),
+                                 expected)
+
+
+class Crc32cTest(unittest.TestCase):
+    """Verify CRC-32C, which uses the crc32 instruction when the processor
+    supports it."""
+
+    poly = 0x11EDC6F41
+
+    # Lengths around the thresholds where the buffer is split in three.
+    test_lengths = list(range(0, 40)) + [767, 768, 769, 24575, 24576, 24577, 50000]
+
+    msg = bytes((i*167 + i//256) & 0xFF for i in range(50008))
+
+    def test_compare_reference(self):
+        crcfun = mkCrcFun(self.poly)
+        table = _mkTable_r(self.poly, 32)
+        for n in self.test_lengths:
+            data = memoryview(self.msg)[n % 8:n % 8 + n]
+            self.assertEqual(crcfun(data), _crcfunpy._crc32r(data, 0xFFFFFFFF, table),
+                             "Wrong answer for length %d" % n)
+
+    def test_engine(self):
+        # CRCMOD_BACKEND may force another engine.
+        useSse42 = _useSse42 and _crcmodule._defaultEngine in (None, 'sse42')
+        for crc in (Crc(self.poly), PredefinedCrc('crc-32c')):
+            if useSse42:
+                self.assertEqual(crc.engine, 'sse42')
+            else:
+                self.assertNotEqual(crc.engine, 'sse42')
+        # The forward algorithm does not use the crc32 instruction.
+        self.assertNotEqual(Crc(self.poly, rev=False).engine, 'sse42')
+
 
 class PredefinedCrcTest(unittest.TestCase):
     """Verify the predefined CRCs"""
@@ -530,6 +979,898 @@ class InputTypesTest(unittest.TestCase):
                 crcfun("123456789")
 
 
+class ThreadingTest(unittest.TestCase):
+    """Verify CRC calculations made from several threads at once."""
+
+    msgs = [bytes((i*j + j//7) & 0xFF for j in range(20000)) for i in range(8)]
+
+    def test_gil_threshold(self):
+        previous = setGilThreshold(0)
+        try:
+            self.assertEqual(setGilThreshold(100), 0)
+            self.assertEqual(setGilThreshold(previous), 100)
+        finally:
+            setGilThreshold(previous)
+        with self.assertRaises(ValueError):
+            setGilThreshold(-1)
+
+    def test_threads(self):
+        crcfun = mkPredefinedCrcFun('crc-32c')
+        expected = [crcfun(msg) for msg in self.msgs]
+        # Release the GIL for every buffer so that the threads overlap.
+        previous = setGilThreshold(0)
+        try:
+            with ThreadPoolExecutor(4) as executor:
+                results = list(executor.map(crcfun, self.msgs*4))
+        finally:
+            setGilThreshold(previous)
+        self.assertEqual(results, expected*4)
+
+    @unittest.skipUnless(_usingExtension, 'requires the extension module')
+    def test_list_changed(self):
+        # Another thread replaces the buffers of the lists passed to many and
+        # MultiCrc while their CRCs are computed without the GIL.  The old
+        # buffers must stay alive until they have been processed.
+        crcfun = mkPredefinedCrcFun('crc-32')
+        buffers = [bytes(msg) for msg in self.msgs]
+        funs = [mkPredefinedCrcFun('crc-32'), mkPredefinedCrcFun('crc-16')]
+        valid = set(crcfun(msg) for msg in self.msgs)
+        done = []
+
+        def mutate():
+            i = 0
+            while not done:
+                buffers[i % len(buffers)] = bytes(self.msgs[i % 3])
+                funs[i % 2] = mkPredefinedCrcFun(['crc-32', 'crc-16'][i % 2])
+                i += 1
+
+        previous = setGilThreshold(0)
+        try:
+            with ThreadPoolExecutor(1) as executor:
+                future = executor.submit(mutate)
+                try:
+                    for i in range(200):
+                        self.assertTrue(set(crcfun.many(buffers)) <= valid)
+                        _crcmodule._crcfun._multiUpdate(funs, self.msgs[0],
+                                                        [0, 0])
+                finally:
+                    done.append(True)
+                future.result()
+        finally:
+            setGilThreshold(previous)
+
+
+class CombineTest(unittest.TestCase):
+    """Verify that combining the CRCs of two pieces of a message gives the
+    CRC of the whole message, as computed by the Python reference code."""
+
+    test_polys = [g8, g16, g24, g32, g64a, g64b]
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(70))
+
+    def reference_fun(self, poly, initCrc, rev, xorOut):
+        (sizeBits, initCrc, xorOut) = _verifyParams(poly, initCrc, xorOut)
+        if rev:
+            table = _mkTable_r(poly, sizeBits)
+        else:
+            table = _mkTable(poly, sizeBits)
+        return _crcfunpy.CrcFun(sizeBits, rev, table, initCrc, xorOut)
+
+    def test_combine(self):
+        for poly in self.test_polys:
+            for rev in (True, False):
+                for (initCrc, xorOut) in [(0, 0), (~0, 0), (0, ~0),
+                                          (0x5A5A5A5A5A5A5A5A, 0x123456789ABCDEF)]:
+                    crcfun = self.reference_fun(poly, initCrc, rev, xorOut)
+                    crc = Crc(poly, initCrc, rev, xorOut)
+                    expected = crcfun(self.msg)
+                    for i in range(len(self.msg) + 1):
+                        crcA = crcfun(self.msg[:i])
+                        crcB = crcfun(self.msg[i:])
+                        lenB = len(self.msg) - i
+                        self.assertEqual(crc.combine(crcA, crcB, lenB), expected)
+                        self.assertEqual(combineCrc(poly, crcA, crcB, lenB,
+                                                    initCrc, rev, xorOut),
+                                         expected)
+
+    def test_long(self):
+        # Lengths that need many squarings of the shift operator.
+        crc = Crc(g32)
+        crcfun = mkCrcFun(g32)
+        msg = bytes(100000)
+        for lenB in (1 << 16, 99999, 100000):
+            crcA = crcfun(b'head')
+            crcB = crcfun(msg[:lenB])
+            self.assertEqual(crc.combine(crcA, crcB, lenB),
+                             crcfun(b'head' + msg[:lenB]))
+        with self.assertRaises(ValueError):
+            crc.combine(0, 0, -1)
+
+    def test_zeros(self):
+        for poly in self.test_polys:
+            for rev in (True, False):
+                for (initCrc, xorOut) in [(0, 0), (~0, 0), (0, ~0),
+                                          (0x5A5A5A5A5A5A5A5A, 0x123456789ABCDEF)]:
+                    crcfun = self.reference_fun(poly, initCrc, rev, xorOut)
+                    crc = Crc(poly, initCrc, rev, xorOut).new(self.msg)
+                    for n in (0, 1, 7, 64, 1000):
+                        expected = crcfun(self.msg + bytes(n))
+                        self.assertEqual(shiftCrc(poly, crc.crcValue, n, rev,
+                                                  xorOut), expected)
+                        c = crc.copy()
+                        c.updateZeros(n)
+                        self.assertEqual(c.crcValue, expected)
+        crc = PredefinedCrc('crc-32')
+        crc.updateZeros(1 << 20)
+        crc.update(b'tail')
+        self.assertEqual(crc.crcValue, binascii.crc32(bytes(1 << 20) + b'tail'))
+        with self.assertRaises(ValueError):
+            crc.updateZeros(-1)
+
+
+class PatchTest(unittest.TestCase):
+    """Verify Crc.patch against the CRC of the whole patched message."""
+
+    def random_bytes(self, rnd, n):
+        return bytes(rnd.randrange(256) for i in range(n))
+
+    def test_random_patches(self):
+        rnd = random.Random(1234)
+        for poly in [g8, g16, g24, g32, g64a]:
+            for rev in (True, False):
+                for (initCrc, xorOut) in [(0, 0), (~0, 0), (~0, ~0), (5, 3)]:
+                    crc = Crc(poly, initCrc, rev, xorOut)
+                    for i in range(10):
+                        msg = bytearray(self.random_bytes(rnd, rnd.randrange(1, 300)))
+                        size = rnd.randrange(len(msg) + 1)
+                        offset = rnd.randrange(len(msg) - size + 1)
+                        old = bytes(msg[offset:offset+size])
+                        new = self.random_bytes(rnd, size)
+                        before = crc.new(msg).crcValue
+                        msg[offset:offset+size] = new
+                        self.assertEqual(crc.patch(before, offset, old, new,
+                                                   len(msg)),
+                                         crc.new(msg).crcValue)
+
+    def test_large(self):
+        crc = PredefinedCrc('crc-32c')
+        msg = bytearray(1 << 20)
+        before = crc.new(msg).crcValue
+        msg[1000:1004] = b'abcd'
+        after = crc.patch(before, 1000, bytes(4), array('B', b'abcd'), len(msg))
+        self.assertEqual(after, crc.new(msg).crcValue)
+        self.assertEqual(crc.crcValue, crc.initCrc)
+        with self.assertRaises(ValueError):
+            crc.patch(before, 1000, b'ab', b'abc', len(msg))
+        with self.assertRaises(ValueError):
+            crc.patch(before, len(msg) - 1, b'ab', b'cd', len(msg))
+        with self.assertRaises(ValueError):
+            crc.patch(before, -1, b'ab', b'cd', len(msg))
+        with self.assertRaises(TypeError):
+            crc.patch(before, 0, 'ab', 'cd', len(msg))
+
+
+class UpdateParallelTest(unittest.TestCase):
+    """Verify that Crc.updateParallel gives the same answer as update."""
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(30000))
+
+    def test_update_parallel(self):
+        for poly in [g8, g16, g24, g32, g64a]:
+            for rev in (True, False):
+                expected = Crc(poly, rev=rev)
+                expected.update(b'prefix')
+                expected.update(self.msg)
+                for (workers, chunkSize) in [(4, 97), (3, 1000), (2, 29999),
+                                             (4, 30000), (1, None), (None, None)]:
+                    crc = Crc(poly, rev=rev)
+                    crc.update(b'prefix')
+                    crc.updateParallel(self.msg, workers, chunkSize)
+                    self.assertEqual(crc.crcValue, expected.crcValue)
+
+    def test_buffers(self):
+        crc = Crc(g32)
+        crc.updateParallel(bytearray(self.msg), 4, 4096)
+        crc.updateParallel(memoryview(self.msg)[::-1].tobytes(), 4, 4096)
+        crc.updateParallel(b'', 4, 4096)
+        self.assertEqual(crc.crcValue,
+                         Crc(g32).new(self.msg + self.msg[::-1]).crcValue)
+        with self.assertRaises(ValueError):
+            crc.updateParallel(self.msg, 4, 0)
+
+
+class FileTest(unittest.TestCase):
+    """Verify the CRC of files read with Crc.updateFile and crcFile."""
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(100000))
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.msg)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def check(self, bufferSize=None):
+        expected = Crc(g32).new(self.msg).crcValue
+        crc = Crc(g32)
+        crc.updateFile(self.path, bufferSize)
+        self.assertEqual(crc.crcValue, expected)
+
+        # File objects are read from the current position.
+        for buffering in (0, -1):
+            with open(self.path, 'rb', buffering=buffering) as f:
+                f.read(7)
+                crc = Crc(g32).new(b'1234')
+                crc.updateFile(f, bufferSize)
+                self.assertEqual(crc.crcValue,
+                                 Crc(g32).new(b'1234' + self.msg[7:]).crcValue)
+                self.assertEqual(f.read(), b'')
+
+    def test_read(self):
+        self.check()
+        self.check(1000)
+        self.check(1)
+        with self.assertRaises(ValueError):
+            Crc(g32).updateFile(self.path, 0)
+
+    def test_mmap(self):
+        threshold = _crcmodule._mmapThreshold
+        _crcmodule._mmapThreshold = 1000
+        try:
+            self.check()
+        finally:
+            _crcmodule._mmapThreshold = threshold
+
+    def test_sparse(self):
+        # Data extents separated by holes, and a hole at the end.  Whether
+        # the holes are allocated depends on the file system.
+        with open(self.path, 'wb') as f:
+            f.write(self.msg)
+            f.seek(1 << 20)
+            f.write(self.msg)
+            f.truncate(3 << 20)
+        with open(self.path, 'rb') as f:
+            contents = f.read()
+        for mmapThreshold in (_crcmodule._mmapThreshold, 1000):
+            threshold = _crcmodule._mmapThreshold
+            _crcmodule._mmapThreshold = mmapThreshold
+            try:
+                for bufferSize in (None, 4096):
+                    crc = PredefinedCrc('crc-32')
+                    crc.updateFile(self.path, bufferSize)
+                    self.assertEqual(crc.crcValue, binascii.crc32(contents))
+                    for buffering in (0, -1):
+                        with open(self.path, 'rb', buffering=buffering) as f:
+                            f.read(7)
+                            crc = crcFile(f, 'crc-32')
+                            self.assertEqual(f.read(), b'')
+                        self.assertEqual(crc.crcValue,
+                                         binascii.crc32(contents[7:]))
+            finally:
+                _crcmodule._mmapThreshold = threshold
+
+    def test_file_objects(self):
+        crc = Crc(g32)
+        crc.updateFile(io.BytesIO(self.msg), 4096)
+        self.assertEqual(crc.crcValue, Crc(g32).new(self.msg).crcValue)
+
+        class Reader:
+            # Only provides read.
+            def __init__(self, data):
+                self.f = io.BytesIO(data)
+            def read(self, n):
+                return self.f.read(n)
+
+        crc = Crc(g32)
+        crc.updateFile(Reader(self.msg), 4096)
+        self.assertEqual(crc.crcValue, Crc(g32).new(self.msg).crcValue)
+
+        with self.assertRaises(TypeError):
+            Crc(g32).updateFile(io.StringIO('text'))
+
+    def test_wrapped_files(self):
+        # Objects with a fileno method whose data differs from the contents
+        # of the file descriptor are read through their read methods, even
+        # when the file is large enough to be mapped or sparse.
+        import gzip
+        expected = binascii.crc32(self.msg)
+        threshold = _crcmodule._mmapThreshold
+        _crcmodule._mmapThreshold = 100
+        try:
+            with gzip.open(self.path, 'wb') as f:
+                f.write(self.msg)
+            self.assertGreater(os.path.getsize(self.path), 100)
+            with gzip.open(self.path, 'rb') as f:
+                self.assertEqual(crcFile(f, 'crc-32').crcValue, expected)
+            with open(self.path, 'rb') as f:
+                with gzip.GzipFile(fileobj=f) as g:
+                    self.assertEqual(crcFile(g, 'crc-32').crcValue, expected)
+
+            class Wrapper(io.BytesIO):
+                # Has the file descriptor of another file.
+                def __init__(self, data, fd):
+                    super().__init__(data)
+                    self.fd = fd
+                def fileno(self):
+                    return self.fd
+
+            data = self.msg[:5000]
+            with open(self.path, 'rb') as f:
+                wrapper = Wrapper(data, f.fileno())
+                self.assertEqual(crcFile(wrapper, 'crc-32').crcValue,
+                                 binascii.crc32(data))
+        finally:
+            _crcmodule._mmapThreshold = threshold
+
+    def test_crc_file(self):
+        crc = crcFile(self.path, 'crc-32')
+        self.assertEqual(crc.crcValue, binascii.crc32(self.msg))
+        crc = crcFile(self.path, Crc(g32).new(b'ignored'))
+        self.assertEqual(crc.crcValue, Crc(g32).new(self.msg).crcValue)
+        with self.assertRaises(KeyError):
+            crcFile(self.path, 'no-such-crc')
+
+
+class MultiCrcTest(unittest.TestCase):
+    """Verify that MultiCrc gives the same results as separate Crc objects."""
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(50000))
+
+    names = ['crc-32', 'crc-32c', 'crc-64-we', 'crc-16', 'crc-24', 'crc-8']
+
+    def test_update(self):
+        multi = MultiCrc(self.names + [Crc(g32, rev=False)])
+        singles = [PredefinedCrc(name) for name in self.names]
+        singles.append(Crc(g32, rev=False))
+        for data in [b'', b'1', self.msg[:100], bytearray(self.msg),
+                     memoryview(self.msg)[3:40003]]:
+            multi.update(data)
+            for crc in singles:
+                crc.update(data)
+            self.assertEqual(multi.crcValues, [c.crcValue for c in singles])
+        self.assertEqual(multi.digests(), [c.digest() for c in singles])
+        self.assertEqual(multi.hexdigests(), [c.hexdigest() for c in singles])
+        self.assertEqual(len(multi), 7)
+        self.assertEqual(multi['crc-32c'].crcValue, singles[1].crcValue)
+        self.assertEqual(multi[6].crcValue, singles[6].crcValue)
+        with self.assertRaises(TypeError):
+            multi.update('text')
+
+    def test_new_copy(self):
+        start = Crc(g16).new(b'start')
+        multi = MultiCrc(['crc-32', start])
+        self.assertEqual(multi[1].crcValue, start.crcValue)
+        multi.update(self.msg)
+        copy = multi.copy()
+        new = multi.new(self.msg)
+        self.assertEqual(copy.crcValues, multi.crcValues)
+        self.assertEqual(new.crcValues, [binascii.crc32(self.msg),
+                                         Crc(g16).new(self.msg).crcValue])
+        copy.update(b'more')
+        self.assertNotEqual(copy.crcValues, multi.crcValues)
+
+
+class RollingCrcTest(unittest.TestCase):
+    """Verify the rolling CRC against the CRC of each window."""
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(1000))
+
+    def check(self, crc, window):
+        rolling = RollingCrc(crc, window)
+        fun = mkCrcFun(crc.poly, crc.initCrc, crc.reverse, crc.xorOut)
+        padded = bytes(window) + self.msg
+        self.assertEqual(rolling.crcValue, fun(bytes(window)))
+        pos = 0
+        for size in [1, window - 1, 2*window, 0, 300]:
+            rolling.update(self.msg[pos:pos+size])
+            pos += size
+            self.assertEqual(rolling.crcValue, fun(padded[pos:pos+window]))
+
+        rolling.reset()
+        expected = [i for i in range(1, len(self.msg) + 1)
+                    if fun(padded[i:i+window]) & 0x1F == 0x15]
+        self.assertEqual(rolling.scan(self.msg, 0x1F, 0x15), expected)
+        self.assertEqual(rolling.crcValue, fun(self.msg[-window:]))
+
+    def test_rolling(self):
+        for poly in [g8, g16, g24, g32, g64a]:
+            for rev in [True, False]:
+                for (initCrc, xorOut) in [(0, 0), (~0, 0), (~0, ~0), (5, 3)]:
+                    for window in [1, 16, 48]:
+                        self.check(Crc(poly, initCrc, rev, xorOut), window)
+
+    def test_predefined(self):
+        rolling = RollingCrc('crc-32', 64)
+        rolling.update(array('I', range(100)))
+        data = array('I', range(100)).tobytes()
+        copy = rolling.copy()
+        self.assertEqual(rolling.crcValue, binascii.crc32(data[-64:]))
+        self.assertEqual(rolling.hexdigest(),
+                         '%08X' % binascii.crc32(data[-64:]))
+        copy.update(b'x')
+        self.assertEqual(rolling.crcValue, binascii.crc32(data[-64:]))
+        self.assertEqual(copy.crcValue, binascii.crc32(data[-63:] + b'x'))
+        with self.assertRaises(TypeError):
+            rolling.update('text')
+        with self.assertRaises(ValueError):
+            RollingCrc('crc-32', 0)
+
+
+class CrcIOTest(unittest.TestCase):
+    """Verify the CRC computed by the CrcReader and CrcWriter wrappers."""
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(10000))
+
+    def expected(self):
+        return Crc(g32).new(self.msg).crcValue
+
+    def test_reader(self):
+        reader = CrcReader(io.BytesIO(self.msg), Crc(g32))
+        data = reader.read(10)
+        data += reader.read1(100)
+        buf = bytearray(1000)
+        n = reader.readinto(buf)
+        data += buf[:n]
+        n = reader.readinto1(memoryview(buf)[:500])
+        data += buf[:n]
+        data += reader.read()
+        self.assertEqual(reader.read(), b'')
+        self.assertEqual(data, self.msg)
+        self.assertEqual(reader.crcValue, self.expected())
+        self.assertEqual(reader.hexdigest(), Crc(g32).new(self.msg).hexdigest())
+        self.assertEqual(reader.digest(), Crc(g32).new(self.msg).digest())
+
+    def test_reader_lines(self):
+        lines = b'first line\nsecond line\nlast'
+        with CrcReader(io.BufferedReader(io.BytesIO(lines)), Crc(g16)) as reader:
+            self.assertEqual(list(reader), lines.splitlines(True))
+            self.assertEqual(reader.crcValue, Crc(g16).new(lines).crcValue)
+        self.assertTrue(reader.closed)
+        self.assertTrue(reader.file.closed)
+
+    def test_reader_text(self):
+        text = 'caf\xe9\n'
+        reader = CrcReader(io.BytesIO(text.encode('utf-8')), Crc(g32))
+        self.assertEqual(io.TextIOWrapper(reader, 'utf-8').read(), text)
+        self.assertEqual(reader.crcValue,
+                         Crc(g32).new(text.encode('utf-8')).crcValue)
+
+    def test_writer(self):
+        f = io.BytesIO()
+        writer = CrcWriter(f, Crc(g32))
+        writer.write(self.msg[:10])
+        writer.write(bytearray(self.msg[10:100]))
+        writer.write(memoryview(self.msg)[100:])
+        writer.flush()
+        self.assertEqual(f.getvalue(), self.msg)
+        self.assertEqual(writer.crcValue, self.expected())
+        self.assertIs(writer.detach(), f)
+        self.assertFalse(f.closed)
+
+    def test_writer_partial(self):
+        class Partial(io.RawIOBase):
+            # Accepts at most 3 bytes per write.
+            def __init__(self):
+                self.data = bytearray()
+            def writable(self):
+                return True
+            def write(self, b):
+                self.data += bytes(b[:3])
+                return min(len(b), 3)
+
+        raw = Partial()
+        writer = CrcWriter(raw, Crc(g32))
+        data = memoryview(self.msg[:100])
+        while data:
+            data = data[writer.write(data):]
+        self.assertEqual(raw.data, self.msg[:100])
+        self.assertEqual(writer.crcValue, Crc(g32).new(self.msg[:100]).crcValue)
+
+
+class AsyncioTest(unittest.TestCase):
+    """Verify the CRC computed by the asyncio stream wrappers."""
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(10000))
+
+    def test_reader(self):
+        async def run():
+            stream = asyncio.StreamReader()
+            stream.feed_data(b'line 1\nline 2\n' + self.msg)
+            stream.feed_eof()
+            reader = aio.CrcStreamReader(stream, Crc(g32))
+            data = await reader.readline()
+            data += await reader.readuntil(b'\n')
+            data += await reader.readexactly(100)
+            data += await reader.read(100)
+            data += await reader.read()
+            self.assertTrue(reader.at_eof())
+            return data, reader
+
+        data, reader = asyncio.run(run())
+        self.assertEqual(data, b'line 1\nline 2\n' + self.msg)
+        self.assertEqual(reader.crcValue, Crc(g32).new(data).crcValue)
+        self.assertEqual(reader.hexdigest(), Crc(g32).new(data).hexdigest())
+
+    def test_lines(self):
+        lines = [b'first\n', b'second\n', b'last']
+        async def run():
+            stream = asyncio.StreamReader()
+            stream.feed_data(b''.join(lines))
+            stream.feed_eof()
+            reader = aio.CrcStreamReader(stream, Crc(g16))
+            return [line async for line in reader], reader.crcValue
+
+        result, crcValue = asyncio.run(run())
+        self.assertEqual(result, lines)
+        self.assertEqual(crcValue, Crc(g16).new(b''.join(lines)).crcValue)
+
+    def test_connection(self):
+        async def run():
+            (a, b) = socket.socketpair()
+            (readerA, writerA) = await asyncio.open_connection(sock=a)
+            (readerB, writerB) = await asyncio.open_connection(sock=b)
+            writer = aio.CrcStreamWriter(writerA, Crc(g32))
+            reader = aio.CrcStreamReader(readerB, Crc(g32))
+            writer.write(self.msg[:100])
+            writer.writelines([self.msg[100:5000], self.msg[5000:]])
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+            data = await reader.read()
+            writerB.close()
+            await writerB.wait_closed()
+            return data, writer.crcValue, reader.crcValue
+
+        (data, writerCrc, readerCrc) = asyncio.run(run())
+        self.assertEqual(data, self.msg)
+        self.assertEqual(writerCrc, Crc(g32).new(self.msg).crcValue)
+        self.assertEqual(readerCrc, writerCrc)
+
+    def test_update_async(self):
+        threshold = aio._executorThreshold
+        aio._executorThreshold = 1000
+        try:
+            async def run():
+                crc = Crc(g32)
+                await aio.updateAsync(crc, self.msg[:999])
+                return await aio.updateAsync(crc, self.msg[999:])
+            self.assertEqual(asyncio.run(run()), Crc(g32).new(self.msg).crcValue)
+
+            # The threshold is in bytes, whatever the item size of the data.
+            class Executor(ThreadPoolExecutor):
+                submitted = 0
+                def submit(self, *args):
+                    self.submitted += 1
+                    return super().submit(*args)
+
+            data = array('Q', range(400))
+            async def runArray(executor):
+                crc = Crc(g32)
+                await aio.updateAsync(crc, data[:200], executor)
+                await aio.updateAsync(crc, data[200:], executor)
+                return crc.crcValue
+            with Executor(1) as executor:
+                self.assertEqual(asyncio.run(runArray(executor)),
+                                 Crc(g32).new(data.tobytes()).crcValue)
+                self.assertEqual(executor.submitted, 2)
+        finally:
+            aio._executorThreshold = threshold
+
+
+class BackendTest(unittest.TestCase):
+    """Verify that every engine gives the same results, and the selection of
+    the engine with the backend parameter and CRCMOD_BACKEND."""
+
+    msg = bytes((i*151 + 17) & 0xFF for i in range(20000))
+
+    def test_backends(self):
+        names = [engine['name'] for engine in backends()]
+        self.assertIn('python', names)
+        self.assertEqual(_crcfunext is not None, 'slicing' in names)
+        self.assertEqual(_crcfunnp is not None, 'numpy' in names)
+        for engine in backends():
+            self.assertEqual(engine['crc32cOnly'], engine['name'] == 'sse42')
+            self.assertEqual(engine['releasesGil'],
+                             engine['module'] == 'crcmod._crcfunext')
+
+    def test_engines(self):
+        for engine in backends():
+            name = engine['name']
+            if name == 'sse42':
+                polys = [(0x11EDC6F41, True)]
+            else:
+                polys = [(g8, True), (g16, False), (g24, True), (g32, False),
+                         (0x11EDC6F41, True), (g64a, True)]
+            for (poly, rev) in polys:
+                crc = Crc(poly, 0, rev, 0x5A)
+                crcfun = mkCrcFun(poly, 0, rev, 0x5A, backend=name)
+                self.assertEqual(crcfun.engine, name)
+                self.assertEqual(Crc(poly, 0, rev, 0x5A, backend=name).engine,
+                                 name)
+                for n in (0, 5, 1000, len(self.msg)):
+                    self.assertEqual(crcfun(self.msg[:n]),
+                                     crc.new(self.msg[:n]).crcValue,
+                                     'engine %s, poly 0x%X' % (name, poly))
+        self.assertEqual(PredefinedCrc('crc-32', backend='python').engine,
+                         'python')
+        self.assertEqual(mkPredefinedCrcFun('crc-32', 'python').engine,
+                         'python')
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            mkCrcFun(g32, backend='no-such-engine')
+        with self.assertRaises(ValueError):
+            Crc(g32, backend='sse42')
+        if _crcfunext is None:
+            with self.assertRaises(ValueError):
+                Crc(g32, backend='slicing')
+
+    def test_multi_crc(self):
+        multi = MultiCrc([Crc(g32, backend='python'), 'crc-32'])
+        multi.update(self.msg)
+        self.assertEqual(multi.crcValues, [Crc(g32).new(self.msg).crcValue,
+                                           binascii.crc32(self.msg)])
+
+    def test_environment(self):
+        pkgdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([pkgdir, env.get('PYTHONPATH', '')])
+        stmt = ('import crcmod.predefined; '
+                'print(crcmod.predefined.Crc("crc-32").engine, '
+                'crcmod.predefined.Crc("crc-32c").engine)')
+        expected = {'python': 'python python'}
+        if _crcfunext is not None:
+            expected['table'] = 'table table'
+            if _crcfunext._hasSse42:
+                expected['sse42'] = 'slicing sse42'
+                if _crcfunext._hasClmul:
+                    expected['sse42'] = 'clmul sse42'
+        for (name, engines) in expected.items():
+            env['CRCMOD_BACKEND'] = name
+            proc = subprocess.run([sys.executable, '-c', stmt], env=env,
+                                  stdout=subprocess.PIPE, check=True,
+                                  universal_newlines=True)
+            self.assertEqual(proc.stdout.strip(), engines)
+        env['CRCMOD_BACKEND'] = 'no-such-engine'
+        proc = subprocess.run([sys.executable, '-c', stmt], env=env,
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              universal_newlines=True)
+        self.assertNotEqual(proc.returncode, 0)
+        self.assertIn('CRCMOD_BACKEND', proc.stderr)
+
+        # Listing the engines does not load the extension module when
+        # CRCMOD_BACKEND selects another one.
+        stmt = ('import sys, crcmod; '
+                'names = [engine["name"] for engine in crcmod.backends()]; '
+                'print("crcmod._crcfunext" in sys.modules, "slicing" in names, '
+                '"clmul" in names)')
+        env['CRCMOD_BACKEND'] = 'python'
+        proc = subprocess.run([sys.executable, '-c', stmt], env=env,
+                              stdout=subprocess.PIPE, check=True,
+                              universal_newlines=True)
+        self.assertEqual(proc.stdout.split(),
+                         ['False', str(_crcfunext is not None), 'False'])
+
+
+class TuneTest(unittest.TestCase):
+    """Verify that the kernels give the same answer whatever the thresholds
+    at which they are switched, and that tune saves thresholds that later
+    imports apply."""
+
+    widths = [8, 16, 24, 32, 64]
+
+    def setUp(self):
+        module = _crcmodule._crcfun
+        self.saved = {}
+        if hasattr(module, '_setThresholds'):
+            for width in self.widths:
+                self.saved[width] = module._setThresholds(width)
+        if hasattr(module, '_numpyThreshold'):
+            self.savedNumpy = module._numpyThreshold
+
+    def tearDown(self):
+        module = _crcmodule._crcfun
+        for (width, thresholds) in self.saved.items():
+            module._setThresholds(width, *thresholds)
+        if hasattr(module, '_numpyThreshold'):
+            module._numpyThreshold = self.savedNumpy
+
+    def test_thresholds(self):
+        if not _usingExtension:
+            return
+        module = _crcmodule._crcfun
+        self.assertEqual(module._setThresholds(32, 100, 200, 10),
+                         self.saved[32])
+        # The folding engine needs at least 64 bytes.
+        self.assertEqual(module._setThresholds(32), (100, 200, 64))
+        self.assertRaises(ValueError, module._setThresholds, 12)
+
+        test = SlicingKernelTest('test_compare_reference')
+        never = sys.maxsize
+        for thresholds in [(0, 0, 0), (0, never, never), (never, never, never),
+                           (24, 100, 300)]:
+            for width in self.widths:
+                module._setThresholds(width, *thresholds)
+            test.test_compare_reference()
+
+    def test_tune(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'crcmod', 'thresholds.json')
+            result = tune(sizes=[64, 256, 1024], path=path)
+            module = _crcmodule._crcfun
+            self.assertEqual('extension' in result,
+                             hasattr(module, '_setThresholds'))
+            self.assertEqual('numpy' in result,
+                             hasattr(module, '_numpyThreshold'))
+            with open(path) as f:
+                data = json.load(f)
+            self.assertEqual(list(data['hosts'].values()), [result])
+
+            # The sizes may be given in any order.
+            unordered = tune(sizes=[4096, 64, 8, 64], save=False)
+            for thresholds in unordered.get('extension', {}).values():
+                for value in thresholds.values():
+                    self.assertIn(value, [None, 8, 64, 4096])
+            if 'numpy' in unordered:
+                self.assertIn(unordered['numpy'], [64, 4096, sys.maxsize])
+            with self.assertRaises(ValueError):
+                tune(sizes=[0, 64], save=False)
+
+            # The thresholds are applied along with the low level functions.
+            pkgdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            env = dict(os.environ)
+            env['PYTHONPATH'] = os.pathsep.join([pkgdir,
+                                                 env.get('PYTHONPATH', '')])
+            env['CRCMOD_TUNE_FILE'] = path
+            if 'extension' in result:
+                env.pop('CRCMOD_BACKEND', None)
+                stmt = 'print(list(m._setThresholds(32)))'
+                expected = [sys.maxsize if x is None else x
+                            for x in (result['extension']['32'][name]
+                                      for name in ('slice8', 'slice16',
+                                                   'fold'))]
+            elif 'numpy' in result:
+                env['CRCMOD_BACKEND'] = 'numpy'
+                stmt = 'print(m._numpyThreshold)'
+                expected = result['numpy']
+            else:
+                return
+            stmt = ('import sys, crcmod; crcmod.mkCrcFun(0x104C11DB7); '
+                    'm = sys.modules["crcmod.crcmod"]._crcfun; ' + stmt)
+            proc = subprocess.run([sys.executable, '-c', stmt], env=env,
+                                  stdout=subprocess.PIPE, check=True,
+                                  universal_newlines=True)
+            self.assertEqual(proc.stdout.strip(), str(expected))
+
+    def test_bad_file(self):
+        # Thresholds that the module cannot use are skipped.
+        module = _crcmodule._crcfun
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'thresholds.json')
+            entry = {
+                'extension': {
+                    '8': {'slice8': 100, 'slice16': None, 'fold': 300},
+                    '16': {'slice8': 'x', 'slice16': 0, 'fold': 0},
+                    '24': {'slice8': -5, 'slice16': 0, 'fold': 0},
+                    '32': {'slice8': 0, 'slice16': 0},
+                    '12': {'slice8': 0, 'slice16': 0, 'fold': 0},
+                    'x': [],
+                },
+                'numpy': 0,
+            }
+            with open(path, 'w') as f:
+                json.dump({'version': 1, 'hosts': {_tuning._hostKey(): entry}},
+                          f)
+            self.assertTrue(_tuning.loadThresholds(module, path))
+            if hasattr(module, '_setThresholds'):
+                self.assertEqual(module._setThresholds(8),
+                                 (100, sys.maxsize, 300))
+                for width in (16, 24, 32):
+                    self.assertEqual(module._setThresholds(width),
+                                     self.saved[width])
+            if hasattr(module, '_numpyThreshold'):
+                self.assertEqual(module._numpyThreshold, self.savedNumpy)
+                for value in (15, True, 1.5, '4096'):
+                    entry['numpy'] = value
+                    _tuning._applyThresholds(module, entry)
+                    self.assertEqual(module._numpyThreshold, self.savedNumpy)
+            data = bytes(range(256))*4
+            self.assertEqual(mkCrcFun(g32, 0, True, 0xFFFFFFFF)(data),
+                             CompareReferenceCrcTest.reference_crc32(data))
+
+
+class BenchTest(unittest.TestCase):
+    """Verify the benchmark suite on a small run."""
+
+    def test_run(self):
+        results = list(bench.run(['crc-32', 'crc-32c'], sizes=[1, 100],
+                                 minTime=0.0001, repeat=1))
+        engines = [engine['name'] for engine in backends()]
+        expected = 2*2*2*len(engines)
+        if 'sse42' in engines:
+            expected -= 2*2
+        self.assertEqual(len(results), expected)
+        for result in results:
+            self.assertEqual(result['engine'], result['backend'])
+            self.assertGreater(result['latency'], 0)
+            self.assertAlmostEqual(result['throughput'],
+                                   result['size']/result['latency']/1e6)
+
+        # Sizes expected to take too long are skipped.
+        results = list(bench.run(['crc-16'], ['python'], [1000, 1 << 30],
+                                 ['mkCrcFun'], 0.0001, 1, 0.5))
+        self.assertEqual([result['size'] for result in results], [1000])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'bench.json')
+            argv = ['-a', 'crc-8', '-b', 'python', '-s', '1,1K',
+                    '--min-time', '0.0001', '--repeat', '1', '-o', path]
+            with redirect_stdout(io.StringIO()) as out:
+                self.assertEqual(bench.main(argv), 0)
+            self.assertIn('crc-8', out.getvalue())
+            with open(path) as f:
+                data = json.load(f)
+            self.assertEqual([(r['api'], r['size']) for r in data['results']],
+                             [('update', 1), ('update', 1024),
+                              ('mkCrcFun', 1), ('mkCrcFun', 1024)])
+
+            # A run compared with itself has no changes, and one that got
+            # slower makes the exit status 1.
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(bench.main(['--compare', path, path]), 0)
+            slower = os.path.join(tmpdir, 'slower.json')
+            data['results'][0]['throughput'] /= 2
+            with open(slower, 'w') as f:
+                json.dump(data, f)
+            self.assertEqual(bench.compare(data['results'],
+                                           data['results']), [])
+            with redirect_stdout(io.StringIO()) as out:
+                self.assertEqual(bench.main(['--compare', path, slower]), 1)
+            self.assertIn('0.50x', out.getvalue())
+
+
+class ImportTest(unittest.TestCase):
+    """Verify that importing crcmod stays cheap.  The imports are timed with
+    python -X importtime in a fresh interpreter."""
+
+    # Modules that importing crcmod and crcmod.predefined may load.
+    allowed = {'crcmod', 'crcmod.crcmod', 'crcmod.predefined'}
+
+    # Generous budget in microseconds for the import of crcmod, including the
+    # compilation of the modules when no byte code is cached.
+    budget = 50000
+
+    def import_times(self, stmt):
+        # Returns {module: (self time, cumulative time)} for the modules
+        # imported by stmt.
+        pkgdir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([pkgdir, env.get('PYTHONPATH', '')])
+        proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', stmt],
+                              env=env, stderr=subprocess.PIPE, check=True,
+                              universal_newlines=True)
+        times = {}
+        for line in proc.stderr.splitlines():
+            fields = line.partition('import time:')[2].split('|')
+            if len(fields) == 3 and fields[0].strip().isdigit():
+                times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+        return times
+
+    def test_import(self):
+        baseline = self.import_times('pass')
+        times = self.import_times('import crcmod.predefined')
+        self.assertEqual(set(times) - set(baseline) - self.allowed, set())
+        self.assertLess(times['crcmod'][1], self.budget)
+
+    def test_first_use(self):
+        times = self.import_times('import crcmod.predefined; '
+                                  'crcmod.predefined.mkCrcFun("crc-32")')
+        self.assertIn(_crcmodule._crcfun.__name__, times)
+
+
 def runtests():
     print("Using extension:", _usingExtension)
     print()
@@ -0,0 +1,61 @@
+#-----------------------------------------------------------------------------
+# Measure the throughput of the Python implementation of the CRC functions.
+#
+# The Python implementation (_crcfunpy) processes one byte per loop iteration
+# by default, or a word of 4 or 8 bytes with the slicing-by-4/8 kernels.  This
+# script times each kernel on the interpreter running it, so run it under both
+# CPython and PyPy to compare them.  The extension module is not used.  Run it
+# with crcmod installed:
+#
+#     python bench_python.py [message-size]
+#     pypy3 bench_python.py [message-size]
+
+import sys
+import platform
+import timeit
+
+import crcmod
+import crcmod.predefined
+import crcmod._crcfunpy as crcfunpy
+
+crcmodule = sys.modules['crcmod.crcmod']
+
+names = ['crc-16', 'crc-24', 'crc-32', 'crc-32c', 'crc-64']
+
+
+def python_fun(name, wordSize):
+    crc = crcmod.predefined.PredefinedCrc(name)
+    saved = crcfunpy._wordSize
+    crcfunpy._wordSize = wordSize
+    try:
+        return crcfunpy.CrcFun(crc.digest_size*8, crc.reverse, crc.table,
+                               crc.initCrc, crc.xorOut)
+    finally:
+        crcfunpy._wordSize = saved
+
+
+def throughput(fun, msg, number=5):
+    fun(msg)
+    best = min(timeit.repeat(lambda: fun(msg), number=number, repeat=5))
+    return len(msg)*number/best/1e6
+
+
+def main(size=1 << 18):
+    msg = bytes((i*151 + 17) & 0xFF for i in range(size))
+    print('%s %s, message size %d bytes, default word size %d' % (
+            platform.python_implementation(), platform.python_version(),
+            size, crcfunpy._wordSize))
+    print('%-10s  %14s  %14s  %14s' % ('name', 'bytewise', 'slicing-by-4',
+                                      'slicing-by-8'))
+    for name in names:
+        funs = [python_fun(name, wordSize) for wordSize in (0, 4, 8)]
+        expected = funs[0](msg)
+        results = []
+        for fun in funs:
+            assert fun(msg) == expected
+            results.append(throughput(fun, msg))
+        print('%-10s' % name + ''.join('  %9.1f MB/s' % r for r in results))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,61 @@
+#-----------------------------------------------------------------------------
+# Measure the per-call overhead of CRC calculations on small messages.
+#
+# For tiny inputs the cost of a call is dominated by argument handling rather
+# than by the CRC itself.  This script times the function returned by
+# mkCrcFun and the Crc.update method on 16-byte messages, and compares them
+# with calling the low level function of the extension module directly with a
+# packed table, which is what crcmod did before the CrcFun objects.  Run it
+# with crcmod installed:
+#
+#     python bench_small.py [message-size]
+
+import sys
+import struct
+import timeit
+
+import crcmod
+import crcmod.predefined
+
+crcmodule = sys.modules['crcmod.crcmod']
+
+names = ['crc-16', 'crc-32', 'crc-32c', 'crc-64']
+
+
+def legacy_fun(name):
+    # Rebuild a function the way crcmod did with the table packed in a
+    # string that is parsed on every call.
+    crc = crcmod.predefined.PredefinedCrc(name)
+    width = crc.digest_size*8
+    fun = getattr(crcmodule._crcfun, '_crc%d%s' % (width, 'r' if crc.reverse else ''))
+    table = struct.pack('256%s' % crcmodule._typeCode(width), *crc.table)
+    xorOut = crc.xorOut
+    def crcfun(data, crc=crc.initCrc, table=table, fun=fun):
+        return xorOut ^ fun(data, xorOut ^ crc, table)
+    return crcfun
+
+
+def time_call(stmt, env, number=200000):
+    best = min(timeit.repeat(stmt, globals=env, number=number, repeat=5))
+    return 1e9*best/number
+
+
+def main(size=16):
+    msg = bytes(range(size))
+    print('Using extension: %s, message size %d bytes' % (crcmodule._usingExtension, size))
+    print('%-10s  %12s  %12s  %12s' % ('name', 'mkCrcFun', 'Crc.update', 'legacy'))
+    for name in names:
+        env = {
+            'crcfun': crcmod.predefined.mkPredefinedCrcFun(name),
+            'crc': crcmod.predefined.PredefinedCrc(name),
+            'msg': msg,
+        }
+        results = [time_call('crcfun(msg)', env), time_call('crc.update(msg)', env)]
+        if crcmodule._usingExtension:
+            env['legacy'] = legacy_fun(name)
+            results.append(time_call('legacy(msg)', env))
+        print('%-10s' % name + ''.join('  %9.0f ns' % t for t in results))
+
+
+if __name__ == '__main__':
+    main(*[int(a) for a in sys.argv[1:]])
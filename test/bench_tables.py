@@ -0,0 +1,97 @@
+#-----------------------------------------------------------------------------
+# Measure the time taken to build the CRC tables.
+#
+# crcmod used to compute each of the 256 table entries with the bit by bit
+# loop in _bytecrc.  The tables are now built from the entries for the powers
+# of two using the linearity of the CRC, and the slicing tables used by the
+# extension module are expanded the same way (with NumPy if it is imported).
+# This script compares both methods for a few polynomials.  Run it with
+# crcmod installed:
+#
+#     python bench_tables.py [--numpy]
+
+import sys
+import struct
+import timeit
+
+if '--numpy' in sys.argv[1:]:
+    import numpy
+
+import crcmod
+
+crcmodule = sys.modules['crcmod.crcmod']
+
+polys = [
+    ('crc-8', 0x107, 8),
+    ('crc-16', 0x18005, 16),
+    ('crc-32', 0x104C11DB7, 32),
+    ('crc-64', 0x1000000000000001B, 64),
+]
+
+
+def bytecrc_table(poly, n, rev):
+    # The table built one bit at a time, as crcmod did before.
+    mask = (1<<n) - 1
+    if rev:
+        poly = crcmodule._bitrev(poly & mask, n)
+        return [crcmodule._bytecrc_r(i, poly, n) for i in range(256)]
+    poly = poly & mask
+    return [crcmodule._bytecrc(i<<(n-8), poly, n) for i in range(256)]
+
+
+def bytecrc_slice_table(poly, n, rev, slices):
+    # Each slicing table entry computed from the previous table entry by
+    # entry, then packed with struct.
+    table = bytecrc_table(poly, n, rev)
+    mask = (1<<n) - 1
+    shift = n - 8
+    result = list(table)
+    prev = table
+    for k in range(1, slices):
+        if rev:
+            prev = [(x >> 8) ^ table[x & 0xFF] for x in prev]
+        else:
+            prev = [((x << 8) & mask) ^ table[x >> shift] for x in prev]
+        result.extend(prev)
+    return struct.pack('%d%s' % (len(result), crcmodule._typeCode(n)),
+                       *result)
+
+
+def linear_slice_table(poly, n, rev, slices):
+    if rev:
+        table = crcmodule._mkTable_r(poly, n)
+    else:
+        table = crcmodule._mkTable(poly, n)
+    return crcmodule._packSliceTable(table, n, rev, slices)
+
+
+def time_call(fun, *args, number=200):
+    best = min(timeit.repeat(lambda: fun(*args), number=number, repeat=5))
+    return 1e6*best/number
+
+
+def main():
+    slices = crcmodule._sliceCount
+    print('NumPy: %s' % ('numpy' in sys.modules))
+    print('%-8s %-4s  %12s %12s  %12s %12s' % ('', '',
+            'table (us)', '', '%dx256 (us)' % slices, ''))
+    print('%-8s %-4s  %12s %12s  %12s %12s' % ('name', 'rev',
+            '_bytecrc', 'linear', '_bytecrc', 'linear'))
+    for (name, poly, n) in polys:
+        for rev in (False, True):
+            if rev:
+                mk = crcmodule._mkTable_r
+            else:
+                mk = crcmodule._mkTable
+            assert mk(poly, n) == bytecrc_table(poly, n, rev)
+            assert (linear_slice_table(poly, n, rev, slices) ==
+                    bytecrc_slice_table(poly, n, rev, slices))
+            print('%-8s %-4s  %12.1f %12.1f  %12.1f %12.1f' % (name, rev,
+                    time_call(bytecrc_table, poly, n, rev),
+                    time_call(mk, poly, n),
+                    time_call(bytecrc_slice_table, poly, n, rev, slices),
+                    time_call(linear_slice_table, poly, n, rev, slices)))
+
+
+if __name__ == '__main__':
+    main()
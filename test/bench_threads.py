@@ -0,0 +1,86 @@
+#-----------------------------------------------------------------------------
+# Measure how CRC calculations scale across threads.
+#
+# The extension module releases the GIL while computing the CRC of large
+# buffers, so checksumming independent chunks from a thread pool should scale
+# with the number of processor cores.  Run this script with crcmod installed:
+#
+#     python bench_threads.py [crc-name [chunk-size]]
+#
+# For each number of worker threads, the throughput, the speedup compared to
+# a single thread and the parallel efficiency (speedup / threads) are shown,
+# both for independent chunks and for Crc.updateParallel over one buffer.
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import crcmod.predefined
+
+
+def measure(crcfun, chunks, workers, repeat=3):
+    best = None
+    with ThreadPoolExecutor(workers) as executor:
+        for i in range(repeat):
+            start = time.perf_counter()
+            list(executor.map(crcfun, chunks))
+            elapsed = time.perf_counter() - start
+            if best is None or elapsed < best:
+                best = elapsed
+    return best
+
+
+def measure_parallel(crc, data, workers, repeat=3):
+    best = None
+    for i in range(repeat):
+        c = crc.new()
+        start = time.perf_counter()
+        c.updateParallel(data, workers)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def report(title, total, ncpu, timer):
+    print(title)
+    print('%8s  %10s  %8s  %10s' % ('threads', 'MB/s', 'speedup', 'efficiency'))
+
+    workers = 1
+    base = None
+    while True:
+        elapsed = timer(workers)
+        if base is None:
+            base = elapsed
+        speedup = base / elapsed
+        print('%8d  %10.0f  %8.2f  %9.0f%%' % (workers, total/elapsed/1e6,
+                speedup, 100.0*speedup/workers))
+        if workers >= ncpu:
+            break
+        workers = min(2*workers, ncpu)
+
+
+def main(crc_name='crc-32c', chunk_size=4*1024*1024):
+    ncpu = os.cpu_count() or 1
+    crcfun = crcmod.predefined.mkPredefinedCrcFun(crc_name)
+    # Enough chunks to keep every core busy for a while.
+    chunks = [os.urandom(chunk_size)] * (8*ncpu)
+    total = chunk_size * len(chunks)
+
+    print('%s, %d chunks of %d bytes, %d CPUs' % (crc_name, len(chunks),
+            chunk_size, ncpu))
+    print()
+    report('Independent chunks', total, ncpu,
+           lambda workers: measure(crcfun, chunks, workers))
+    print()
+    data = b''.join(chunks)
+    crc = crcmod.predefined.PredefinedCrc(crc_name)
+    report('Crc.updateParallel', total, ncpu,
+           lambda workers: measure_parallel(crc, data, workers))
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if len(args) > 1:
+        args[1] = int(args[1])
+    main(*args)